@@ -16,6 +16,29 @@ class WoodworkingWorkbench (Workbench):
 	ToolTip = QT_TRANSLATE_NOOP("Workbench", "Workbench for woodworking.")
 	Icon = os.path.join(iconPath, "Woodworking.png")
 
+	toolbars = [
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - default"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - copy"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - move"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - resize"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - special"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - face"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - between"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - construction"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - dowels and screws"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - fixture"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - joinery"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - drilling holes"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - project manage"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - code and debug"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - dimensions"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - router"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - decorations"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - advanced"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - parameterization"),
+		QT_TRANSLATE_NOOP("Workbench", "Woodworking - preview")
+	]
+
 	def Initialize(self):
 
 		import FreeCAD, FreeCADGui
@@ -23,87 +46,70 @@ class WoodworkingWorkbench (Workbench):
 		def QT_TRANSLATE_NOOP(context, text):
 			return text
 
+		import time
+		timing = []
+		start = time.perf_counter()
+
 		FreeCADGui.addLanguagePath(self.translationsPath)
+		timing.append([ "translations", time.perf_counter() ])
+
+		# commands from manifest, the tools are loaded at first click
+		import loadTools
+		timing.append([ "commands", time.perf_counter() ])
+		
+		import loadToolbar
+		import loadMenu
+		timing.append([ "toolbar and menu", time.perf_counter() ])
 		
-		# uncomment those lines below if you want to add icon from other workbenches
+		# load only GUI modules with commands used at toolbars, other modules, for example 
+		# PartGui or SketcherGui, are loaded by FreeCAD at first use or by the modules below
+		# uncomment DraftTools if you want to add icon from Draft workbench, 
 		# however the DraftTools will slow down the FreeCAD loading
 		# for woodworking purposes there will be new tools, so do not cry ;-)
 		
-		import PartGui, PartDesignGui
-		import SketcherGui, SpreadsheetGui
-		#import DraftTools
+		guiModules = { 
+			"PartDesign_": "PartDesignGui", 
+			"Spreadsheet_": "SpreadsheetGui"
+			#"Draft_": "DraftTools"
+		}
+		
+		items = []
+		for t in self.toolbars:
+			items += loadToolbar.getItems(t)
+		
+		for prefix in guiModules.keys():
+			for item in items:
+				if item.startswith(prefix):
+					__import__(guiModules[prefix])
+					break
 
-		import loadToolbar
-		import loadMenu
+		timing.append([ "GUI modules", time.perf_counter() ])
 
 		# toolbar
 		# ################################################################################################
 		
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - default"), 
-			loadToolbar.getItems("Woodworking - default"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - copy"), 
-			loadToolbar.getItems("Woodworking - copy"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - move"), 
-			loadToolbar.getItems("Woodworking - move"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - resize"), 
-			loadToolbar.getItems("Woodworking - resize"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - special"), 
-			loadToolbar.getItems("Woodworking - special"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - face"), 
-			loadToolbar.getItems("Woodworking - face"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - between"), 
-			loadToolbar.getItems("Woodworking - between"))
+		for t in self.toolbars:
+			self.appendToolbar(t, loadToolbar.getItems(t))
 
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - construction"), 
-			loadToolbar.getItems("Woodworking - construction"))
+		timing.append([ "toolbars", time.perf_counter() ])
 
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - dowels and screws"), 
-			loadToolbar.getItems("Woodworking - dowels and screws"))
-		
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - fixture"), 
-			loadToolbar.getItems("Woodworking - fixture"))
-		
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - joinery"), 
-			loadToolbar.getItems("Woodworking - joinery"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - drilling holes"), 
-			loadToolbar.getItems("Woodworking - drilling holes"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - project manage"), 
-			loadToolbar.getItems("Woodworking - project manage"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - code and debug"), 
-			loadToolbar.getItems("Woodworking - code and debug"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - dimensions"), 
-			loadToolbar.getItems("Woodworking - dimensions"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - router"), 
-			loadToolbar.getItems("Woodworking - router"))
-
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - decorations"), 
-			loadToolbar.getItems("Woodworking - decorations"))
-		
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - advanced"), 
-			loadToolbar.getItems("Woodworking - advanced"))
-		
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - parameterization"), 
-			loadToolbar.getItems("Woodworking - parameterization"))
-		
-		self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Woodworking - preview"), 
-			loadToolbar.getItems("Woodworking - preview"))
-		
 		# menu
 		# ################################################################################################
 		
 		self.appendMenu(QT_TRANSLATE_NOOP("Workbench", "Woodworking"), loadMenu.getItems())
+		timing.append([ "menu", time.perf_counter() ])
 		
+		# startup timing report, see Report view with log messages enabled
+		report = "Woodworking workbench activation:"
+		last = start
+		for [ phase, t ] in timing:
+			report += " " + phase + " " + str(int(round((t - last) * 1000))) + " ms,"
+			last = t
+		
+		report += " total " + str(int(round((last - start) * 1000))) + " ms\n"
+		FreeCAD.Console.PrintLog(report)
+
+
 	def Activated(self):
 		# not needed now, maybe in the future
 		return
@@ -48,6 +48,17 @@ def QT_TRANSLATE_NOOP(context, text): #
 
 gRoundPrecision = 2      # should be set according to the user FreeCAD GUI settings
 gSearchDepth = 200       # recursive search depth
+gSubIndex = dict()       # faces and edges index for each object shape, see getSubIndex
+gExtents = dict()        # occupied space for each object shape, see getModelExtents
+gSpatialIndex = dict()   # spatial indexes for objects global BoundBox, see getSpatialIndex
+gSpatialSize = 100       # spatial index grid cell size
+gCurves = dict()         # sampled points for each curve shape, see getCurve
+gBatch = { "level": 0, "label": "", "skipped": 0 } # batch recompute state, see batchBegin
+gTransforms = dict()     # containers transforms for each document object, see getContainersTransform
+gReferences = dict()     # base object for each document object, see getReference
+gCacheObserver = ""      # document observer to update gTransforms and gReferences, see CacheObserver
+gTemplates = dict()      # hidden documents loaded from files with view colors, see getTemplate
+gTemplatesSize = 10      # max number of hidden documents in gTemplates
 
 # end globals (for API generator)
 
@@ -183,6 +194,289 @@ def normalizeBoundBox(iBoundBox):
 	return b
 
 
+# ###################################################################################################################
+def getShapeKey(iObj, iShape=""):
+	'''
+	Description:
+	
+		Returns keys to cache values calculated from the object shape. The shape key is changed 
+		if the shape has been changed, for example after recompute or Placement change.
+	
+	Args:
+	
+		iObj: object with the shape
+		iShape: optional, shape of the object if you already have it
+
+	Usage:
+	
+		[ name, shapeKey ] = MagicPanels.getShapeKey(o)
+		
+		if name not in cache or cache[name]["key"] != shapeKey:
+			cache[name] = { "key": shapeKey, "value": calculate(o) }
+
+	Result:
+	
+		return array with unique object name and shape key
+
+	'''
+
+	if iShape == "":
+		iShape = iObj.Shape
+
+	try:
+		name = iObj.Document.Name + ":" + iObj.Name
+	except:
+		name = str(iObj.Name)
+	
+	try:
+		shapeKey = str(iObj.Placement) + ":" + str(iShape.hashCode())
+	except:
+		shapeKey = str(iShape.hashCode())
+	
+	return [ name, shapeKey ]
+
+
+# ###################################################################################################################
+def getSubIndex(iObj, iSubType, iKeyType):
+	'''
+	Description:
+	
+		Returns index for faces or edges of the object shape. The index is created only once for the 
+		shape and it is created again if the shape has been changed, for example after recompute or 
+		Placement change. So, you can search for the face or edge by key many times without looping 
+		over all faces or edges and without converting all BoundBox to string each time.
+	
+	Args:
+	
+		iObj: object with the shape
+		iSubType: type of sub-object, "face" or "edge"
+		iKeyType: type of the key:
+			* "BoundBox" - string of BoundBox, the same as str(f.BoundBox)
+			* "normalized" - normalized BoundBox, the same as normalizeBoundBox(f.BoundBox)
+			* "CenterOfMass" - only for edges, key is [ plane, a, b ] where plane is from getEdgePlane 
+				and a, b are rounded CenterOfMass values for not changed axes, for example for plane "X" 
+				key is [ "X", round(y), round(z) ]
+
+	Usage:
+	
+		index = MagicPanels.getSubIndex(o, "face", "normalized")
+		key = MagicPanels.normalizeBoundBox(face.BoundBox)
+		
+		if key in index:
+			faceIndex = index[key]
+
+	Result:
+	
+		return dict with key and index starting from 0 (for iObj.Shape.Faces[index]), 
+		if there are many sub-objects for the key the first one is in the index
+
+	'''
+
+	shape = iObj.Shape
+	[ name, shapeKey ] = getShapeKey(iObj, shape)
+	
+	if name not in gSubIndex or gSubIndex[name]["key"] != shapeKey:
+		gSubIndex[name] = { "key": shapeKey }
+	
+	db = gSubIndex[name]
+	dbKey = iSubType + ":" + iKeyType
+
+	if dbKey in db:
+		return db[dbKey]
+
+	if iSubType == "face":
+		subs = shape.Faces
+	else:
+		subs = shape.Edges
+
+	index = dict()
+	
+	for i, sub in enumerate(subs):
+		
+		if iKeyType == "BoundBox":
+			key = str(sub.BoundBox)
+		
+		if iKeyType == "normalized":
+			key = normalizeBoundBox(sub.BoundBox)
+
+		if iKeyType == "CenterOfMass":
+			
+			c = sub.CenterOfMass
+			p = getEdgePlane(iObj, sub)
+			
+			if p == "X":
+				key = ( p, round(c.y, gRoundPrecision), round(c.z, gRoundPrecision) )
+			elif p == "Y":
+				key = ( p, round(c.x, gRoundPrecision), round(c.z, gRoundPrecision) )
+			elif p == "Z":
+				key = ( p, round(c.x, gRoundPrecision), round(c.y, gRoundPrecision) )
+			else:
+				continue
+
+		if key not in index:
+			index[key] = i
+
+	db[dbKey] = index
+	
+	return index
+
+
+# ###################################################################################################################
+'''
+# Recompute
+'''
+# ###################################################################################################################
+
+
+# ###################################################################################################################
+def recompute(iObjects=""):
+	'''
+	Description:
+	
+		Recompute the active document. Outside the batch, see batchBegin, this is always the
+		whole document recompute, the same as FreeCAD.ActiveDocument.recompute(). Inside the batch
+		the whole document recompute is skipped and it is done only once at batchEnd. If iObjects
+		are given, inside the batch only these objects and their dependencies are recomputed,
+		so the new objects Shape can be used at next step.
+	
+	Args:
+	
+		iObjects (optional): list of objects needed at next step, for example [ pad ]
+	
+	Usage:
+	
+		MagicPanels.recompute()
+		MagicPanels.recompute([ hole ])
+	
+	Result:
+	
+		Document or given objects are recomputed or the recompute is postponed.
+	
+	'''
+	
+	if gBatch["level"] == 0:
+		FreeCAD.ActiveDocument.recompute()
+		return
+	
+	gBatch["skipped"] = gBatch["skipped"] + 1
+	
+	if iObjects != "" and len(iObjects) > 0:
+		FreeCAD.ActiveDocument.recompute(iObjects)
+
+
+# ###################################################################################################################
+def batchBegin(iLabel="Woodworking"):
+	'''
+	Description:
+	
+		Begin batch of changes. All the changes are single undo transaction and the whole
+		document recompute is done only once at batchEnd. Batches can be nested, only the
+		most outer batch opens the transaction and recomputes the document.
+	
+	Args:
+	
+		iLabel (optional): string, undo transaction name, for example tool name
+	
+	Usage:
+	
+		MagicPanels.batchBegin("panelMove")
+		...
+		MagicPanels.batchEnd()
+	
+	Result:
+	
+		Batch is started.
+	
+	'''
+	
+	if gBatch["level"] == 0:
+		gBatch["label"] = iLabel
+		gBatch["skipped"] = 0
+		FreeCAD.ActiveDocument.openTransaction(iLabel)
+	
+	gBatch["level"] = gBatch["level"] + 1
+
+
+# ###################################################################################################################
+def batchEnd():
+	'''
+	Description:
+	
+		End batch of changes started by batchBegin. For the most outer batch the document is
+		recomputed once, FreeCAD recomputes only touched objects and objects depending on them,
+		and the undo transaction is committed.
+	
+	Args:
+	
+		no args
+	
+	Usage:
+	
+		MagicPanels.batchEnd()
+	
+	Result:
+	
+		Return number of the whole document recomputes avoided by the batch.
+	
+	'''
+	
+	if gBatch["level"] == 0:
+		return 0
+	
+	gBatch["level"] = gBatch["level"] - 1
+	
+	if gBatch["level"] > 0:
+		return 0
+	
+	doc = FreeCAD.ActiveDocument
+	
+	try:
+		doc.recompute()
+	finally:
+		doc.commitTransaction()
+	
+	avoided = max(gBatch["skipped"] - 1, 0)
+	FreeCAD.Console.PrintLog("Woodworking: " + str(gBatch["label"]) + " avoided " + str(avoided) + " recomputes\n")
+	
+	return avoided
+
+
+# ###################################################################################################################
+def batch(iLabel="Woodworking"):
+	'''
+	Description:
+	
+		Context manager for batchBegin and batchEnd, so the batch is ended also on error.
+	
+	Args:
+	
+		iLabel (optional): string, undo transaction name, for example tool name
+	
+	Usage:
+	
+		with MagicPanels.batch("magicKnife"):
+			for o in objects:
+				...
+	
+	Result:
+	
+		Batch context for with statement.
+	
+	'''
+	
+	import contextlib
+	
+	@contextlib.contextmanager
+	def context():
+		batchBegin(iLabel)
+		try:
+			yield
+		finally:
+			batchEnd()
+	
+	return context()
+
+
 # ###################################################################################################################
 '''
 # Copy
@@ -319,7 +613,7 @@ def showVertex(iVertices, iRadius=5, iColor="red"):
 		
 		vertices.append(s1)
 		
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 
 	return vertices
 
@@ -525,6 +819,129 @@ def setVertexPadding(iObj, iVertex, iPadding, iAxis):
 	return ""
 
 
+# ###################################################################################################################
+def getCurve(iCurve):
+	'''
+	Description:
+	
+		Returns sampled points of the curve with index for searching. The points are taken from 
+		.getPoints(1) function only once for the curve shape and they are taken again only if the 
+		curve shape has been changed. So, you can search the curve for many objects without 
+		sampling and scanning the whole curve each time.
+	
+	Args:
+	
+		iCurve: object with Shape, for example Wire, Sketch, Helix, or Edge shape
+
+	Usage:
+	
+		curve = MagicPanels.getCurve(Sketch)
+		points = curve["points"]
+
+	Result:
+	
+		Return dict with:
+		
+		"points": list of FreeCAD.Vector, the same as iCurve.Shape.getPoints(1)[0]
+		"lengths": list of curve length from the first point to each point
+		"index": dict with rounded ( x, y, z ) as key and first point index as value
+
+	'''
+
+	if hasattr(iCurve, "Shape"):
+		shape = iCurve.Shape
+		[ name, shapeKey ] = getShapeKey(iCurve, shape)
+	else:
+		shape = iCurve
+		name = "shape:" + str(shape.hashCode())
+		shapeKey = name
+
+	if name in gCurves and gCurves[name]["key"] == shapeKey:
+		return gCurves[name]
+
+	points = shape.getPoints(1)[0]
+	
+	index = dict()
+	for i, v in enumerate(points):
+		key = ( round(v.x, gRoundPrecision), round(v.y, gRoundPrecision), round(v.z, gRoundPrecision) )
+		if key not in index:
+			index[key] = i
+
+	lengths = [ 0 ]
+	
+	if len(points) > 1:
+		try:
+			import numpy
+			
+			a = numpy.array([ ( v.x, v.y, v.z ) for v in points ])
+			steps = numpy.sqrt((numpy.diff(a, axis=0) ** 2).sum(axis=1))
+			lengths += numpy.cumsum(steps).tolist()
+			
+		except ImportError:
+			
+			for i in range(1, len(points)):
+				lengths.append(lengths[i - 1] + points[i - 1].distanceToPoint(points[i]))
+
+	gCurves[name] = { "key": shapeKey, "points": points, "lengths": lengths, "index": index }
+	
+	return gCurves[name]
+
+
+# ###################################################################################################################
+def getCurveIndexByDistance(iCurve, iIndex, iDistance, iScope=""):
+	'''
+	Description:
+	
+		Returns the last curve point index for which the straight distance from the point at iIndex 
+		is not greater than iDistance. The search starts from the point at the same curve length, 
+		found by bisection, because the straight distance is never greater than the curve length. 
+		So, only a few points are checked, not all points from iIndex.
+	
+	Args:
+	
+		iCurve: object with Shape, for example Wire, Sketch, Helix, or Edge shape
+		iIndex: start point index
+		iDistance: float, straight distance from the start point, for example edge length
+		iScope (optional): max number of points to check after iIndex, by default all
+
+	Usage:
+	
+		index = MagicPanels.getCurveIndexByDistance(Sketch, anchorIndex, edge.Length)
+
+	Result:
+	
+		Return int value index of curve point or -1 if there is no such point after iIndex.
+
+	'''
+
+	import bisect
+
+	curve = getCurve(iCurve)
+	points = curve["points"]
+	lengths = curve["lengths"]
+	
+	last = len(points) - 1
+	if iScope != "":
+		last = min(last, iIndex + iScope)
+
+	if iIndex >= last:
+		return -1
+
+	start = points[iIndex]
+	
+	# point at the same curve length, the straight distance for this point is not greater
+	index = bisect.bisect_right(lengths, lengths[iIndex] + iDistance) - 1
+	index = min(max(index, iIndex), last)
+
+	while index < last and start.distanceToPoint(points[index + 1]) <= iDistance:
+		index = index + 1
+
+	if index == iIndex:
+		return -1
+
+	return index
+
+
 # ###################################################################################################################
 def getOnCurve(iPoint, iCurve):
 	'''
@@ -534,13 +951,14 @@ def getOnCurve(iPoint, iCurve):
 		FreeCAD has not rounded float values at Vectors, so if you call 
 		iCurve.Shape.getPoints(1)[0].index(vector_of_iPoint) this may not find the index 
 		of vector_of_iPoint at the iCurve not because it is not there, but because there is 
-		small not rounded difference, for example 0.0000006. So, this function scan the iCurve vectors 
-		and compare rounded values to return the index.
+		small not rounded difference, for example 0.0000006. So, this function compare rounded values 
+		to return the index. The curve points are taken from getCurve, so the rounded values are 
+		searched by hash, not by scanning all the curve points.
 	
 	Args:
 	
 		iPoint: Part.Vertex object or FreeCAD.Vector or array of floats like [ x, y, z ]
-		iCurve: object that has .getPoints() function, for example Wire, Sketch, Helix, Edge
+		iCurve: object with Shape, for example Wire, Sketch, Helix, or Edge shape
 
 	Usage:
 	
@@ -552,8 +970,6 @@ def getOnCurve(iPoint, iCurve):
 
 	'''
 
-	curvePoints = iCurve.Shape.getPoints(1)[0]
-	
 	skip = 0
 	if skip == 0:
 		try:
@@ -564,7 +980,7 @@ def getOnCurve(iPoint, iCurve):
 
 	if skip == 0:
 		try:
-			targetVector = FreeCAD.Vector(iPoint.x, iPoint.x, iPoint.x)
+			targetVector = FreeCAD.Vector(iPoint.x, iPoint.y, iPoint.z)
 			skip = 1
 		except:
 			skip = 0
@@ -576,16 +992,15 @@ def getOnCurve(iPoint, iCurve):
 		except:
 			skip = 0
 
-	index = 0
-	for v in curvePoints:
-		if (
-			equal(v.x, targetVector.x) and 
-			equal(v.y, targetVector.y) and 
-			equal(v.z, targetVector.z) 
-			):
-			return index
-		
-		index = index + 1
+	curve = getCurve(iCurve)
+	key = ( 
+		round(targetVector.x, gRoundPrecision), 
+		round(targetVector.y, gRoundPrecision), 
+		round(targetVector.z, gRoundPrecision) 
+	)
+	
+	if key in curve["index"]:
+		return curve["index"][key]
 	
 	return -1
 
@@ -695,12 +1110,11 @@ def getEdgeIndex(iObj, iEdge):
 
 	'''
 
-	index = 1
-	for e in iObj.Shape.Edges:
-		if str(e.BoundBox) == str(iEdge.BoundBox):
-			return index
-
-		index = index + 1
+	index = getSubIndex(iObj, "edge", "BoundBox")
+	key = str(iEdge.BoundBox)
+	
+	if key in index:
+		return index[key] + 1
 	
 	return -1
 
@@ -727,13 +1141,11 @@ def getEdgeIndexByKey(iObj, iBoundBox):
 
 	'''
 
-	index = 1
-	for e in iObj.Shape.Edges:
-		
-		if normalizeBoundBox(e.BoundBox) == normalizeBoundBox(iBoundBox):
-			return index
-
-		index = index + 1
+	index = getSubIndex(iObj, "edge", "normalized")
+	key = normalizeBoundBox(iBoundBox)
+	
+	if key in index:
+		return index[key] + 1
 	
 	return -1
 
@@ -798,7 +1210,7 @@ def getEdgePlane(iObj, iEdge, iType="auto"):
 
 			wire.Placement.Rotation = ref.Rotation
 			wire.Placement.Rotation.Angle = - wire.Placement.Rotation.Angle
-			FreeCAD.ActiveDocument.recompute()
+			recompute([ wire ])
 
 			[ v1, v2 ] = getEdgeVertices(wire.Shape)
 		
@@ -821,7 +1233,7 @@ def getEdgePlane(iObj, iEdge, iType="auto"):
 
 	if iType == "auto" and rotated == True:
 		FreeCAD.ActiveDocument.removeObject(wire.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 
 	return plane
 
@@ -901,66 +1313,47 @@ def getSubByKey(iObj, iKey, iType, iSubType):
 		key = iKey[0]
 		plane = iKey[1]
 		
-		edge = ""
-		index = 1
-		name = "Edge"
-		
 		if iSubType == "edge":
 			
-			for e in iObj.Shape.Edges:
-				
-				p = getEdgePlane(iObj, e)
-				
-				if p == plane:
-					if plane == "X":
-						if equal(e.CenterOfMass.y, key.y) and equal(e.CenterOfMass.z, key.z):
-							name += str(index)
-							return [ e, name, index ]
-
-					if plane == "Y":
-						if equal(e.CenterOfMass.x, key.x) and equal(e.CenterOfMass.z, key.z):
-							name += str(index)
-							return [ e, name, index ]
-							
-					if plane == "Z":
-						if equal(e.CenterOfMass.x, key.x) and equal(e.CenterOfMass.y, key.y):
-							name += str(index)
-							return [ e, name, index ]
-				
-				index = index + 1
+			if plane == "X":
+				k = ( plane, round(key.y, gRoundPrecision), round(key.z, gRoundPrecision) )
+			elif plane == "Y":
+				k = ( plane, round(key.x, gRoundPrecision), round(key.z, gRoundPrecision) )
+			elif plane == "Z":
+				k = ( plane, round(key.x, gRoundPrecision), round(key.y, gRoundPrecision) )
+			else:
+				return [ "", "", "" ]
+			
+			index = getSubIndex(iObj, "edge", "CenterOfMass")
+			
+			if k in index:
+				idx = index[k]
+				return [ iObj.Shape.Edges[idx], "Edge" + str(idx + 1), idx + 1 ]
 
 		# not needed now
 		if iSubType == "face":
 			
-			search = iObj.Shape.Faces
 			return [ "not supported", "not supported", "not supported" ]
 		
 	if iType == "BoundBox":
 		
-		key = iKey[0]
-		index = 1
+		key = normalizeBoundBox(iKey[0])
 		
 		if iSubType == "edge":
 			
-			for e in iObj.Shape.Edges:
+			index = getSubIndex(iObj, "edge", "normalized")
 			
-				if normalizeBoundBox(e.BoundBox) == normalizeBoundBox(key):
-					edgeName = "Edge"+str(index)
-					idx = index - 1
-					return [ e, edgeName, idx ]
-
-				index = index + 1
+			if key in index:
+				idx = index[key]
+				return [ iObj.Shape.Edges[idx], "Edge" + str(idx + 1), idx ]
 
 		if iSubType == "face":
 			
-			for f in iObj.Shape.Faces:
+			index = getSubIndex(iObj, "face", "normalized")
 			
-				if normalizeBoundBox(f.BoundBox) == normalizeBoundBox(key):
-					faceName = "Face"+str(index)
-					idx = index - 1
-					return [ f, faceName, idx ]
-
-				index = index + 1
+			if key in index:
+				idx = index[key]
+				return [ iObj.Shape.Faces[idx], "Face" + str(idx + 1), idx ]
 
 	return [ "", "", "" ]
 
@@ -1075,14 +1468,14 @@ def edgeRouter(iPad, iSub, iSketch, iLength, iLabel, iType):
 
 		iSketch.Visibility = False
 		iPad.Visibility = False
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ router ])
 		
 		try:
 			copyColors(iPad, router)
 		except:
 			skip = 1
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 		return router
 
@@ -1120,7 +1513,7 @@ def makePockets(iObjects, iLength):
 
 		[ part, body, sketch, pad ] = makePad(base, "panel2pad")
 		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 		base = pad
 
 	for s in sketches:
@@ -1153,14 +1546,14 @@ def makePockets(iObjects, iLength):
 
 		s.Visibility = False
 		base.Visibility = False
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ pocket ])
 		
 		try:
 			copyColors(base, pocket)
 		except:
 			skip = 1
 			
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 		
 		base = pocket
 
@@ -1194,12 +1587,11 @@ def getFaceIndex(iObj, iFace):
 
 	'''
 
-	index = 1
-	for f in iObj.Shape.Faces:
-		if str(f.BoundBox) == str(iFace.BoundBox):
-			return index
-
-		index = index + 1
+	index = getSubIndex(iObj, "face", "BoundBox")
+	key = str(iFace.BoundBox)
+	
+	if key in index:
+		return index[key] + 1
 	
 	return -1
 
@@ -1226,13 +1618,11 @@ def getFaceIndexByKey(iObj, iBoundBox):
 
 	'''
 
-	index = 1
-	for f in iObj.Shape.Faces:
-		
-		if normalizeBoundBox(f.BoundBox) == normalizeBoundBox(iBoundBox):
-			return index
-
-		index = index + 1
+	index = getSubIndex(iObj, "face", "normalized")
+	key = normalizeBoundBox(iBoundBox)
+	
+	if key in index:
+		return index[key] + 1
 	
 	return -1
 
@@ -1628,7 +2018,8 @@ def getReference(iObj="none"):
 	'''
 	Description:
 	
-		Gets reference to the selected or given object.
+		Gets reference to the selected or given object. The base object is searched only once 
+		for each object and stored in gReferences until the document is changed, see CacheObserver.
 	
 	Args:
 	
@@ -1656,6 +2047,57 @@ def getReference(iObj="none"):
 	else:
 		obj = iObj
 
+	# #####################################
+	# already resolved
+	# #####################################
+	
+	try:
+		db = gReferences[obj.Document.Name]
+		if obj.Name in db:
+			return db[obj.Name]
+	except:
+		skip = 1
+
+	ref = getReferenceBase(obj)
+	
+	try:
+		addCacheObserver()
+		
+		if obj.Document.Name not in gReferences:
+			gReferences[obj.Document.Name] = dict()
+		
+		gReferences[obj.Document.Name][obj.Name] = ref
+		
+	except:
+		skip = 1
+
+	return ref
+
+
+# ###################################################################################################################
+def getReferenceBase(iObj):
+	'''
+	Description:
+	
+		Search base object for iObj, used by getReference. The recursive dependency list OutListRecursive 
+		is taken only once and the base object is searched in this list.
+	
+	Args:
+	
+		iObj: object to search base object
+	
+	Usage:
+	
+		base = MagicPanels.getReferenceBase(obj)
+		
+	Result:
+	
+		base object or iObj if there is no base object
+
+	'''
+
+	obj = iObj
+
 	# #####################################
 	# object types 
 	# #####################################
@@ -1674,7 +2116,8 @@ def getReference(iObj="none"):
 
 	# try to unpack base object for other objects
 	try:
-		depth = len(obj.OutListRecursive)
+		outList = obj.OutListRecursive
+		depth = len(outList)
 		
 		if  depth == 0:
 			return obj
@@ -1688,7 +2131,7 @@ def getReference(iObj="none"):
 				else:
 					index = depth - 1 - i
 
-				base = obj.OutListRecursive[index]
+				base = outList[index]
 				
 				if (
 					base.isDerivedFrom("Part::Box") or 
@@ -1707,6 +2150,47 @@ def getReference(iObj="none"):
 	return -1
 
 
+# ###################################################################################################################
+def getReferences(iObjects="none"):
+	'''
+	Description:
+	
+		Gets references for all selected or given objects. Each object is resolved only once, 
+		even if it is given many times, and the already resolved objects are taken from gReferences.
+	
+	Args:
+	
+		iObjects (optional): list of objects to get references, by default all selected objects
+	
+	Usage:
+	
+		references = MagicPanels.getReferences()
+		references = MagicPanels.getReferences(objects)
+		
+	Result:
+	
+		list of base objects in the same order as iObjects
+
+	'''
+
+	if iObjects == "none":
+		iObjects = FreeCADGui.Selection.getSelection()
+
+	resolved = dict()
+	references = []
+	
+	for o in iObjects:
+		
+		key = ( o.Document.Name, o.Name )
+		
+		if key not in resolved:
+			resolved[key] = getReference(o)
+		
+		references.append(resolved[key])
+
+	return references
+
+
 # ###################################################################################################################
 '''
 # Sizes
@@ -1803,68 +2287,139 @@ def getSizes(iObj):
 
 
 # ###################################################################################################################
-def getSizesFromVertices(iObj):
+def getExtents(iObj):
 	'''
 	Description:
 	
-		Gets occupied space by the object from vertices.
+		Gets minimum and maximum vertex position along each axis for the object. For Cube objects 
+		the BoundBox is used because it is exactly the same as vertices range. For other objects all 
+		vertices are taken at once and reduced by NumPy, if available.
 	
 	Args:
 	
-		iObj: object
+		iObj: object with Shape
 	
 	Usage:
 	
-		[ sx, sy, sz ] = MagicPanels.getSizesFromVertices(obj)
+		[ minX, minY, minZ, maxX, maxY, maxZ ] = MagicPanels.getExtents(obj)
 
 	Result:
 	
-		Returns array with [ mX, mY, mZ ] where: 
-		mX - occupied space along X axis
-		mY - occupied space along Y axis
-		mZ - occupied space along Z axis
+		Returns array with [ minX, minY, minZ, maxX, maxY, maxZ ] for global vertices positions, 
+		or array with zeros if there are no vertices
 
 	'''
 
-	init = 0
+	shape = iObj.Shape
 	
-	minX = 0
-	minY = 0
-	minZ = 0
-
-	maxX = 0
-	maxY = 0
-	maxZ = 0
-
-	vs = getattr(iObj.Shape, "Vertex"+"es")
-
-	for v in vs:
+	if iObj.isDerivedFrom("Part::Box"):
+		b = shape.BoundBox
+		return [ b.XMin, b.YMin, b.ZMin, b.XMax, b.YMax, b.ZMax ]
+	
+	vs = touchTypo(shape)
+	
+	if len(vs) == 0:
+		return [ 0, 0, 0, 0, 0, 0 ]
+	
+	points = [ ( v.X, v.Y, v.Z ) for v in vs ]
+	
+	try:
+		import numpy
 		
-		[ x, y, z ] = [ v.X, v.Y, v.Z ]
+		points = numpy.array(points)
+		mins = points.min(axis=0)
+		maxs = points.max(axis=0)
 		
-		if init == 0:
-			[ minX, minY, minZ ] = [ x, y, z ]
-			[ maxX, maxY, maxZ ] = [ x, y, z ]
-			init = 1
+		return [ float(mins[0]), float(mins[1]), float(mins[2]), float(maxs[0]), float(maxs[1]), float(maxs[2]) ]
+	
+	except ImportError:
 		
-		if x > maxX:
-			maxX = x
+		[ xs, ys, zs ] = zip(*points)
 		
-		if y > maxY:
-			maxY = y
+		return [ min(xs), min(ys), min(zs), max(xs), max(ys), max(zs) ]
+
 
-		if z > maxZ:
-			maxZ = z
+# ###################################################################################################################
+def getModelExtents(iObjects):
+	'''
+	Description:
+	
+		Gets minimum and maximum vertex position along each axis for all given objects. The values 
+		for each object are cached and calculated again only if the object shape has been changed. 
+		So, you can call it for all objects in the document many times. Objects without Shape are skipped.
+	
+	Args:
+	
+		iObjects: array of objects, for example FreeCAD.ActiveDocument.Objects
+	
+	Usage:
+	
+		[ minX, minY, minZ, maxX, maxY, maxZ ] = MagicPanels.getModelExtents(objects)
 
-		if x < minX:
-			minX = x
+	Result:
+	
+		Returns array with [ minX, minY, minZ, maxX, maxY, maxZ ] for all objects, 
+		or array with zeros if there are no vertices
 
-		if y < minY:
-			minY = y
+	'''
 
-		if z < minZ:
-			minZ = z
+	extents = []
+	
+	for o in iObjects:
 		
+		try:
+			shape = o.Shape
+			[ name, shapeKey ] = getShapeKey(o, shape)
+			
+			if name not in gExtents or gExtents[name]["key"] != shapeKey:
+				
+				if len(touchTypo(shape)) == 0:
+					value = ""
+				else:
+					value = getExtents(o)
+				
+				gExtents[name] = { "key": shapeKey, "value": value }
+
+			if gExtents[name]["value"] != "":
+				extents.append(gExtents[name]["value"])
+
+		except:
+			skip = 1
+
+	if len(extents) == 0:
+		return [ 0, 0, 0, 0, 0, 0 ]
+	
+	[ minX, minY, minZ, maxX, maxY, maxZ ] = zip(*extents)
+	
+	return [ min(minX), min(minY), min(minZ), max(maxX), max(maxY), max(maxZ) ]
+
+
+# ###################################################################################################################
+def getSizesFromVertices(iObj):
+	'''
+	Description:
+	
+		Gets occupied space by the object from vertices.
+	
+	Args:
+	
+		iObj: object
+	
+	Usage:
+	
+		[ sx, sy, sz ] = MagicPanels.getSizesFromVertices(obj)
+
+	Result:
+	
+		Returns array with [ mX, mY, mZ ] where: 
+		mX - occupied space along X axis
+		mY - occupied space along Y axis
+		mZ - occupied space along Z axis
+
+	'''
+
+	[ minX, minY, minZ, maxX, maxY, maxZ ] = getExtents(iObj)
+
 	s1 = getVertexAxisCross(minX, maxX)
 	s2 = getVertexAxisCross(minY, maxY)
 	s3 = getVertexAxisCross(minZ, maxZ)
@@ -1972,7 +2527,7 @@ def showMeasure(iP1, iP2, iRef=""):
 	else:
 		m.Label = "Measure "
 	
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 	
 	return m
 
@@ -2949,75 +3504,121 @@ def getContainers(iObj):
 
 
 # ###################################################################################################################
-def getNestingLabel(iObj, iPrefix):
+class CacheObserver:
+	'''
+	Document observer to remove the containers transforms from gTransforms, see getContainersTransform, 
+	and base objects from gReferences, see getReference, if the document objects are changed.
+	'''
+	
+	transformProps = [ "Placement", "Group", "Base", "Tool", "ElementList", "LinkedObject", "ExpressionEngine" ]
+	skipReferenceProps = [ "Shape", "Placement", "Label", "Label2", "Visibility" ]
+	
+	def clear(self, iDoc):
+		try:
+			gTransforms.pop(iDoc.Name, None)
+			gReferences.pop(iDoc.Name, None)
+		except:
+			skip = 1
+	
+	def slotChangedObject(self, obj, prop):
+		try:
+			if prop in self.transformProps:
+				gTransforms.pop(obj.Document.Name, None)
+		
+			if prop not in self.skipReferenceProps:
+				gReferences.pop(obj.Document.Name, None)
+		except:
+			skip = 1
+	
+	def slotCreatedObject(self, obj):
+		self.clear(obj.Document)
+	
+	def slotDeletedObject(self, obj):
+		self.clear(obj.Document)
+	
+	def slotUndoDocument(self, doc):
+		self.clear(doc)
+	
+	def slotRedoDocument(self, doc):
+		self.clear(doc)
+	
+	def slotDeletedDocument(self, doc):
+		self.clear(doc)
+
+
+# ###################################################################################################################
+def addCacheObserver():
 	'''
 	Description:
 	
-		This function set label for nesting objects, containers, copied, to not repeat 
-		the prefix and not make the label too long. 
+		Add CacheObserver to FreeCAD only once, before anything is stored in gTransforms or gReferences.
 	
 	Args:
 	
-		iObj: object for the label check
-		iPrefix: string, preferred prefix for the label
+		no args
 
 	Usage:
 	
-		o.Label = MagicPanels.getNestingLabel(o, "Container")
+		MagicPanels.addCacheObserver()
 
 	Result:
 	
-		return string for the new label
+		The observer is added to FreeCAD if it was not added before.
 
 	'''
 
-	label = str(iObj.Label)
-
-	if label.find(", ") == -1:
-		newLabel = iPrefix + ", " + label + " "
-
-	else:
-		prefix = label.split(", ")[0]
-		newLabel = label.replace(prefix, iPrefix)
+	global gCacheObserver
 
-	return newLabel
+	if gCacheObserver == "":
+		gCacheObserver = CacheObserver()
+		FreeCAD.addDocumentObserver(gCacheObserver)
 
 
 # ###################################################################################################################
-def getContainersOffset(iObj):
+def getContainersTransform(iObj):
 	'''
 	Description:
 	
-		If the object is in the container like Part, Body, LinkGroup the vertices are 
-		not updated by FreeCAD. From FreeCAD perspective the object is still in the 
-		same place. This function is trying to solve this problem and calculates 
-		all offsets of all containers.
+		Returns containers and transforms for iObj, used by getContainersOffset, getVerticesPosition and 
+		removeVerticesPosition. The transforms are calculated only once for each object and stored in gTransforms 
+		for the object document. The CacheObserver removes the stored transforms if any object is moved, 
+		created, removed or moved to other container. So, there is no need to search the containers via 
+		InListRecursive and multiply all the placements for each call.
 	
 	Args:
 	
-		iObj: object to get containers offset
+		iObj: object to get containers transforms
 
 	Usage:
 	
-		[ coX, coY, coZ, coR ] = MagicPanels.getContainersOffset(o)
+		transform = MagicPanels.getContainersTransform(o)
+		v = transform["position"].multVec(v)
 
 	Result:
 	
-		return [ coX, coY, coZ, coR ] array with offsets for placement:
+		Return dict with:
 		
-		coX: X Axis object position
-		coY: Y Axis object position
-		coZ: Z Axis object position
-		coR: Rotation object
+		"containers": list of containers, the same as getContainers
+		"offset": [ coX, coY, coZ, coR ] the same as getContainersOffset
+		"position": FreeCAD.Placement to get vertices position, see getVerticesPosition
+		"remove": FreeCAD.Placement to remove vertices position, see removeVerticesPosition
 
 	'''
 
+	addCacheObserver()
+
+	docName = iObj.Document.Name
+	if docName not in gTransforms:
+		gTransforms[docName] = dict()
+
+	db = gTransforms[docName]
+	if iObj.Name in db:
+		return db[iObj.Name]
+
 	coX, coY, coZ = 0, 0, 0
 	coR = FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00)
-
-	# not unpack mirroring
-	if iObj.isDerivedFrom("Part::Mirroring"):
-		return [ coX, coY, coZ, coR ]
+	position = FreeCAD.Placement()
+	remove = FreeCAD.Placement()
 
 	containers = getContainers(iObj)
 	for o in containers:
@@ -3030,10 +3631,11 @@ def getContainersOffset(iObj):
 			):
 			
 			try:
-				x = o.Placement.Base.x
-				y = o.Placement.Base.y
-				z = o.Placement.Base.z
-				r = o.Placement.Rotation
+				p = o.Placement
+				x = p.Base.x
+				y = p.Base.y
+				z = p.Base.z
+				r = p.Rotation
 			except:
 				continue
 
@@ -3041,83 +3643,209 @@ def getContainersOffset(iObj):
 			coY = coY + y
 			coZ = coZ + z
 			coR = coR * r
+			
+			# the same as multVec for each container, from the nearest one
+			position = p * position
+			remove = p.inverse() * remove
+
+	db[iObj.Name] = {
+		"containers": containers, 
+		"offset": [ coX, coY, coZ, coR ], 
+		"position": position, 
+		"remove": remove
+	}
 
-	return [ coX, coY, coZ, coR ]
+	return db[iObj.Name]
 
 
 # ###################################################################################################################
-def getVerticesOffset(iVertices, iObj, iType="array"):
+def multVertices(iPlacement, iVertices):
 	'''
-	Gets iObj offset of all supported containers for vertices iVertices.
+	Description:
+	
+		Apply iPlacement to all iVertices. If there are many vertices and NumPy is available 
+		all vertices are transformed by single matrix multiplication.
 	
 	Args:
 	
-		iObj: object to get containers offset
-		iVertices: vertices array
-		iType:
-			"array" - array with floats [ 1, 2, 3 ]
-			"vector" - array with FreeCAD.Vector types
-		
+		iPlacement: FreeCAD.Placement
+		iVertices: list of FreeCAD.Vector
+
 	Usage:
 	
-		vertices = MagicPanels.getVerticesOffset(vertices, o, "array")
+		vertices = MagicPanels.multVertices(o.Placement, vertices)
 
 	Result:
 	
-		return vertices array with correct container offset
+		Return new list of FreeCAD.Vector.
 
 	'''
 
-	vertices = []
-	
-	[ coX, coY, coZ, coR ] = getContainersOffset(iObj)
-	
-	for v in iVertices:
-		if iType == "array":
-			n = [ v[0] + coX, v[1] + coY, v[2] + coZ ]
-		else:
-			n = FreeCAD.Vector(v.x + coX, v.y + coY, v.z + coZ)
-		
-		vertices.append(n)
-	
-	return vertices
+	if len(iVertices) > 8:
+		try:
+			import numpy
+			
+			m = numpy.array(iPlacement.toMatrix().A).reshape(4, 4)
+			a = numpy.array([ ( v.x, v.y, v.z ) for v in iVertices ])
+			a = a.dot(m[:3, :3].T) + m[:3, 3]
+			
+			return [ FreeCAD.Vector(v[0], v[1], v[2]) for v in a.tolist() ]
+			
+		except ImportError:
+			skip = 1
+
+	return [ iPlacement.multVec(v) for v in iVertices ]
 
 
 # ###################################################################################################################
-def getVerticesPosition(iVertices, iObj, iType="auto"):
+def getNestingLabel(iObj, iPrefix):
 	'''
 	Description:
 	
-		Gets iVertices 3D position. This function should be used to show or select iVertices with rotation. 
-		It calculates all offsets with rotation. But this function should not be used for calculation. 
-		Because the vertices at FreeCAD are raw, without containers offset. The vertices at FreeCAD have only 
-		AttachmentOffset applied. If you start calculation with rotation, you need to calculate plane correctly.
+		This function set label for nesting objects, containers, copied, to not repeat 
+		the prefix and not make the label too long. 
 	
 	Args:
 	
-		iVertices: vertices array
-		iObj: object to get containers offset
-		iType:
-			"auto" - recognize the iVertices elements type
-			"array" - each element of iVertices is array with floats [ 1, 2, 3 ]
-			"vector" - each element of iVertices is array with FreeCAD.Vector
-			"vertex" - each element of iVertices is array with Part.Vertex
+		iObj: object for the label check
+		iPrefix: string, preferred prefix for the label
 
 	Usage:
 	
-		[[ x, y, z ]] = MagicPanels.getVerticesPosition([[ x, y, z ]], o, "array")
-		vertices = MagicPanels.getVerticesPosition(vertices, o, "vector")
-		vertices = MagicPanels.getVerticesPosition(vertices, o)
-		
-		MagicPanels.showVertex(vertices, 10)
+		o.Label = MagicPanels.getNestingLabel(o, "Container")
 
 	Result:
 	
-		return vertices array with correct container offset, with the same type
+		return string for the new label
 
 	'''
 
-	# not unpack mirroring
+	label = str(iObj.Label)
+
+	if label.find(", ") == -1:
+		newLabel = iPrefix + ", " + label + " "
+
+	else:
+		prefix = label.split(", ")[0]
+		newLabel = label.replace(prefix, iPrefix)
+
+	return newLabel
+
+
+# ###################################################################################################################
+def getContainersOffset(iObj):
+	'''
+	Description:
+	
+		If the object is in the container like Part, Body, LinkGroup the vertices are 
+		not updated by FreeCAD. From FreeCAD perspective the object is still in the 
+		same place. This function is trying to solve this problem and calculates 
+		all offsets of all containers.
+	
+	Args:
+	
+		iObj: object to get containers offset
+
+	Usage:
+	
+		[ coX, coY, coZ, coR ] = MagicPanels.getContainersOffset(o)
+
+	Result:
+	
+		return [ coX, coY, coZ, coR ] array with offsets for placement:
+		
+		coX: X Axis object position
+		coY: Y Axis object position
+		coZ: Z Axis object position
+		coR: Rotation object
+
+	'''
+
+	coX, coY, coZ = 0, 0, 0
+	coR = FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00)
+
+	# not unpack mirroring
+	if iObj.isDerivedFrom("Part::Mirroring"):
+		return [ coX, coY, coZ, coR ]
+
+	[ coX, coY, coZ, coR ] = getContainersTransform(iObj)["offset"]
+
+	return [ coX, coY, coZ, FreeCAD.Rotation(coR) ]
+
+
+# ###################################################################################################################
+def getVerticesOffset(iVertices, iObj, iType="array"):
+	'''
+	Gets iObj offset of all supported containers for vertices iVertices.
+	
+	Args:
+	
+		iObj: object to get containers offset
+		iVertices: vertices array
+		iType:
+			"array" - array with floats [ 1, 2, 3 ]
+			"vector" - array with FreeCAD.Vector types
+		
+	Usage:
+	
+		vertices = MagicPanels.getVerticesOffset(vertices, o, "array")
+
+	Result:
+	
+		return vertices array with correct container offset
+
+	'''
+
+	vertices = []
+	
+	[ coX, coY, coZ, coR ] = getContainersOffset(iObj)
+	
+	for v in iVertices:
+		if iType == "array":
+			n = [ v[0] + coX, v[1] + coY, v[2] + coZ ]
+		else:
+			n = FreeCAD.Vector(v.x + coX, v.y + coY, v.z + coZ)
+		
+		vertices.append(n)
+	
+	return vertices
+
+
+# ###################################################################################################################
+def getVerticesPosition(iVertices, iObj, iType="auto"):
+	'''
+	Description:
+	
+		Gets iVertices 3D position. This function should be used to show or select iVertices with rotation. 
+		It calculates all offsets with rotation. But this function should not be used for calculation. 
+		Because the vertices at FreeCAD are raw, without containers offset. The vertices at FreeCAD have only 
+		AttachmentOffset applied. If you start calculation with rotation, you need to calculate plane correctly.
+	
+	Args:
+	
+		iVertices: vertices array
+		iObj: object to get containers offset
+		iType:
+			"auto" - recognize the iVertices elements type
+			"array" - each element of iVertices is array with floats [ 1, 2, 3 ]
+			"vector" - each element of iVertices is array with FreeCAD.Vector
+			"vertex" - each element of iVertices is array with Part.Vertex
+
+	Usage:
+	
+		[[ x, y, z ]] = MagicPanels.getVerticesPosition([[ x, y, z ]], o, "array")
+		vertices = MagicPanels.getVerticesPosition(vertices, o, "vector")
+		vertices = MagicPanels.getVerticesPosition(vertices, o)
+		
+		MagicPanels.showVertex(vertices, 10)
+
+	Result:
+	
+		return vertices array with correct container offset, with the same type
+
+	'''
+
+	# not unpack mirroring
 	if iObj.isDerivedFrom("Part::Mirroring"):
 		return iVertices
 
@@ -3167,28 +3895,8 @@ def getVerticesPosition(iVertices, iObj, iType="auto"):
 		vertices.append(n)
 	
 	# calculate position
-	containers = getContainers(iObj)
-	for o in containers:
-		
-		if (
-			o.isDerivedFrom("App::Part") or 
-			o.isDerivedFrom("PartDesign::Body") or 
-			o.isDerivedFrom("App::LinkGroup") or 
-			o.isDerivedFrom("Part::Cut") 
-			):
-			
-			try:
-				p = o.Placement
-			except:
-				continue
-			
-			i = 0
-			for v in vertices:
-
-				n = p.multVec(v)
-				vertices[i] = n
-				
-				i = i + 1
+	p = getContainersTransform(iObj)["position"]
+	vertices = multVertices(p, vertices)
 
 	# convert to the same type as iVertices
 	i = 0
@@ -3288,28 +3996,8 @@ def removeVerticesPosition(iVertices, iObj, iType="auto"):
 		vertices.append(n)
 	
 	# calculate position
-	containers = getContainers(iObj)
-	for o in containers:
-		
-		if (
-			o.isDerivedFrom("App::Part") or 
-			o.isDerivedFrom("PartDesign::Body") or 
-			o.isDerivedFrom("App::LinkGroup") or 
-			o.isDerivedFrom("Part::Cut") 
-			):
-			
-			try:
-				p = o.Placement.inverse()
-			except:
-				continue
-			
-			i = 0
-			for v in vertices:
-
-				n = p.multVec(v)
-				vertices[i] = n
-				
-				i = i + 1
+	p = getContainersTransform(iObj)["remove"]
+	vertices = multVertices(p, vertices)
 
 	# convert to the same type as iVertices
 	i = 0
@@ -3418,7 +4106,7 @@ def moveToClean(iObjects, iSelection):
 			o.adjustRelativeLinks(toMove)
 			toMove.ViewObject.dropObject(o, None, '', [])
 			
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 
 
 # ###################################################################################################################
@@ -3451,7 +4139,7 @@ def moveToContainer(iObjects, iContainer):
 		iContainer.ViewObject.dropObject(o, None, '', [])
 		FreeCADGui.Selection.clearSelection()
 
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 
 
 # ###################################################################################################################
@@ -3488,15 +4176,64 @@ def moveToFirst(iObjects, iSelection):
 
 	'''
 	
-	# if no container, do nothing
+	# if no supported container, do nothing
+	[ c, offset ] = getFirstContainer(iSelection)
+	if c == "":
+		return
+
+	for o in iObjects:
+	
+		# remove Body offset
+		[ x, y, z, r ] = getContainerPlacement(o, "clean")
+		
+		# calculate new offset without Body
+		x = x + offset[0]
+		y = y + offset[1]
+		z = z + offset[2]
+		
+		# set new placement
+		setContainerPlacement(o, x, y, z, 0, "clean")
+
+		# move the object to this container
+		FreeCADGui.Selection.addSelection(o)
+		o.adjustRelativeLinks(c)
+		c.ViewObject.dropObject(o, None, '', [])
+		FreeCADGui.Selection.clearSelection()
+
+	recompute()
+
+
+# ###################################################################################################################
+def getFirstContainer(iSelection):
+	'''
+	Description:
+	
+		Returns first supported container above Body for iSelection object, LinkGroup or Group, and 
+		the offset moveToFirst adds to objects moved to this container. The offset removes 
+		the containers offset, see getContainersOffset, but keeps Part and Body placements found 
+		before the container. So, you can get the object position after moveToFirst without 
+		moving the object.
+
+	Args:
+	
+		iSelection: selected object, for example Pad
+
+	Usage:
+
+		[ container, offset ] = MagicPanels.getFirstContainer(pad)
+		position = FreeCAD.Vector(x + offset[0], y + offset[1], z + offset[2])
+
+	Result:
+
+		Return [ container, [ x, y, z ] ] or [ "", [ 0, 0, 0 ] ] if there is no supported container.
+
+	'''
+	
 	containers = getContainers(iSelection)
 	rsize = len(containers)
-	if rsize == 0:
-		return
 
 	# check containers
 	boX, boY, boZ = 0, 0, 0
-	boR = FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00)
 	i = 0
 	while i < rsize and i < gSearchDepth:
 		
@@ -3508,28 +4245,9 @@ def moveToFirst(iObjects, iSelection):
 			c.isDerivedFrom("App::DocumentObjectGroup") 
 			):
 		
-			for o in iObjects:
+			[ coX, coY, coZ, coR ] = getContainersOffset(iSelection)
 			
-				# remove Body offset
-				[ x, y, z, r ] = getContainerPlacement(o, "clean")
-				[ coX, coY, coZ, coR ] = getContainersOffset(iSelection)
-				
-				# calculate new offset without Body
-				x = x - coX + boX
-				y = y - coY + boY
-				z = z - coZ + boZ
-				
-				# set new placement
-				setContainerPlacement(o, x, y, z, 0, "clean")
-
-				# move the object to this container
-				FreeCADGui.Selection.addSelection(o)
-				o.adjustRelativeLinks(c)
-				c.ViewObject.dropObject(o, None, '', [])
-				FreeCADGui.Selection.clearSelection()
-
-			FreeCAD.ActiveDocument.recompute()
-			return
+			return [ c, [ boX - coX, boY - coY, boZ - coZ ] ]
 
 		# if there is other container with placement
 		elif (
@@ -3551,6 +4269,8 @@ def moveToFirst(iObjects, iSelection):
 
 		i = i + 1
 
+	return [ "", [ 0, 0, 0 ] ]
+
 
 # ###################################################################################################################
 def moveToFirstWithInverse(iObjects, iSelection):
@@ -3623,7 +4343,7 @@ def moveToFirstWithInverse(iObjects, iSelection):
 				c.ViewObject.dropObject(o, None, '', [])
 				FreeCADGui.Selection.clearSelection()
 
-			FreeCAD.ActiveDocument.recompute()
+			recompute()
 			
 			return
 			
@@ -3676,7 +4396,7 @@ def moveToParent(iObjects, iSelection):
 		parent.ViewObject.dropObject(o, None, '', [])
 		FreeCADGui.Selection.clearSelection()
 
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 
 
 # ###################################################################################################################
@@ -3763,7 +4483,7 @@ def createContainer(iObjects, iLabel="Container"):
 	except:
 		skip = 1
 		
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 	
 	return container
 
@@ -4001,6 +4721,208 @@ def setContainerPlacement(iObj, iX, iY, iZ, iR, iAnchor="normal"):
 	iObj.Placement.Rotation = R
 
 
+# ###################################################################################################################
+'''
+# Spatial index
+'''
+# ###################################################################################################################
+
+
+# ###################################################################################################################
+def getGlobalBoundBox(iObj):
+	'''
+	Description:
+	
+		Returns BoundBox of the object with all containers offsets. So, you can compare objects 
+		from different containers.
+	
+	Args:
+	
+		iObj: object with Shape
+
+	Usage:
+	
+		bb = MagicPanels.getGlobalBoundBox(o)
+
+	Result:
+	
+		return FreeCAD.BoundBox object
+
+	'''
+
+	b = iObj.Shape.BoundBox
+	[ coX, coY, coZ, coR ] = getContainersOffset(iObj)
+	
+	return FreeCAD.BoundBox(b.XMin + coX, b.YMin + coY, b.ZMin + coZ, b.XMax + coX, b.YMax + coY, b.ZMax + coZ)
+
+
+# ###################################################################################################################
+def getSpatialCells(iBoundBox):
+	'''
+	Description:
+	
+		Returns grid cells for given BoundBox, the cell size is gSpatialSize.
+	
+	Args:
+	
+		iBoundBox: BoundBox object
+
+	Usage:
+	
+		cells = MagicPanels.getSpatialCells(bb)
+
+	Result:
+	
+		return list of cells, each cell is tuple ( x, y, z ) with cell number along each axis
+
+	'''
+
+	import math
+
+	cells = []
+
+	x1 = int(math.floor(iBoundBox.XMin / gSpatialSize))
+	y1 = int(math.floor(iBoundBox.YMin / gSpatialSize))
+	z1 = int(math.floor(iBoundBox.ZMin / gSpatialSize))
+	x2 = int(math.floor(iBoundBox.XMax / gSpatialSize))
+	y2 = int(math.floor(iBoundBox.YMax / gSpatialSize))
+	z2 = int(math.floor(iBoundBox.ZMax / gSpatialSize))
+	
+	for x in range(x1, x2 + 1):
+		for y in range(y1, y2 + 1):
+			for z in range(z1, z2 + 1):
+				cells.append(( x, y, z ))
+
+	return cells
+
+
+# ###################################################################################################################
+def getSpatialIndex(iObjects, iName="default"):
+	'''
+	Description:
+	
+		Returns spatial index for given objects. The index is uniform grid with global BoundBox of 
+		each object, containers offsets included. The index is stored under iName and it is updated 
+		at each call only for objects that have been changed, moved, added or removed. So, you can 
+		call it at each tool run without creating the index from scratch. 
+	
+	Args:
+	
+		iObjects: list of objects to index, for example all dowels
+		iName (optional): name of the index, for example tool name
+
+	Usage:
+	
+		index = MagicPanels.getSpatialIndex(cylinders, "cutDowels")
+		
+		for o in panels:
+			for d in MagicPanels.getSpatialNeighbours(index, MagicPanels.getGlobalBoundBox(o)):
+				do something ...
+
+	Result:
+	
+		return index to use with getSpatialNeighbours function
+
+	'''
+
+	if iName not in gSpatialIndex:
+		gSpatialIndex[iName] = { "cells": dict(), "items": dict() }
+
+	index = gSpatialIndex[iName]
+	cells = index["cells"]
+	items = index["items"]
+	
+	names = dict()
+	
+	for i, o in enumerate(iObjects):
+		
+		try:
+			[ name, shapeKey ] = getShapeKey(o)
+			[ coX, coY, coZ, coR ] = getContainersOffset(o)
+			key = shapeKey + ":" + str([ coX, coY, coZ ])
+		except:
+			continue
+
+		names[name] = i
+		
+		if name in items:
+			
+			item = items[name]
+			item["object"] = o
+			item["order"] = i
+			
+			if item["key"] == key:
+				continue
+			
+			for c in item["cells"]:
+				cells[c].discard(name)
+
+		try:
+			box = getGlobalBoundBox(o)
+		except:
+			continue
+
+		item = { "key": key, "object": o, "order": i, "box": box, "cells": getSpatialCells(box) }
+		
+		for c in item["cells"]:
+			if c not in cells:
+				cells[c] = set()
+			cells[c].add(name)
+		
+		items[name] = item
+
+	# remove objects not given this time
+	for name in list(items.keys()):
+		if name not in names:
+			for c in items[name]["cells"]:
+				cells[c].discard(name)
+			del items[name]
+	
+	return index
+
+
+# ###################################################################################################################
+def getSpatialNeighbours(iIndex, iBoundBox):
+	'''
+	Description:
+	
+		Returns objects from spatial index with global BoundBox inside or touching given BoundBox. 
+		Only the grid cells of given BoundBox are checked, not all objects.
+	
+	Args:
+	
+		iIndex: index from getSpatialIndex function
+		iBoundBox: BoundBox to search, global position, for example from getGlobalBoundBox
+
+	Usage:
+	
+		index = MagicPanels.getSpatialIndex(cylinders, "cutDowels")
+		dowels = MagicPanels.getSpatialNeighbours(index, MagicPanels.getGlobalBoundBox(panel))
+
+	Result:
+	
+		return list of objects in the same order as given to getSpatialIndex
+
+	'''
+
+	found = set()
+	
+	for c in getSpatialCells(iBoundBox):
+		if c in iIndex["cells"]:
+			found.update(iIndex["cells"][c])
+
+	items = []
+	
+	for name in found:
+		item = iIndex["items"][name]
+		if item["box"].intersect(iBoundBox):
+			items.append(item)
+
+	items.sort(key=lambda item: item["order"])
+	
+	return [ item["object"] for item in items ]
+
+
 # ###################################################################################################################
 '''
 # Conversion
@@ -4299,7 +5221,7 @@ def makePad(iObj, iPadLabel="Pad"):
 	# try copy expressions from Cube to Pad
 	if iObj.ExpressionEngine != []:
 		
-		doc.recompute()
+		recompute([ pad ])
 		
 		for ex in iObj.ExpressionEngine:
 			
@@ -4321,7 +5243,7 @@ def makePad(iObj, iPadLabel="Pad"):
 	except:
 		skip = 1
 
-	doc.recompute()
+	recompute([ pad ])
 	
 	# trick to avoid Topology Naming Problem with containers
 	# if the Cube is replaced by Pad and you move the Pad directly
@@ -4333,20 +5255,219 @@ def makePad(iObj, iPadLabel="Pad"):
 	body.Placement.Base.z = body.Placement.Base.z + coZ
 	moveToFirst([ part ], iObj)
 
-	doc.recompute()
+	recompute([ pad ])
 
 	return [ part, body, sketch, pad ]
 
 
-# ###################################################################################################################
-'''
-# Holes
-'''
-# ###################################################################################################################
+# ###################################################################################################################
+'''
+# Holes
+'''
+# ###################################################################################################################
+
+
+# ###################################################################################################################
+def getDrillBitsGroups(iBits, iType):
+	'''
+	Description:
+	
+		Groups drill bits that can be drilled by single Sketch and single Hole. The drill bits 
+		are in the same group if they have the same size, depth and rotation, and if they are 
+		at the same face.
+
+	Args:
+
+		iBits: list of drill bits, Cylinder objects for "Holes", Cone objects for other types
+		iType: "Holes", "Countersinks", "Counterbores" or "PocketHoles"
+
+	Usage:
+
+		groups = MagicPanels.getDrillBitsGroups(cones, "Countersinks")
+
+	Result:
+
+		Return list of groups, each group is list of drill bits, the order of drill bits is kept.
+
+	'''
+
+	groups = dict()
+	
+	for o in iBits:
+		
+		if iType == "Holes":
+			size = [ o.Radius.Value ]
+		else:
+			size = [ o.Radius1.Value, o.Radius2.Value ]
+		
+		[ x, y, z, r ] = getContainerPlacement(o, "clean")
+		
+		# the hole starts at the drill bit bottom face, so the face is the same if 
+		# the drill bits have the same rotation and the same distance along drill bit axis
+		normal = r.multVec(FreeCAD.Vector(0, 0, 1))
+		face = normal.dot(FreeCAD.Vector(x, y, z))
+		
+		key = [ round(v, gRoundPrecision) for v in size + [ o.Height.Value, face ] ]
+		key += [ round(v, 6) for v in r.Q ]
+		key = str(key)
+		
+		if key not in groups:
+			groups[key] = []
+		
+		groups[key].append(o)
+
+	return list(groups.values())
+
+
+# ###################################################################################################################
+def makeHolesBatch(iBody, iBits, iType):
+	'''
+	Description:
+	
+		Making holes for all drill bits at once. Drill bits with the same size, depth and 
+		face are drilled by single Sketch with many circles and single Hole object. 
+		The document is recomputed only once at the end. 
+
+	Args:
+
+		iBody: body of the object to drill
+		iBits: list of drill bits, Cylinder objects for "Holes", Cone objects for other types
+		iType: "Holes", "Countersinks", "Counterbores" or "PocketHoles"
+
+	Usage:
+
+		holes = MagicPanels.makeHolesBatch(body, cones, "Counterbores")
+		
+	Result:
+
+		Make holes and return list of Hole objects, one for each group of drill bits.
+
+	'''
+
+	import Part, Sketcher
+
+	holes = []
+	
+	for group in getDrillBitsGroups(iBits, iType):
+		
+		o = group[0]
+		
+		if iType == "Holes":
+			r1 = float(2 * o.Radius)
+			r2 = r1
+		else:
+			r1 = float(2 * o.Radius1)
+			r2 = float(2 * o.Radius2)
+
+		# create hole Sketch at the first drill bit position
+		holeSketch = iBody.newObject('Sketcher::SketchObject','Sketch')
+		holeSketch.MapMode = 'FlatFace'
+
+		[ x, y, z, r ] = getContainerPlacement(o, "clean")
+		setSketchPlacement(holeSketch, x, y, z, r, "global")
+		toSketch = FreeCAD.Placement(FreeCAD.Vector(x, y, z), r).inverse()
+
+		axis = FreeCAD.Vector(0, 0, 1)
+		
+		# set holes
+		for i, d in enumerate(group):
+			
+			[ dx, dy, dz, dr ] = getContainerPlacement(d, "clean")
+			c = toSketch.multVec(FreeCAD.Vector(dx, dy, dz))
+			
+			geo = Part.Circle(FreeCAD.Vector(c.x, c.y, 0), axis, r1 / 2)
+			g = holeSketch.addGeometry(geo, False)
+			
+			if i == 0:
+				holeSketch.addConstraint(Sketcher.Constraint('Coincident', g, 3, -1, 1))
+				n = holeSketch.addConstraint(Sketcher.Constraint('Diameter', g, r1))
+				
+				if iType == "PocketHoles":
+					holeSketch.renameConstraint(n, u'Tip0hole00Diameter')
+				else:
+					holeSketch.renameConstraint(n, u'Hole00Diameter')
+			else:
+				holeSketch.addConstraint(Sketcher.Constraint('Equal', 0, g))
+				holeSketch.addConstraint(Sketcher.Constraint('DistanceX', -1, 1, g, 3, c.x))
+				holeSketch.addConstraint(Sketcher.Constraint('DistanceY', -1, 1, g, 3, c.y))
+
+		# set countersink or counterbore
+		if iType != "Holes":
+			
+			geo = Part.Circle(FreeCAD.Vector(0, 0, 0), axis, r2 / 2)
+			g = holeSketch.addGeometry(geo, True)
+			holeSketch.addConstraint(Sketcher.Constraint('Coincident', g, 3, -1, 1)) 
+			n = holeSketch.addConstraint(Sketcher.Constraint('Diameter', g, r2))
+			
+			if iType == "Countersinks":
+				holeSketch.renameConstraint(n, u'Countersink00Diameter')
+			if iType == "Counterbores":
+				holeSketch.renameConstraint(n, u'Counterbore00Diameter')
+			if iType == "PocketHoles":
+				holeSketch.renameConstraint(n, u'Pocket0hole00Diameter')
+
+		# create hole object
+		if iType == "Holes":
+			hole = iBody.newObject('PartDesign::Hole','Hole')
+		if iType == "Countersinks":
+			hole = iBody.newObject('PartDesign::Hole','Countersink')
+		if iType == "Counterbores":
+			hole = iBody.newObject('PartDesign::Hole','Counterbore')
+		if iType == "PocketHoles":
+			hole = iBody.newObject('PartDesign::Hole','PocketHole')
+		
+		hole.Profile = holeSketch
+		holeSketch.Visibility = False
+		
+		hole.Diameter = r1
+		hole.HoleCutDiameter = r2
+		hole.HoleCutCountersinkAngle = 90.000000
+		hole.Depth = o.Height
+		hole.TaperedAngle = 90.000000
+		hole.Threaded = 0
+		hole.ThreadType = 0
+		hole.DepthType = 0
+		hole.Tapered = 0
+		
+		if iType == "Holes":
+			hole.HoleCutDepth = o.Height
+			hole.HoleCutType = 0
+		
+		if iType == "Countersinks":
+			hole.HoleCutDepth = 5.000000
+			hole.HoleCutType = 2
+
+		if iType == "Counterbores":
+			hole.HoleCutDepth = 5.000000
+			hole.HoleCutType = 1
+			
+		if iType == "PocketHoles":
+			hole.HoleCutDepth = o.Height / 2
+			hole.HoleCutType = 1
+		
+		if iType == "Holes" or iType == "Countersinks":
+			hole.DrillPointAngle = 118.000000
+			hole.DrillPoint = 1
+			hole.DrillForDepth = 1
+		else:
+			hole.DrillPoint = 0
+		
+		holes.append(hole)
+
+	recompute(holes)
+	
+	# colors can be copied after recompute, when the shapes are ready
+	for hole in holes:
+		try:
+			copyColors(hole.BaseFeature, hole)
+		except:
+			skip = 1
+
+	return holes
 
 
 # ###################################################################################################################
-def makeHoles(iObj, iFace, iCylinders):
+def makeHoles(iObj, iFace, iCylinders, iType="single"):
 	'''
 	Description:
 	
@@ -4357,10 +5478,15 @@ def makeHoles(iObj, iFace, iCylinders):
 		iObj: base object to make hole
 		iFace: face of base object to make hole
 		iCylinders: list of cylinders to make holes below each one
+		iType (optional): 
+			* "single" - each drill bit is drilled by separate Sketch and Hole, by default
+			* "batch" - drill bits with the same size, depth and face are drilled by single Sketch and Hole, 
+						the document is recomputed only once, see makeHolesBatch
 
 	Usage:
 
 		holes = MagicPanels.makeHoles(obj, face, cylinders)
+		holes = MagicPanels.makeHoles(obj, face, cylinders, "batch")
 		
 	Result:
 
@@ -4381,12 +5507,15 @@ def makeHoles(iObj, iFace, iCylinders):
 		
 		[ part, body, sketch, pad ] = makePad(base, base.Label)
 		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	else:
 		
 		body = base._Body
 
+	if iType == "batch":
+		return makeHolesBatch(body, objects, "Holes")
+
 	# loop in drill bits and drill holes
 	for o in objects:
 		
@@ -4404,12 +5533,12 @@ def makeHoles(iObj, iFace, iCylinders):
 		holeSketch.setDatum(1, FreeCAD.Units.Quantity(s))
 		holeSketch.renameConstraint(1, u'Hole00Diameter')
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# set position to hole Sketch
 		[ x, y, z, r ] = getContainerPlacement(o, "clean")
 		setSketchPlacement(holeSketch, x, y, z, r, "global")
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Hole')
@@ -4436,7 +5565,7 @@ def makeHoles(iObj, iFace, iCylinders):
 		except:
 			skip = 1
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ hole ])
 		
 		base = hole
 		holes.append(hole)
@@ -4445,7 +5574,7 @@ def makeHoles(iObj, iFace, iCylinders):
 	
 
 # ###################################################################################################################
-def makeCountersinks(iObj, iFace, iCones):
+def makeCountersinks(iObj, iFace, iCones, iType="single"):
 	'''
 	Description:
 	
@@ -4456,10 +5585,15 @@ def makeCountersinks(iObj, iFace, iCones):
 		iObj: base object to drill
 		iFace: face of base object to drill
 		iCones: list of drill bits to drill below each one (Cone objects)
+		iType (optional): 
+			* "single" - each drill bit is drilled by separate Sketch and Hole, by default
+			* "batch" - drill bits with the same size, depth and face are drilled by single Sketch and Hole, 
+						the document is recomputed only once, see makeHolesBatch
 
 	Usage:
 
 		holes = MagicPanels.makeCountersinks(obj, face, cones)
+		holes = MagicPanels.makeCountersinks(obj, face, cones, "batch")
 
 	Result:
 
@@ -4480,11 +5614,14 @@ def makeCountersinks(iObj, iFace, iCones):
 		
 		[ part, body, sketch, pad ] = makePad(base, base.Label)
 		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	else:
 		
 		body = base._Body
+
+	if iType == "batch":
+		return makeHolesBatch(body, objects, "Countersinks")
 	
 	for o in objects:
 		
@@ -4514,12 +5651,12 @@ def makeCountersinks(iObj, iFace, iCones):
 		holeSketch.setDatum(3, FreeCAD.Units.Quantity(sr2))
 		holeSketch.renameConstraint(3, u'Countersink00Diameter')
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# set position to hole Sketch
 		[ x, y, z, r ] = getContainerPlacement(o, "clean")
 		setSketchPlacement(holeSketch, x, y, z, r, "global")
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Countersink')
@@ -4546,7 +5683,7 @@ def makeCountersinks(iObj, iFace, iCones):
 		except:
 			skip = 1
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ hole ])
 		
 		base = hole
 		holes.append(hole)
@@ -4555,7 +5692,7 @@ def makeCountersinks(iObj, iFace, iCones):
 	
 
 # ###################################################################################################################
-def makeCounterbores(iObj, iFace, iCones):
+def makeCounterbores(iObj, iFace, iCones, iType="single"):
 	'''
 	Description:
 	
@@ -4566,10 +5703,15 @@ def makeCounterbores(iObj, iFace, iCones):
 		iObj: base object to drill
 		iFace: face of base object to drill
 		iCones: list of drill bits to drill below each one (Cone objects)
+		iType (optional): 
+			* "single" - each drill bit is drilled by separate Sketch and Hole, by default
+			* "batch" - drill bits with the same size, depth and face are drilled by single Sketch and Hole, 
+						the document is recomputed only once, see makeHolesBatch
 
 	Usage:
 
 		holes = MagicPanels.makeCounterbores(obj, face, cones)
+		holes = MagicPanels.makeCounterbores(obj, face, cones, "batch")
 
 	Result:
 
@@ -4590,12 +5732,15 @@ def makeCounterbores(iObj, iFace, iCones):
 		
 		[ part, body, sketch, pad ] = makePad(base, base.Label)
 		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	else:
 		
 		body = base._Body
 
+	if iType == "batch":
+		return makeHolesBatch(body, objects, "Counterbores")
+
 	for o in objects:
 		
 		# create hole Sketch
@@ -4624,12 +5769,12 @@ def makeCounterbores(iObj, iFace, iCones):
 		holeSketch.setDatum(3, FreeCAD.Units.Quantity(sr2))
 		holeSketch.renameConstraint(3, u'Counterbore00Diameter')
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# set position to hole Sketch
 		[ x, y, z, r ] = getContainerPlacement(o, "clean")
 		setSketchPlacement(holeSketch, x, y, z, r, "global")
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Counterbore')
@@ -4654,7 +5799,7 @@ def makeCounterbores(iObj, iFace, iCones):
 		except:
 			skip = 1
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ hole ])
 		
 		base = hole
 		holes.append(hole)
@@ -4663,7 +5808,7 @@ def makeCounterbores(iObj, iFace, iCones):
 
 
 # ###################################################################################################################
-def makePocketHoles(iObj, iFace, iCones):
+def makePocketHoles(iObj, iFace, iCones, iType="single"):
 	'''
 	Description:
 	
@@ -4674,10 +5819,15 @@ def makePocketHoles(iObj, iFace, iCones):
 		iObj: base object to drill
 		iFace: face of base object to drill
 		iCones: list of drill bits to drill below each one (Cone objects)
+		iType (optional): 
+			* "single" - each drill bit is drilled by separate Sketch and Hole, by default
+			* "batch" - drill bits with the same size, depth and face are drilled by single Sketch and Hole, 
+						the document is recomputed only once, see makeHolesBatch
 
 	Usage:
 
 		holes = MagicPanels.makePocketHoles(obj, face, cones)
+		holes = MagicPanels.makePocketHoles(obj, face, cones, "batch")
 
 	Result:
 
@@ -4698,12 +5848,15 @@ def makePocketHoles(iObj, iFace, iCones):
 		
 		[ part, body, sketch, pad ] = makePad(base, base.Label)
 		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	else:
 		
 		body = base._Body
 
+	if iType == "batch":
+		return makeHolesBatch(body, objects, "PocketHoles")
+
 	for o in objects:
 		
 		# create hole Sketch
@@ -4732,12 +5885,12 @@ def makePocketHoles(iObj, iFace, iCones):
 		holeSketch.setDatum(3, FreeCAD.Units.Quantity(sr2))
 		holeSketch.renameConstraint(3, u'Pocket0hole00Diameter')
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# set position to hole Sketch
 		[ x, y, z, r ] = getContainerPlacement(o, "clean")
 		setSketchPlacement(holeSketch, x, y, z, r, "global")
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch ])
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','PocketHole')
@@ -4762,7 +5915,7 @@ def makePocketHoles(iObj, iFace, iCones):
 		except:
 			skip = 1
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ hole ])
 		
 		base = hole
 		holes.append(hole)
@@ -4814,7 +5967,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 		
 		[ part, body, sketch, pad ] = makePad(base, base.Label)
 		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	else:
 		
@@ -4848,7 +6001,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 		holeSketch1.setDatum(3, FreeCAD.Units.Quantity(sr2))
 		holeSketch1.renameConstraint(3, u'Counterbore100Diameter')
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch1 ])
 		
 		# #################################################################
 		# First hole
@@ -4857,7 +6010,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 		# get & store drill bit position and set it to sketch
 		[ xs1, ys1, zs1, rs1 ] = getContainerPlacement(o, "clean")
 		setSketchPlacement(holeSketch1, xs1, ys1, zs1, rs1, "global")
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch1 ])
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Counterbore')
@@ -4882,7 +6035,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 		except:
 			skip = 1
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ hole ])
 		
 		base = hole
 		holes.append(hole)
@@ -4957,7 +6110,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 		[ xs3, ys3, zs3, rs3 ] = getContainerPlacement(o, "clean")
 		setSketchPlacement(holeSketch2, xs3, ys3, zs3, rs3, "global")
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ holeSketch2 ])
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Counterbore')
@@ -4982,7 +6135,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 		except:
 			skip = 1
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ hole ])
 		
 		base = hole
 		holes.append(hole)
@@ -4990,7 +6143,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 		# move & rotate back drill bit
 		setContainerPlacement(o, xs1, ys1, zs1, rs1, "clean")
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	FreeCADGui.Selection.clearSelection()
 		
@@ -5005,7 +6158,7 @@ def makeCounterbores2x(iObj, iFace, iCones):
 
 
 # ###################################################################################################################
-def makeCuts(iObjects):
+def makeCuts(iObjects, iType="chain"):
 	'''
 	Description:
 	
@@ -5016,10 +6169,15 @@ def makeCuts(iObjects):
 	Args:
 	
 		iObjects: objects to parse by multi bool cut
+		iType (optional): 
+			* "chain" - each object cuts the previous Cut, the copies of objects are used, by default
+			* "compound" - all objects are linked into single Compound and the base is cut only 
+							once, see makeCutsCompound
 
 	Usage:
 	
 		cuts = MagicPanels.makeCuts(objects)
+		cuts = MagicPanels.makeCuts(objects, "compound")
 
 	Result:
 	
@@ -5027,6 +6185,9 @@ def makeCuts(iObjects):
 
 	'''
 	
+	if iType == "compound":
+		return makeCutsCompound(iObjects)
+	
 	cuts = []
 	
 	base = iObjects[0]
@@ -5055,11 +6216,70 @@ def makeCuts(iObjects):
 		cuts.append(cut)
 		
 	cut.Label = getNestingLabel(base, "Cut")
-	FreeCAD.ActiveDocument.recompute()
+	recompute(cuts)
 
 	return cuts
 
 
+# ###################################################################################################################
+def makeCutsCompound(iObjects):
+	'''
+	Description:
+	
+		Allows to create multi bool cut operation at given objects with single Cut. First object 
+		from iObjects is the base element and all other will cut the base. For each object to cut 
+		the App::Link is created, instead of copy, and all links are packed into single Compound. 
+		So, there is only one boolean operation and the tools follow the original objects. 
+		The links and Compound are skipped in BOM, cut-list report.
+	
+	Args:
+	
+		iObjects: objects to parse by multi bool cut
+
+	Usage:
+	
+		cuts = MagicPanels.makeCutsCompound(objects)
+
+	Result:
+	
+		Array with single cut object will be returned.
+
+	'''
+	
+	info = translate("makeCuts", "Allows to skip this duplicated copy in BOM, cut-list report.")
+	
+	base = iObjects[0]
+	links = []
+	
+	for o in iObjects[1:]:
+		
+		link = FreeCAD.ActiveDocument.addObject('App::Link', "Link")
+		link.setLink(o)
+		link.LinkTransform = True
+		link.Label = getNestingLabel(o, "Copy")
+		
+		link.addProperty("App::PropertyBool", "BOM", "Woodworking", info)
+		link.BOM = False
+		
+		links.append(link)
+
+	tools = FreeCAD.ActiveDocument.addObject("Part::Compound", "Compound")
+	tools.Links = links
+	tools.Label = getNestingLabel(base, "Tools")
+	
+	tools.addProperty("App::PropertyBool", "BOM", "Woodworking", info)
+	tools.BOM = False
+	
+	cut = FreeCAD.ActiveDocument.addObject("Part::Cut", "Cut")
+	cut.Base = base
+	cut.Tool = tools
+	cut.Label = getNestingLabel(base, "Cut")
+	
+	recompute([ cut ])
+
+	return [ cut ]
+
+
 # ###################################################################################################################
 def makeCutsLinks(iObjects):
 	'''
@@ -5115,14 +6335,14 @@ def makeCutsLinks(iObjects):
 		cuts.append(cut)
 
 	cut.Label = getNestingLabel(base, "Cut")
-	FreeCAD.ActiveDocument.recompute()
+	recompute([ cut ])
 	
 	try:
 		copyColors(iObjects[0], cut)
 	except:
 		skip = 1
 
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 
 	return cuts
 
@@ -5178,7 +6398,7 @@ def makeFrame45cut(iObjects, iFaces):
 		
 			[ part, body, sketch, pad ] = makePad(o, "Frame")
 			FreeCAD.ActiveDocument.removeObject(o.Name)
-			FreeCAD.ActiveDocument.recompute()
+			recompute()
 		
 		else:
 		
@@ -5195,7 +6415,7 @@ def makeFrame45cut(iObjects, iFaces):
 		frame.Size = size - 0.01
 		pad.Visibility = False
 		
-		FreeCAD.ActiveDocument.recompute()
+		recompute([ frame ])
 
 		try:
 			copyColors(pad, frame)
@@ -5251,7 +6471,7 @@ def makeChamferCut(iObjects, iEdges, iSizes, iLabels):
 		
 			[ part, body, sketch, pad ] = makePad(o, str(o.Label))
 			FreeCAD.ActiveDocument.removeObject(o.Name)
-			FreeCAD.ActiveDocument.recompute()
+			recompute()
 
 		else:
 		
@@ -5273,14 +6493,14 @@ def makeChamferCut(iObjects, iEdges, iSizes, iLabels):
 			cuts.append(newCut)
 			
 			cut.Visibility = False
-			FreeCAD.ActiveDocument.recompute()
+			recompute([ newCut ])
 
 			try:
 				copyColors(cut, newCut)
 			except:
 				skip = 1
 		
-			FreeCAD.ActiveDocument.recompute()
+			recompute()
 			
 			cut = newCut
 			i = i + 1
@@ -5319,7 +6539,7 @@ def makeMortise(iSketch, iDepth, iPad, iFace):
 		
 		[ part, body, sketchPad, pad ] = makePad(iPad, iPad.Label)
 		FreeCAD.ActiveDocument.removeObject(iPad.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	else:
 		
@@ -5370,14 +6590,14 @@ def makeMortise(iSketch, iDepth, iPad, iFace):
 
 	sketch.Visibility = False
 	pad.Visibility = False
-	FreeCAD.ActiveDocument.recompute()
+	recompute([ mortise ])
 	
 	try:
 		copyColors(pad, mortise)
 	except:
 		skip = 1
 	
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 	
 	index = getFaceIndexByKey(mortise, faceKey)
 	newFace = mortise.Shape.Faces[index-1]
@@ -5416,7 +6636,7 @@ def makeTenon(iSketch, iLength, iPad, iFace):
 		
 		[ part, body, sketchPad, pad ] = makePad(iPad, iPad.Label)
 		FreeCAD.ActiveDocument.removeObject(iPad.Name)
-		FreeCAD.ActiveDocument.recompute()
+		recompute()
 	
 	else:
 		
@@ -5447,14 +6667,14 @@ def makeTenon(iSketch, iLength, iPad, iFace):
 	
 	sketch.Visibility = False
 	pad.Visibility = False
-	FreeCAD.ActiveDocument.recompute()
+	recompute([ tenon ])
 	
 	try:
 		copyColors(pad, tenon)
 	except:
 		skip = 1
 	
-	FreeCAD.ActiveDocument.recompute()
+	recompute()
 	
 	index = getFaceIndexByKey(tenon, faceKey)
 	newFace = tenon.Shape.Faces[index-1]
@@ -5606,6 +6826,343 @@ def sheetGetKey(iC, iR):
 	return str(key)
 
 
+# ###################################################################################################################
+'''
+# Preview
+'''
+# ###################################################################################################################
+
+
+# ###################################################################################################################
+def getPreviewObject(iPool, iType, iName):
+	'''
+	Description:
+	
+		Returns object for live preview, for example drill bit or dowel shown before the user accept it. 
+		If there is object with the same type and name prefix in iPool, the object is removed from iPool 
+		and returned to be updated, so there is no need to remove the object and create new one for each preview change. 
+		Otherwise the new object is created.
+		
+		Note: objects moved to container by moveToFirst are not reused, because moveToFirst removed the containers 
+		offset from their Placement, and the object would be shifted after setting new position with offset. 
+		Such objects stay in iPool, so they can be removed with removePreviewObjects.
+	
+	Args:
+	
+		iPool: list of objects from previous preview
+		iType: string, FreeCAD object type, for example "Part::Cylinder"
+		iName: string, name for the new object, for example "Dowel"
+
+	Usage:
+	
+		[ d, isNew ] = MagicPanels.getPreviewObject(pool, "Part::Cylinder", "Dowel")
+
+	Result:
+	
+		Return [ obj, isNew ], where obj is the object to update and isNew is True if the object 
+		has been created.
+
+	'''
+
+	i = 0
+	while i < len(iPool):
+		
+		o = iPool[i]
+		
+		try:
+			valid = ( 
+				o.TypeId == iType and 
+				str(o.Name).startswith(iName) and 
+				o.Document == FreeCAD.ActiveDocument and 
+				len(o.InList) == 0 
+			)
+		except:
+			del iPool[i] # removed by user
+			continue
+
+		if valid:
+			del iPool[i]
+			return [ o, False ]
+		
+		i = i + 1
+
+	o = FreeCAD.ActiveDocument.addObject(iType, iName)
+	
+	return [ o, True ]
+
+
+# ###################################################################################################################
+def removePreviewObjects(iPool):
+	'''
+	Description:
+	
+		Remove all objects from iPool, not used for the next preview, see getPreviewObject.
+	
+	Args:
+	
+		iPool: list of objects from previous preview
+
+	Usage:
+	
+		MagicPanels.removePreviewObjects(pool)
+
+	Result:
+	
+		Objects are removed from document and iPool is empty.
+
+	'''
+
+	for o in iPool:
+		try:
+			FreeCAD.ActiveDocument.removeObject(str(o.Name))
+		except:
+			skip = 1
+
+	del iPool[:]
+
+
+# ###################################################################################################################
+'''
+# Templates
+'''
+# ###################################################################################################################
+
+
+# ###################################################################################################################
+def getTemplate(iPath):
+	'''
+	Description:
+	
+		Returns hidden document loaded from iPath file. The file is loaded only once and the document 
+		is stored in gTemplates. If the file has been changed, it is loaded again. If there are more than 
+		gTemplatesSize documents stored, the least recently used document is closed. If the file is 
+		already opened by user, the user document is returned and not stored, so it is never closed here.
+		
+		Note: hidden document has no Gui document, so it has no view data, for example colors. With FreeCAD GUI 
+		the view colors are read from the file together with the document, see getTemplateColors.
+	
+	Args:
+	
+		iPath: string, full path to FCStd file
+
+	Usage:
+	
+		template = MagicPanels.getTemplate(path)
+
+	Result:
+	
+		Return FreeCAD document or -1 if the file cannot be loaded as hidden document.
+
+	'''
+
+	import os
+
+	try:
+		key = [ str(iPath), os.path.getmtime(iPath) ]
+	except:
+		return -1
+
+	if iPath in gTemplates:
+		[ doc, docKey, colors ] = gTemplates.pop(iPath)
+		
+		if docKey == key and doc in FreeCAD.listDocuments().values():
+			gTemplates[iPath] = [ doc, docKey, colors ]
+			return doc
+		
+		try:
+			FreeCAD.closeDocument(doc.Name)
+		except:
+			skip = 1
+
+	# file opened by user, use it but do not store it, the cache closes documents
+	for d in FreeCAD.listDocuments().values():
+		try:
+			if d.FileName != "" and os.path.samefile(d.FileName, iPath):
+				return d
+		except:
+			skip = 1
+
+	active = FreeCAD.ActiveDocument
+	
+	try:
+		doc = FreeCAD.openDocument(iPath, True)
+	except:
+		doc = -1
+
+	# opening document should not change the active document
+	if active != None:
+		try:
+			FreeCAD.setActiveDocument(active.Name)
+			FreeCADGui.setActiveDocument(active.Name)
+		except:
+			skip = 1
+
+	if doc == -1:
+		return -1
+
+	colors = dict()
+	if FreeCAD.GuiUp:
+		colors = getTemplateColors(iPath)
+
+	gTemplates[iPath] = [ doc, key, colors ]
+	
+	while len(gTemplates) > gTemplatesSize:
+		first = next(iter(gTemplates))
+		[ old, oldKey, oldColors ] = gTemplates.pop(first)
+		
+		try:
+			FreeCAD.closeDocument(old.Name)
+		except:
+			skip = 1
+
+	return doc
+
+
+# ###################################################################################################################
+def getTemplateColors(iPath):
+	'''
+	Description:
+	
+		Returns view colors stored at GuiDocument.xml of iPath file, because the hidden document opened 
+		by getTemplate has no view data. There are all color and color list properties, for example 
+		ShapeColor, DiffuseColor or LineColor, and Transparency.
+	
+	Args:
+	
+		iPath: string, full path to FCStd file
+
+	Usage:
+	
+		colors = MagicPanels.getTemplateColors(path)
+		
+		for [ name, value ] in colors["Box"]:
+			setattr(copy.ViewObject, name, value)
+
+	Result:
+	
+		Return dict with object Name as key and list of [ property name, value ] in order to set, 
+		or -1 if the colors cannot be read, for example the file stores only ShapeAppearance materials.
+
+	'''
+
+	import zipfile
+	import struct
+	import xml.etree.ElementTree as ET
+
+	def unpack(iValue):
+		v = int(iValue)
+		return ( ((v >> 24) & 0xff) / 255.0, ((v >> 16) & 0xff) / 255.0, ((v >> 8) & 0xff) / 255.0, (v & 0xff) / 255.0 )
+
+	colors = dict()
+
+	try:
+		with zipfile.ZipFile(iPath) as z:
+			
+			root = ET.fromstring(z.read("GuiDocument.xml"))
+			
+			for vp in root.iter("ViewProvider"):
+				
+				single = []
+				transparency = []
+				lists = []
+				appearance = False
+				
+				for p in vp.iter("Property"):
+					
+					name = p.get("name")
+					ptype = p.get("type")
+					
+					if name == "ShapeAppearance":
+						appearance = True
+					
+					if ptype == "App::PropertyColor":
+						single.append([ name, unpack(p.find("PropertyColor").get("value")) ])
+					
+					if ptype == "App::PropertyPercent" and name == "Transparency":
+						transparency.append([ name, int(p.find("Integer").get("value")) ])
+					
+					if ptype == "App::PropertyColorList":
+						file = p.find("ColorList").get("file")
+						if file == "" or file == None:
+							continue
+						
+						data = z.read(file)
+						count = struct.unpack("<I", data[0:4])[0]
+						values = struct.unpack("<" + str(count) + "I", data[4:4 + 4 * count])
+						lists.append([ name, [ unpack(v) for v in values ] ])
+				
+				# FreeCAD 1.0+ materials are not supported here
+				if appearance == True and len(single) + len(lists) == 0:
+					return -1
+				
+				# color lists last, ShapeColor and Transparency reset DiffuseColor
+				colors[vp.get("name")] = single + transparency + lists
+	except:
+		return -1
+
+	return colors
+
+
+# ###################################################################################################################
+def mergeTemplate(iPath):
+	'''
+	Description:
+	
+		Insert all objects from iPath file to the active document, the same as mergeProject. But the file 
+		is loaded only once, see getTemplate, and the objects are copied from the hidden document. So, 
+		inserting the same furniture or fixture many times does not unzip and parse the file each time. 
+		The hidden document has no view data, so with FreeCAD GUI the view colors read once from the file, 
+		see getTemplateColors, are set to the copies. If the colors cannot be read, mergeProject is used.
+	
+	Args:
+	
+		iPath: string, full path to FCStd file
+
+	Usage:
+	
+		objects = MagicPanels.mergeTemplate(path)
+
+	Result:
+	
+		Return list of inserted top objects, or empty list if the file was merged by mergeProject.
+
+	'''
+
+	template = getTemplate(iPath)
+	
+	# document opened by user is not stored at gTemplates
+	colors = dict()
+	if template != -1 and iPath in gTemplates:
+		colors = gTemplates[iPath][2]
+	elif template != -1 and FreeCAD.GuiUp:
+		colors = getTemplateColors(iPath)
+	
+	if template != -1 and colors != -1:
+		
+		try:
+			# copy all objects without dependency search, so the copies are in the same order
+			objects = template.Objects
+			copies = FreeCAD.ActiveDocument.copyObject(objects, False, True)
+		except:
+			copies = []
+		
+		if len(copies) > 0:
+			
+			if len(copies) == len(objects):
+				for o, c in zip(objects, copies):
+					for [ name, value ] in colors.get(o.Name, []):
+						try:
+							setattr(c.ViewObject, name, value)
+						except:
+							skip = 1
+			
+			return [ c for c in copies if len(c.InList) == 0 ]
+
+	FreeCAD.ActiveDocument.mergeProject(iPath)
+	
+	return []
+
+
 # ###################################################################################################################
 '''
 # Info screen
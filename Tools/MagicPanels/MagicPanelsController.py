@@ -433,45 +433,47 @@ def panelMove(iType):
 		if len(selection) < 1:
 			raise
 
-		for o in selection:
+		with MagicPanels.batch("panelMove"):
+		
+			for o in selection:
 
-			sizes = []
-			sizes = MagicPanels.getSizes(o)
-			sizes.sort()
+				sizes = []
+				sizes = MagicPanels.getSizes(o)
+				sizes.sort()
 
-			x = 0
-			y = 0
-			z = 0
+				x = 0
+				y = 0
+				z = 0
 			
-			if iType == "Xp":
-				x = sizes[0]
+				if iType == "Xp":
+					x = sizes[0]
 			
-			if iType == "Xm":
-				x = - sizes[0]
+				if iType == "Xm":
+					x = - sizes[0]
 
-			if iType == "Yp":
-				y = sizes[0]
+				if iType == "Yp":
+					y = sizes[0]
 
-			if iType == "Ym":
-				y = - sizes[0]
+				if iType == "Ym":
+					y = - sizes[0]
 
-			if iType == "Zp":
-				z = sizes[0]
+				if iType == "Zp":
+					z = sizes[0]
 
-			if iType == "Zm":
-				z = - sizes[0]
+				if iType == "Zm":
+					z = - sizes[0]
 
-			try:
-				[ x, y, z ] = MagicPanels.convertPosition(o, x, y, z)
-			except:
-				skip = 1
+				try:
+					[ x, y, z ] = MagicPanels.convertPosition(o, x, y, z)
+				except:
+					skip = 1
 				
-			[ x, y, z ] = MagicPanels.getModelRotation(x, y, z)
+				[ x, y, z ] = MagicPanels.getModelRotation(x, y, z)
 
-			[ px, py, pz, r ] = MagicPanels.getPlacement(o)
-			MagicPanels.setPlacement(o, px+x, py+y, pz+z, r)
+				[ px, py, pz, r ] = MagicPanels.getPlacement(o)
+				MagicPanels.setPlacement(o, px+x, py+y, pz+z, r)
 
-			FreeCAD.ActiveDocument.recompute()
+				MagicPanels.recompute()
 	
 	except:
 		
@@ -492,9 +494,9 @@ def panelResize(iType):
 		if len(objects) < 1:
 			raise
 		
-		for o in objects:
-
-			objRef = MagicPanels.getReference(o)
+		references = MagicPanels.getReferences(objects)
+		
+		for o, objRef in zip(objects, references):
 
 			sizes = []
 			sizes = MagicPanels.getSizes(objRef)
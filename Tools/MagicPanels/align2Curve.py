@@ -4,44 +4,107 @@ import MagicPanels
 translate = FreeCAD.Qt.translate
 curvePoints = []
 
+# ###################################################################################################################
+def getCurveDistance(iCurveShape, iBase, iRotation, iLocal, iAxis, iAngle):
+
+	import Part
+
+	# sub-vertex position after rotation, the same as Placement.Rotation * Rotation(iAxis, iAngle)
+	rotation = iRotation * FreeCAD.Rotation(iAxis, iAngle)
+	point = iBase + rotation.multVec(iLocal)
+	
+	return iCurveShape.distToShape(Part.Vertex(point))[0]
+
+
+# ###################################################################################################################
+def getClosestAngle(iCurveShape, iBase, iRotation, iLocal, iAxis, iStart, iEnd):
+
+	# golden section search for the angle with sub-vertex closest to the curve
+	g = 0.6180339887
+	a, b = iStart, iEnd
+	
+	c = b - g * (b - a)
+	d = a + g * (b - a)
+	fc = getCurveDistance(iCurveShape, iBase, iRotation, iLocal, iAxis, c)
+	fd = getCurveDistance(iCurveShape, iBase, iRotation, iLocal, iAxis, d)
+	
+	while abs(b - a) > 0.001:
+		if fc < fd:
+			b, d, fd = d, c, fc
+			c = b - g * (b - a)
+			fc = getCurveDistance(iCurveShape, iBase, iRotation, iLocal, iAxis, c)
+		else:
+			a, c, fc = c, d, fd
+			d = a + g * (b - a)
+			fd = getCurveDistance(iCurveShape, iBase, iRotation, iLocal, iAxis, d)
+
+	angle = (a + b) / 2
+	
+	return [ angle, getCurveDistance(iCurveShape, iBase, iRotation, iLocal, iAxis, angle) ]
+
+
 # ###################################################################################################################
 def searchCurve(iCurve, iObj, iSubName, iAnchor, iAxis, iDirection, iAngle=0, iVertexIndex=""):
 	
+	# the rotation is calculated without document recompute, 
+	# the object is moved only once if the rotation has been found
+	
 	if iDirection == "+":
-		if iAngle == 0:
-			angle = 1
-		else:
-			angle = iAngle
-			
-	if iDirection == "-":
-		if iAngle == 0:
-			angle = -1
-		else:
-			angle = -iAngle
+		sign = 1
+	else:
+		sign = -1
 	
+	tolerance = 1
+	
+	curveShape = iCurve.Shape
+	base = iObj.Placement.Base
 	rotation = iObj.Placement.Rotation
 	
+	sub = iObj.getSubObject(iSubName)
+	local = rotation.inverted().multVec(FreeCAD.Vector(sub.X, sub.Y, sub.Z) - base)
+	
+	found = ""
+	
 	if iAngle == 0:
-		end = 101
+		
+		# scan whole degrees up to 100 and refine at first closest point
+		last = getCurveDistance(curveShape, base, rotation, local, iAxis, 0)
+		falling = True
+		
+		for step in range(1, 101):
+			dist = getCurveDistance(curveShape, base, rotation, local, iAxis, sign * step)
+			
+			# close enough or the closest point has been just passed
+			if dist <= tolerance or ( falling == True and dist > last ):
+				start = sign * max(step - 2, 0)
+				end = sign * (step + 1)
+				[ angle, d ] = getClosestAngle(curveShape, base, rotation, local, iAxis, min(start, end), max(start, end))
+				
+				if d <= tolerance:
+					found = angle
+					break
+
+			falling = dist < last
+			last = dist
+
 	else:
-		end = 2
-	
-	for index in range(1, end):
-		rot = FreeCAD.Rotation(iAxis, angle)
-		iObj.Placement.Rotation = iObj.Placement.Rotation * rot
-		iObj.recompute()
 		
-		# get actual values
-		sub = FreeCAD.ActiveDocument.getObject(iObj.Name).getSubObject(iSubName)
-		subVector = FreeCAD.Vector(sub.X, sub.Y, sub.Z)
+		# refine around calculated angle
+		angle = sign * iAngle
+		[ angle, d ] = getClosestAngle(curveShape, base, rotation, local, iAxis, angle - 1, angle + 1)
+		
+		if d <= tolerance:
+			found = angle
 
-		if iCurve.Shape.isInside(subVector, 1, True):
-			FreeCADGui.Selection.clearSelection()
-			return True
-	
-	iObj.Placement.Rotation = rotation
 	FreeCADGui.Selection.clearSelection()
-	return False
+	
+	if found == "":
+		return False
+
+	iObj.Placement.Rotation = rotation * FreeCAD.Rotation(iAxis, found)
+	
+	return True
+
 
 # ###################################################################################################################
 try:
@@ -55,7 +118,7 @@ try:
 	curve = selection[0]
 	objects = selection[1:]
 
-	curvePoints = curve.Shape.getPoints(1)[0]
+	curvePoints = MagicPanels.getCurve(curve)["points"]
 
 	oIndex = 1
 	for o in objects:
@@ -129,21 +192,10 @@ try:
 			length = sub.Length
 			scope = 2 * int(length)
 			
-			targetIndex = -1
-			for i in range(1, scope):
-				index = anchorIndex + i
-				try:
-					dist = curvePoints[anchorIndex].distanceToPoint(curvePoints[index])
-				except:
-					continue
-
-				if dist > length:
-					break
-				else:
-					targetIndex = index
-					targetVector = curvePoints[index]
+			targetIndex = MagicPanels.getCurveIndexByDistance(curve, anchorIndex, length, scope - 1)
 			
 			if targetIndex != -1:
+				targetVector = curvePoints[targetIndex]
 				angle = (targetVector - anchorVector).getAngle(subVector - anchorVector)
 				angle = math.degrees(angle)
 
@@ -17,24 +17,26 @@ try:
 			if d.Visibility == True:
 				cylinders.append(d)
 
+	# index to search only cylinders near the panel
+	index = MagicPanels.getSpatialIndex(cylinders, "cutDowels")
+
 	for o in objects:
 		
 		tocut = [ o ]
-		for d in cylinders:
-
-			v1 = d.Shape.Faces[0].CenterOfMass
-			v2 = d.Shape.Faces[1].CenterOfMass
-			v3 = d.Shape.Faces[2].CenterOfMass
-
-			if (
-				o.Shape.BoundBox.isInside(v1) or 
-				o.Shape.BoundBox.isInside(v2) or 
-				o.Shape.BoundBox.isInside(v3)
-				):
-				tocut.append(d)
+		box = MagicPanels.getGlobalBoundBox(o)
+		
+		for d in MagicPanels.getSpatialNeighbours(index, box):
+
+			[ coX, coY, coZ, coR ] = MagicPanels.getContainersOffset(d)
+			offset = FreeCAD.Vector(coX, coY, coZ)
+			
+			for f in d.Shape.Faces[0:3]:
+				if box.isInside(f.CenterOfMass + offset):
+					tocut.append(d)
+					break
 		
 		if len(tocut) > 1:
-			cuts = MagicPanels.makeCuts(tocut)
+			cuts = MagicPanels.makeCuts(tocut, "compound")
 		
 	FreeCADGui.Selection.clearSelection()
 	FreeCAD.ActiveDocument.recompute()
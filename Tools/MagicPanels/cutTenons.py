@@ -17,30 +17,26 @@ try:
 			if tenon.Visibility == True:
 				tenons.append(tenon)
 
+	# index to search only tenons near the panel
+	index = MagicPanels.getSpatialIndex(tenons, "cutTenons")
+
 	for o in objects:
 		
 		tocut = [ o ]
-		for tenon in tenons:
-
-			v1 = tenon.Shape.Faces[0].CenterOfMass
-			v2 = tenon.Shape.Faces[1].CenterOfMass
-			v3 = tenon.Shape.Faces[2].CenterOfMass
-			v4 = tenon.Shape.Faces[3].CenterOfMass
-			v5 = tenon.Shape.Faces[4].CenterOfMass
-			v6 = tenon.Shape.Faces[5].CenterOfMass
-
-			if (
-				o.Shape.BoundBox.isInside(v1) or 
-				o.Shape.BoundBox.isInside(v2) or 
-				o.Shape.BoundBox.isInside(v3) or 
-				o.Shape.BoundBox.isInside(v4) or 
-				o.Shape.BoundBox.isInside(v5) or 
-				o.Shape.BoundBox.isInside(v6) 
-				):
-				tocut.append(tenon)
+		box = MagicPanels.getGlobalBoundBox(o)
+		
+		for tenon in MagicPanels.getSpatialNeighbours(index, box):
+
+			[ coX, coY, coZ, coR ] = MagicPanels.getContainersOffset(tenon)
+			offset = FreeCAD.Vector(coX, coY, coZ)
+			
+			for f in tenon.Shape.Faces[0:6]:
+				if box.isInside(f.CenterOfMass + offset):
+					tocut.append(tenon)
+					break
 		
 		if len(tocut) > 1:
-			cuts = MagicPanels.makeCuts(tocut)
+			cuts = MagicPanels.makeCuts(tocut, "compound")
 		
 	FreeCADGui.Selection.clearSelection()
 	FreeCAD.ActiveDocument.recompute()
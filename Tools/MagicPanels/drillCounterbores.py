@@ -42,7 +42,7 @@ try:
 
 	else:
 	
-		MagicPanels.makeCounterbores(base, face, objects)
+		MagicPanels.makeCounterbores(base, face, objects, "batch")
 
 except:
 	
@@ -42,7 +42,7 @@ try:
 		
 	else:
 	
-		MagicPanels.makeCountersinks(base, face, objects)
+		MagicPanels.makeCountersinks(base, face, objects, "batch")
 
 except:
 	
@@ -41,7 +41,7 @@ try:
 
 	else:
 
-		MagicPanels.makeHoles(base, face, objects)
+		MagicPanels.makeHoles(base, face, objects, "batch")
 
 except:
 	
@@ -81,6 +81,8 @@ def showQtGUI():
 		
 		# current visible dowels
 		gDowels = []
+		gDowelsPool = [] # dowels from previous preview to update
+		gDowelsNew = [] # dowels created for current preview
 		
 		# for tenon
 		gDSizeX = 0  # tenon cube size along X axis
@@ -643,322 +645,217 @@ def showQtGUI():
 			FreeCAD.activeDocument().recompute()
 
 		# ############################################################################
-		def showDowels(self):
+		def getDowelPosition(self, iV1, iV2, iSide, iIndex):
+
+			# dowel at 1st side goes back from v1 and dowel at 2nd side goes forward from v2
+			if iSide == 1:
+				[ X, Y, Z ] = [ iV1[0], iV1[1], iV1[2] ]
+				offset = - ( self.gDOCorner + ( iIndex * self.gDONext ) )
+			else:
+				[ X, Y, Z ] = [ iV2[0], iV2[1], iV2[2] ]
+				offset = self.gDOCorner + ( iIndex * self.gDONext )
 
-			# remove all dowels
+			[ x , y, z ] = [ 0, 0, 0 ]
 			
-			if len(self.gDowels) != 0:
-				for d in self.gDowels:
-					try:
-						FreeCAD.activeDocument().removeObject(str(d.Name))
-					except:
-						skip = 1
+			# edge along X
+			if not MagicPanels.equal(iV1[0], iV2[0]):
+				
+				if self.gFPlane == "XY":
+					x = X + offset
+					y = Y + self.gDOFESet
+					z = Z - self.gDOFSSet
+					
+					self.gDSizeX = self.gTenonL
+					self.gDSizeY = self.gTenonT
+					self.gDSizeZ = self.gTenonH
+				
+				if self.gFPlane == "XZ":
+					x = X + offset
+					y = Y - self.gDOFSSet
+					z = Z + self.gDOFESet
+		
+					self.gDSizeX = self.gTenonL
+					self.gDSizeY = self.gTenonT
+					self.gDSizeZ = self.gTenonH
+		
+				# this should not exist
+				if self.gFPlane == "YZ":
+					[ x, y, z ] = [ X, Y, Z ]
+					
+					self.gDSizeX = self.gTenonT
+					self.gDSizeY = self.gTenonL
+					self.gDSizeZ = self.gTenonH
+
+			# edge along Y
+			if not MagicPanels.equal(iV1[1], iV2[1]):
+				
+				if self.gFPlane == "XY":
+					x = X + self.gDOFESet
+					y = Y + offset
+					z = Z - self.gDOFSSet
 			
-			self.gDowels = []
+					self.gDSizeX = self.gTenonT
+					self.gDSizeY = self.gTenonL
+					self.gDSizeZ = self.gTenonH
 			
-			# get vertices info
+				# this should not exist
+				if self.gFPlane == "XZ":
+					[ x, y, z ] = [ X, Y, Z ]
+					
+					self.gDSizeX = self.gTenonL
+					self.gDSizeY = self.gTenonH
+					self.gDSizeZ = self.gTenonT
 			
+				if self.gFPlane == "YZ":
+					x = X - self.gDOFSSet
+					y = Y + offset
+					z = Z + self.gDOFESet
+
+					self.gDSizeX = self.gTenonT
+					self.gDSizeY = self.gTenonL
+					self.gDSizeZ = self.gTenonH
+
+			# edge along Z
+			if not MagicPanels.equal(iV1[2], iV2[2]):
+				
+				if self.gFPlane == "XY":
+					x = X + self.gDOFESet
+					y = Y - self.gDOFSSet
+					z = Z + offset
+				
+					self.gDSizeX = self.gTenonH
+					self.gDSizeY = self.gTenonL
+					self.gDSizeZ = self.gTenonT
+				
+				if self.gFPlane == "XZ":
+					x = X - self.gDOFESet
+					y = Y - self.gDOFSSet
+					z = Z + offset
+					
+					self.gDSizeX = self.gTenonT
+					self.gDSizeY = self.gTenonL
+					self.gDSizeZ = self.gTenonH
+					
+				if self.gFPlane == "YZ":
+					x = X - self.gDOFSSet
+					y = Y + self.gDOFESet
+					z = Z + offset
+
+					self.gDSizeX = self.gTenonL
+					self.gDSizeY = self.gTenonT
+					self.gDSizeZ = self.gTenonH
+
+			[ coX, coY, coZ, coR ] = MagicPanels.getContainersOffset(self.gObj)
+			
+			return [ x + coX, y + coY, z + coZ ]
+
+		# ############################################################################
+		def getDowelsEdge(self):
+
 			[ v1, v2 ] = MagicPanels.getEdgeVertices(self.gEdgeArr[self.gEdgeIndex])
 			
 			if not self.gObj.isDerivedFrom("Part::Box"):
 				[ v1, v2 ] = MagicPanels.getEdgeNormalized(v1, v2)
 			
-			# dowels for 1st side
+			return [ v1, v2 ]
+
+		# ############################################################################
+		def getFirstDowel(self):
+
+			# shape of first dowel for current settings, without creating any object
+			import Part
+			
+			[ v1, v2 ] = self.getDowelsEdge()
 			
 			if self.gSides == 0 or self.gSides == 1:
+				[ x, y, z ] = self.getDowelPosition(v1, v2, 1, 0)
+			else:
+				[ x, y, z ] = self.getDowelPosition(v1, v2, 2, 0)
+
+			if self.gDShape == 0:
+				shape = Part.makeCylinder(self.gDDiameter / 2, self.gDSize)
+			else:
+				shape = Part.makeBox(self.gDSizeX, self.gDSizeY, self.gDSizeZ)
+
+			# the same as reset and Draft.rotate around the dowel position, see setRotation, 
+			# and moveToFirst, so the position is the same as for the dowel object
+			angle = self.gRotationArr[self.gRotationIndex]
+			rotation = FreeCAD.Rotation(self.gRotation, angle)
+			[ c, offset ] = MagicPanels.getFirstContainer(self.gObj)
+			position = FreeCAD.Vector(x + offset[0], y + offset[1], z + offset[2])
+			shape.Placement = FreeCAD.Placement(position, rotation)
 			
-				[ X, Y, Z ] = [ v1[0], v1[1], v1[2] ]
-				[ x , y, z ] = [ 0, 0, 0 ]
-				
-				i = 0
-				while i < self.gDNum:
-					
-					# edge along X
-					if not MagicPanels.equal(v1[0], v2[0]):
-						
-						if self.gFPlane == "XY":
-							x = X - self.gDOCorner
-							if i != 0:
-								x = x - ( i * self.gDONext)
-							y = Y + self.gDOFESet
-							z = Z - self.gDOFSSet
-							
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonT
-							self.gDSizeZ = self.gTenonH
-						
-						if self.gFPlane == "XZ":
-							x = X - self.gDOCorner
-							if i != 0:
-								x = x - ( i * self.gDONext)
-							y = Y - self.gDOFSSet
-							z = Z + self.gDOFESet
-				
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonT
-							self.gDSizeZ = self.gTenonH
-				
-						# this should not exist
-						if self.gFPlane == "YZ":
-							[ x, y, z ] = [ X, Y, Z ]
-							
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-
-					# edge along Y
-					if not MagicPanels.equal(v1[1], v2[1]):
-						
-						if self.gFPlane == "XY":
-							x = X + self.gDOFESet
-							y = Y - self.gDOCorner
-							if i != 0:
-								y = y - ( i * self.gDONext)
-							z = Z - self.gDOFSSet
-					
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-					
-						# this should not exist
-						if self.gFPlane == "XZ":
-							[ x, y, z ] = [ X, Y, Z ]
-							
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonH
-							self.gDSizeZ = self.gTenonT
-					
-						if self.gFPlane == "YZ":
-							x = X - self.gDOFSSet
-							y = Y - self.gDOCorner
-							if i != 0:
-								y = y - ( i * self.gDONext)
-							z = Z + self.gDOFESet
-
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-
-					# edge along Z
-					if not MagicPanels.equal(v1[2], v2[2]):
-						
-						if self.gFPlane == "XY":
-							x = X + self.gDOFESet
-							y = Y - self.gDOFSSet
-							z = Z - self.gDOCorner
-							if i != 0:
-								z = z - ( i * self.gDONext)
-						
-							self.gDSizeX = self.gTenonH
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonT
-						
-						if self.gFPlane == "XZ":
-							x = X - self.gDOFESet
-							y = Y - self.gDOFSSet
-							z = Z - self.gDOCorner
-							if i != 0:
-								z = z - ( i * self.gDONext)
-							
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-							
-						if self.gFPlane == "YZ":
-							x = X - self.gDOFSSet
-							y = Y + self.gDOFESet
-							z = Z - self.gDOCorner
-							if i != 0:
-								z = z - ( i * self.gDONext)
-
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonT
-							self.gDSizeZ = self.gTenonH
-					
-					# create dowels
-					
-					[ coX, coY, coZ, coR ] = MagicPanels.getContainersOffset(self.gObj)
-					x = x + coX
-					y = y + coY
-					z = z + coZ
-			
-					if self.gDShape == 0:
-						d = FreeCAD.ActiveDocument.addObject("Part::Cylinder","Dowel")
-					else:
-						d = FreeCAD.ActiveDocument.addObject("Part::Box","Tenon")
-					
-					d.Label = str(self.gDowelLabel)
-					d.Placement.Base.x = x
-					d.Placement.Base.y = y
-					d.Placement.Base.z = z
-					
-					if self.gDShape == 0:
-						d.Radius = self.gDDiameter / 2
-						d.Height = self.gDSize
-						colors = [ (0.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
-					else:
-						d.Width = self.gDSizeY
-						d.Height = self.gDSizeZ
-						d.Length = self.gDSizeX
-						colors = [ (0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0),
-									(0.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
-						
-					d.ViewObject.DiffuseColor = colors
-					
-					self.gDowels.append(d)
-					
-					i = i + 1
+			return shape
+
+		# ############################################################################
+		def createDowel(self, iX, iY, iZ):
+
+			if self.gDShape == 0:
+				[ d, isNew ] = MagicPanels.getPreviewObject(self.gDowelsPool, "Part::Cylinder", "Dowel")
+			else:
+				[ d, isNew ] = MagicPanels.getPreviewObject(self.gDowelsPool, "Part::Box", "Tenon")
 			
-			# dowels for 2nd side
+			if isNew:
+				self.gDowelsNew.append(d)
 			
-			if self.gSides == 0 or self.gSides == 2:
+			d.Label = str(self.gDowelLabel)
+			d.Placement.Base.x = iX
+			d.Placement.Base.y = iY
+			d.Placement.Base.z = iZ
 			
-				[ X, Y, Z ] = [ v2[0], v2[1], v2[2] ]
-				[ x , y, z ] = [ 0, 0, 0 ]
+			if self.gDShape == 0:
+				d.Radius = self.gDDiameter / 2
+				d.Height = self.gDSize
+				colors = [ (0.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
+			else:
+				d.Width = self.gDSizeY
+				d.Height = self.gDSizeZ
+				d.Length = self.gDSizeX
+				colors = [ (0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0),
+							(0.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
+				
+			d.ViewObject.DiffuseColor = colors
+			
+			return d
+
+		# ############################################################################
+		def showDowels(self):
 
+			# reuse dowels from previous preview
+			
+			self.gDowelsPool = self.gDowels
+			self.gDowelsNew = []
+			self.gDowels = []
+			
+			# get vertices info
+			
+			[ v1, v2 ] = self.getDowelsEdge()
+			
+			# dowels for 1st and 2nd side
+			
+			for side in [ 1, 2 ]:
+				
+				if self.gSides != 0 and self.gSides != side:
+					continue
+				
 				i = 0
 				while i < self.gDNum:
 					
-					# edge along X
-					if not MagicPanels.equal(v1[0], v2[0]):
-
-						if self.gFPlane == "XY":
-							x = X + self.gDOCorner
-							if i != 0:
-								x = x + ( i * self.gDONext)
-							y = Y + self.gDOFESet
-							z = Z - self.gDOFSSet
-					
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonT
-							self.gDSizeZ = self.gTenonH
-						
-						if self.gFPlane == "XZ":
-							x = X + self.gDOCorner
-							if i != 0:
-								x = x + ( i * self.gDONext)
-							y = Y - self.gDOFSSet
-							z = Z + self.gDOFESet
-						
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonT
-							self.gDSizeZ = self.gTenonH
-				
-						# this should not exist
-						if self.gFPlane == "YZ":
-							[ x, y, z ] = [ X, Y, Z ]
-							
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-
-					# edge along Y
-					if not MagicPanels.equal(v1[1], v2[1]):
-
-						if self.gFPlane == "XY":
-							x = X + self.gDOFESet
-							y = Y + self.gDOCorner
-							if i != 0:
-								y = y + ( i * self.gDONext)
-							z = Z - self.gDOFSSet
-					
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-					
-						# this should not exist
-						if self.gFPlane == "XZ":
-							[ x, y, z ] = [ X, Y, Z ]
-							
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonH
-							self.gDSizeZ = self.gTenonT
-					
-						if self.gFPlane == "YZ":
-							x = X - self.gDOFSSet
-							y = Y + self.gDOCorner
-							if i != 0:
-								y = y + ( i * self.gDONext)
-							z = Z + self.gDOFESet
-
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-
-					# edge along Z
-					if not MagicPanels.equal(v1[2], v2[2]):
-
-						if self.gFPlane == "XY":
-							x = X + self.gDOFESet
-							y = Y - self.gDOFSSet
-							z = Z + self.gDOCorner
-							if i != 0:
-								z = z + ( i * self.gDONext)
-					
-							self.gDSizeX = self.gTenonH
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonT
-					
-						if self.gFPlane == "XZ":
-							x = X - self.gDOFESet
-							y = Y - self.gDOFSSet
-							z = Z + self.gDOCorner
-							if i != 0:
-								z = z + ( i * self.gDONext)
-					
-							self.gDSizeX = self.gTenonT
-							self.gDSizeY = self.gTenonL
-							self.gDSizeZ = self.gTenonH
-					
-						if self.gFPlane == "YZ":
-							x = X - self.gDOFSSet
-							y = Y + self.gDOFESet
-							z = Z + self.gDOCorner
-							if i != 0:
-								z = z + ( i * self.gDONext)
-								
-							self.gDSizeX = self.gTenonL
-							self.gDSizeY = self.gTenonT
-							self.gDSizeZ = self.gTenonH
-
-					# create dowels
-					
-					[ coX, coY, coZ, coR ] = MagicPanels.getContainersOffset(self.gObj)
-					x = x + coX
-					y = y + coY
-					z = z + coZ
-					
-					if self.gDShape == 0:
-						d = FreeCAD.ActiveDocument.addObject("Part::Cylinder","Dowel")
-					else:
-						d = FreeCAD.ActiveDocument.addObject("Part::Box","Tenon")
-					
-					d.Label = str(self.gDowelLabel)
-					d.Placement.Base.x = x
-					d.Placement.Base.y = y
-					d.Placement.Base.z = z
-					
-					if self.gDShape == 0:
-						d.Radius = self.gDDiameter / 2
-						d.Height = self.gDSize
-						colors = [ (0.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
-					else:
-						d.Width = self.gDSizeY
-						d.Height = self.gDSizeZ
-						d.Length = self.gDSizeX
-						colors = [ (0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0),
-									(0.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
-						
-					d.ViewObject.DiffuseColor = colors
-					
+					[ x, y, z ] = self.getDowelPosition(v1, v2, side, i)
+					d = self.createDowel(x, y, z)
 					self.gDowels.append(d)
 					
 					i = i + 1
 				
-			# set rotations
+			# remove not used dowels and set rotations
+			
+			MagicPanels.removePreviewObjects(self.gDowelsPool)
 			
 			self.setRotation()
-			MagicPanels.moveToFirst(self.gDowels, self.gObj)
+			
+			# reused objects are never moved to container, see getPreviewObject
+			if len(self.gDowelsNew) > 0:
+				MagicPanels.moveToFirst(self.gDowelsNew, self.gObj)
 
 		# ############################################################################
 		def setDowelsSettings(self, selectedIndex):
@@ -1368,18 +1265,22 @@ def showQtGUI():
 			except:
 				self.faceinfo.setText(self.gNoSelection)
 
+		def nextEdgeOffset(self):
+		
+			if self.gDOFEIndex + 1 > len(self.gDOFEArr) - 1:
+				self.gDOFEIndex = 0
+			else:
+				self.gDOFEIndex = self.gDOFEIndex + 1
+				
+			self.gDOFESet = self.gDOFEArr[self.gDOFEIndex]
+			self.aeIS.setText(str(self.gDOFEIndex+1) + " / " + str(len(self.gDOFEArr)))
+			self.oDOEdgeE.setText(str(self.gDOFESet))
+
+		# ############################################################################
 		def adjustEdgeN(self):
 		
 			try:
-				if self.gDOFEIndex + 1 > len(self.gDOFEArr) - 1:
-					self.gDOFEIndex = 0
-				else:
-					self.gDOFEIndex = self.gDOFEIndex + 1
-					
-				self.gDOFESet = self.gDOFEArr[self.gDOFEIndex]
-				self.aeIS.setText(str(self.gDOFEIndex+1) + " / " + str(len(self.gDOFEArr)))
-				self.oDOEdgeE.setText(str(self.gDOFESet))
-				
+				self.nextEdgeOffset()
 				self.showDowels()
 			
 			except:
@@ -1403,18 +1304,22 @@ def showQtGUI():
 			except:
 				self.faceinfo.setText(self.gNoSelection)
 			
+		def nextSink(self):
+			
+			if self.gDOFSIndex + 1 > len(self.gDOFSArr) - 1:
+				self.gDOFSIndex = 0
+			else:
+				self.gDOFSIndex = self.gDOFSIndex + 1
+				
+			self.gDOFSSet = self.gDOFSArr[self.gDOFSIndex]
+			self.asIS.setText(str(self.gDOFSIndex+1) + " / " + str(len(self.gDOFSArr)))
+			self.oDSinkE.setText(str(self.gDOFSSet))
+
+		# ############################################################################
 		def adjustSinkN(self):
 			
 			try:
-				if self.gDOFSIndex + 1 > len(self.gDOFSArr) - 1:
-					self.gDOFSIndex = 0
-				else:
-					self.gDOFSIndex = self.gDOFSIndex + 1
-					
-				self.gDOFSSet = self.gDOFSArr[self.gDOFSIndex]
-				self.asIS.setText(str(self.gDOFSIndex+1) + " / " + str(len(self.gDOFSArr)))
-				self.oDSinkE.setText(str(self.gDOFSSet))
-				
+				self.nextSink()
 				self.showDowels()
 			
 			except:
@@ -1436,16 +1341,20 @@ def showQtGUI():
 			except:
 				self.faceinfo.setText(self.gNoSelection)
 				
+		def nextRotation(self):
+			
+			if self.gRotationIndex + 1 > len(self.gRotationArr) - 1:
+				self.gRotationIndex = 0
+			else:
+				self.gRotationIndex = self.gRotationIndex + 1
+			
+			self.arIS.setText(str(self.gRotationIndex+1) + " / " + str(len(self.gRotationArr)))
+
+		# ############################################################################
 		def setRotationN(self):
 			
 			try:
-				if self.gRotationIndex + 1 > len(self.gRotationArr) - 1:
-					self.gRotationIndex = 0
-				else:
-					self.gRotationIndex = self.gRotationIndex + 1
-				
-				self.arIS.setText(str(self.gRotationIndex+1) + " / " + str(len(self.gRotationArr)))
-				
+				self.nextRotation()
 				self.showDowels()
 			
 			except:
@@ -1468,17 +1377,21 @@ def showQtGUI():
 			except:
 				self.faceinfo.setText(self.gNoSelection)
 			
+		def nextSides(self):
+			
+			if self.gSidesIndex + 1 > len(self.gSidesArr) - 1:
+				self.gSidesIndex = 0
+			else:
+				self.gSidesIndex = self.gSidesIndex + 1
+				
+			self.gSides = self.gSidesArr[self.gSidesIndex]
+			self.ssIS.setText(str(self.gSidesIndex+1) + " / " + str(len(self.gSidesArr)))
+
+		# ############################################################################
 		def selectSidesN(self):
 			
 			try:
-				if self.gSidesIndex + 1 > len(self.gSidesArr) - 1:
-					self.gSidesIndex = 0
-				else:
-					self.gSidesIndex = self.gSidesIndex + 1
-					
-				self.gSides = self.gSidesArr[self.gSidesIndex]
-				self.ssIS.setText(str(self.gSidesIndex+1) + " / " + str(len(self.gSidesArr)))
-				
+				self.nextSides()
 				self.showDowels()
 			
 			except:
@@ -1487,29 +1400,35 @@ def showQtGUI():
 		# ############################################################################	
 		def searchDowelInside(self):
 			
-			# try auto-reposition dowels
+			# try auto-reposition dowels, only settings are changed and the first 
+			# dowel position is calculated, the dowels are shown later only once
 			for r in range(len(self.gRotationArr)):
-				inside = self.gObj.Shape.BoundBox.isInside(self.gDowels[0].Placement.Base)
+				inside = self.gObj.Shape.BoundBox.isInside(self.getFirstDowel().Placement.Base)
 				if inside == True:
 					return
 				
 				for s in range(len(self.gDOFSArr)):
-					inside = self.gObj.Shape.BoundBox.isInside(self.gDowels[0].Placement.Base)
+					inside = self.gObj.Shape.BoundBox.isInside(self.getFirstDowel().Placement.Base)
 					if inside == True:
 						return
 					
 					for e in range(len(self.gDOFEArr)):
-						inside = self.gObj.Shape.BoundBox.isInside(self.gDowels[0].Placement.Base)
+						inside = self.gObj.Shape.BoundBox.isInside(self.getFirstDowel().Placement.Base)
 						if inside == True:
 							return
 				
-						self.adjustEdgeN()
-					self.adjustSinkN()
-				self.setRotationN()
+						self.nextEdgeOffset()
+					self.nextSink()
+				self.nextRotation()
 
 		# ############################################################################
 		def autodetectDowelsPosition(self):
 		
+			if self.gDNum < 1:
+				return
+			
+			start = [ self.gRotationIndex, self.gDOFSIndex, self.gDOFEIndex, self.gSides ]
+			
 			# first set dowels inside selected face
 			if not self.gCurrentSelection == 17:
 				self.searchDowelInside()
@@ -1530,21 +1449,16 @@ def showQtGUI():
 				# this will not be working (bug) but currently I do not see better solution, 
 				# let me know (open issue) if you know better solution
 				
-				for s in range(len(self.gDOFSArr)):
-					
-					fx = self.gFace.CenterOfMass.x
-					dx = self.gDowels[0].Shape.Faces[2].CenterOfMass.x
+				f = self.gFace.CenterOfMass
 				
-					fy = self.gFace.CenterOfMass.y
-					dy = self.gDowels[0].Shape.Faces[2].CenterOfMass.y
+				for s in range(len(self.gDOFSArr)):
 					
-					fz = self.gFace.CenterOfMass.z
-					dz = self.gDowels[0].Shape.Faces[2].CenterOfMass.z
+					d = self.getFirstDowel().Faces[2].CenterOfMass
 					
-					if MagicPanels.equal(fx, dx) or MagicPanels.equal(fy, dy) or MagicPanels.equal(fz, dz):
-						return
+					if MagicPanels.equal(f.x, d.x) or MagicPanels.equal(f.y, d.y) or MagicPanels.equal(f.z, d.z):
+						break
 					
-					self.adjustSinkN()
+					self.nextSink()
 			
 			# try adjust tenons
 			if self.gCurrentSelection == 17:
@@ -1557,37 +1471,35 @@ def showQtGUI():
 				self.gSides = self.gSidesArr[self.gSidesIndex]
 				self.ssIS.setText(str(self.gSidesIndex+1) + " / " + str(len(self.gSidesArr)))
 
-				for sink in range(len(self.gDOFSArr)):
-					for side in range(len(self.gSidesArr)):
-						for e in range(len(self.gDOFEArr)):
-							
-							x0 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[0].X
-							y0 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[0].Y
-							z0 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[0].Z
-							
-							x1 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[1].X
-							y1 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[1].Y
-							z1 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[1].Z
-							
-							x2 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[2].X
-							y2 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[2].Y
-							z2 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[2].Z
-							
-							x3 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[3].X
-							y3 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[3].Y
-							z3 = MagicPanels.touchTypo(self.gDowels[0].Shape.Faces[4])[3].Z
-							
-							inside0 = self.gObj.Shape.BoundBox.isInside(FreeCAD.Vector(x0, y0, z0))
-							inside1 = self.gObj.Shape.BoundBox.isInside(FreeCAD.Vector(x1, y1, z1))
-							inside2 = self.gObj.Shape.BoundBox.isInside(FreeCAD.Vector(x2, y2, z2))
-							inside3 = self.gObj.Shape.BoundBox.isInside(FreeCAD.Vector(x3, y3, z3))
-							
-							if inside0 == True and inside1 == True and inside2 == True and inside3 == True:
-								return
-					
-							self.adjustEdgeN()
-						self.selectSidesN()
-					self.adjustSinkN()
+				self.searchTenonInside()
+
+			# show dowels only once for found settings
+			if start != [ self.gRotationIndex, self.gDOFSIndex, self.gDOFEIndex, self.gSides ]:
+				self.showDowels()
+
+		# ############################################################################
+		def searchTenonInside(self):
+		
+			bb = self.gObj.Shape.BoundBox
+			
+			for sink in range(len(self.gDOFSArr)):
+				for side in range(len(self.gSidesArr)):
+					for e in range(len(self.gDOFEArr)):
+						
+						vertices = MagicPanels.touchTypo(self.getFirstDowel().Faces[4])
+						
+						inside = True
+						for v in vertices[0:4]:
+							if not bb.isInside(FreeCAD.Vector(v.X, v.Y, v.Z)):
+								inside = False
+								break
+						
+						if inside == True:
+							return
+				
+						self.nextEdgeOffset()
+					self.nextSides()
+				self.nextSink()
 
 		# ############################################################################
 		def setFaceSettins(self):
@@ -45,6 +45,9 @@ def showQtGUI():
 		# should not be reset if object change
 		gDBSides = 0
 		gDrillBits = []
+		gDrillBitsPool = [] # drill bits from previous preview to update
+		gDrillBitsNew = [] # drill bits created for current preview
+		gDrillBitsObj = "" # object for drill bits preview
 		gDBLabel = ""
 		gDBDiameter = 8
 		gDBDiameter2 = 10
@@ -494,7 +497,10 @@ def showQtGUI():
 
 			if self.gDBType == "Holes":
 
-				d = FreeCAD.ActiveDocument.addObject("Part::Cylinder","DrillBitHole")
+				[ d, isNew ] = MagicPanels.getPreviewObject(self.gDrillBitsPool, "Part::Cylinder", "DrillBitHole")
+				if isNew:
+					self.gDrillBitsNew.append(d)
+				
 				d.Label = str(self.gDBLabel)
 
 				d.Radius = self.gDBDiameter / 2
@@ -505,7 +511,10 @@ def showQtGUI():
 
 			if self.gDBType == "Countersinks":
 
-				d = FreeCAD.ActiveDocument.addObject("Part::Cone","DrillBitCountersink")
+				[ d, isNew ] = MagicPanels.getPreviewObject(self.gDrillBitsPool, "Part::Cone", "DrillBitCountersink")
+				if isNew:
+					self.gDrillBitsNew.append(d)
+				
 				d.Label = str(self.gDBLabel)
 
 				d.Radius1 = self.gDBDiameter / 2
@@ -518,7 +527,10 @@ def showQtGUI():
 
 			if self.gDBType == "Counterbores":
 
-				d = FreeCAD.ActiveDocument.addObject("Part::Cone","DrillBitCounterbore")
+				[ d, isNew ] = MagicPanels.getPreviewObject(self.gDrillBitsPool, "Part::Cone", "DrillBitCounterbore")
+				if isNew:
+					self.gDrillBitsNew.append(d)
+				
 				d.Label = str(self.gDBLabel)
 
 				d.Radius1 = self.gDBDiameter / 2
@@ -530,7 +542,10 @@ def showQtGUI():
 				
 			if self.gDBType == "Pocket holes":
 
-				d = FreeCAD.ActiveDocument.addObject("Part::Cone","DrillBitPocket")
+				[ d, isNew ] = MagicPanels.getPreviewObject(self.gDrillBitsPool, "Part::Cone", "DrillBitPocket")
+				if isNew:
+					self.gDrillBitsNew.append(d)
+				
 				d.Label = str(self.gDBLabel)
 
 				d.Radius1 = self.gDBDiameter / 2
@@ -550,18 +565,18 @@ def showQtGUI():
 		def showDrillBits(self):
 			
 			# ############################################################################
-			# remove all dowels
+			# reuse drill bits from previous preview, remove all if object changed
 			# ############################################################################
 			
-			if len(self.gDrillBits) != 0:
-				for d in self.gDrillBits:
-					try:
-						FreeCAD.activeDocument().removeObject(str(d.Name))
-					except:
-						skip = 1
-			
+			self.gDrillBitsPool = self.gDrillBits
+			self.gDrillBitsNew = []
 			self.gDrillBits = []
 			
+			if self.gDrillBitsObj != self.gObj:
+				MagicPanels.removePreviewObjects(self.gDrillBitsPool)
+			
+			self.gDrillBitsObj = self.gObj
+			
 			# get settings
 			[ v1, v2 ] = MagicPanels.getEdgeVertices(self.gEArr[self.gEIndex])
 			
@@ -774,8 +789,13 @@ def showQtGUI():
 			# set rotation at dowels
 			# ############################################################################
 
+			MagicPanels.removePreviewObjects(self.gDrillBitsPool)
+			
 			self.setRotation()
-			MagicPanels.moveToFirst(self.gDrillBits, self.gObj)
+			
+			# reused objects are never moved to container, see getPreviewObject
+			if len(self.gDrillBitsNew) > 0:
+				MagicPanels.moveToFirst(self.gDrillBitsNew, self.gObj)
 			
 		# ############################################################################
 		# actions - functions for actions
@@ -1366,16 +1386,16 @@ def showQtGUI():
 				# drilling selection
 				
 				if self.gDBType == "Holes":
-					holes = MagicPanels.makeHoles(self.gObj, self.gDrillFace, o )
+					holes = MagicPanels.makeHoles(self.gObj, self.gDrillFace, o, "batch" )
 
 				if self.gDBType == "Countersinks":
-					holes = MagicPanels.makeCountersinks(self.gObj, self.gDrillFace, o )
+					holes = MagicPanels.makeCountersinks(self.gObj, self.gDrillFace, o, "batch" )
 
 				if self.gDBType == "Counterbores":
-					holes = MagicPanels.makeCounterbores(self.gObj, self.gDrillFace, o )
+					holes = MagicPanels.makeCounterbores(self.gObj, self.gDrillFace, o, "batch" )
 
 				if self.gDBType == "Pocket holes":
-					holes = MagicPanels.makePocketHoles(self.gObj, self.gDrillFace, o )
+					holes = MagicPanels.makePocketHoles(self.gObj, self.gDrillFace, o, "batch" )
 
 				# get new object from selection
 				FreeCADGui.Selection.addSelection(holes[0])
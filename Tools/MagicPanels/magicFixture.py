@@ -396,14 +396,28 @@ def showQtGUI():
 			self.s4IS.setText(info)
 			
 			# ############################################################################
-			# remove all
+			# reuse link or clone from previous preview if it is the same type
 			# ############################################################################
 			
+			link = ""
+			
 			if self.gLink != "":
 				try:
-					FreeCAD.activeDocument().removeObject(str(self.gLink.Name))
+					if self.rb1.isChecked() == True and self.gLink.isDerivedFrom("App::Link"):
+						if self.gLink.LinkedObject == self.gBaseRef:
+							link = self.gLink
+					
+					if self.rb2.isChecked() == True and MagicPanels.isType(self.gLink, "Clone"):
+						if self.gLink.Objects[0] == self.gBaseRef:
+							link = self.gLink
 				except:
 					skip = 1
+				
+				if link == "":
+					try:
+						FreeCAD.activeDocument().removeObject(str(self.gLink.Name))
+					except:
+						skip = 1
 			
 			self.gLink = ""
 			
@@ -422,13 +436,13 @@ def showQtGUI():
 			# choose object type to set
 			# ############################################################################
 
-			if self.rb1.isChecked() == True:
+			if link == "" and self.rb1.isChecked() == True:
 				linkName = "Link_" + str(self.gBaseRef.Name)
 				link = FreeCAD.activeDocument().addObject('App::Link', linkName)
 				link.setLink(self.gBaseRef)
 				link.Label = "Link, " + self.gBaseRef.Label + " "
 
-			if self.rb2.isChecked() == True:
+			if link == "" and self.rb2.isChecked() == True:
 				import Draft
 				link = Draft.make_clone(self.gBaseRef)
 				link.Label = "Clone, " + self.gBaseRef.Label + " "
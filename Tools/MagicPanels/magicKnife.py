@@ -10,32 +10,34 @@ try:
 	if len(objects) < 2:
 		raise
 
-	i = 0
-	for o in objects:
+	with MagicPanels.batch("magicKnife"):
 		
-		i = i + 1
-		
-		if i == 1:
-			knife = o
-			knifeName = str(knife.Name)
-			knifeLabel = str(knife.Label)
-			continue
-
-		knifeCopy = FreeCAD.ActiveDocument.copyObject(knife)
-		knifeCopy.Label = MagicPanels.getNestingLabel(knife, "Knife")
-		
-		if not hasattr(knifeCopy, "BOM"):
-			info = translate("magicKnife", "Allows to skip this duplicated copy in BOM, cut-list report.")
-			knifeCopy.addProperty("App::PropertyBool", "BOM", "Woodworking", info)
-		
-		knifeCopy.BOM = False
-		
-		cut = FreeCAD.ActiveDocument.addObject("Part::Cut", "Cut")
-		cut.Base = o
-		cut.Tool = knifeCopy
-		cut.Label = MagicPanels.getNestingLabel(o, "Cut")
-		
-		FreeCAD.ActiveDocument.recompute()
+		i = 0
+		for o in objects:
+			
+			i = i + 1
+			
+			if i == 1:
+				knife = o
+				knifeName = str(knife.Name)
+				knifeLabel = str(knife.Label)
+				continue
+
+			knifeCopy = FreeCAD.ActiveDocument.copyObject(knife)
+			knifeCopy.Label = MagicPanels.getNestingLabel(knife, "Knife")
+			
+			if not hasattr(knifeCopy, "BOM"):
+				info = translate("magicKnife", "Allows to skip this duplicated copy in BOM, cut-list report.")
+				knifeCopy.addProperty("App::PropertyBool", "BOM", "Woodworking", info)
+			
+			knifeCopy.BOM = False
+			
+			cut = FreeCAD.ActiveDocument.addObject("Part::Cut", "Cut")
+			cut.Base = o
+			cut.Tool = knifeCopy
+			cut.Label = MagicPanels.getNestingLabel(o, "Cut")
+			
+			MagicPanels.recompute()
 	
 	FreeCADGui.Selection.clearSelection()
 
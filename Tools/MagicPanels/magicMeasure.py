@@ -18,6 +18,11 @@ gP2 = ""
 gRef = ""
 gPSMMode = True
 gPSMMeasure = []
+gPSMCache = dict()  # preselection measures cached per object and sub-element, until the shape is changed
+gPSMEvent = ""      # the latest preselection event [ doc, obj, sub ], waiting for the timer
+gPSMShown = ""      # key of the preselection measure currently shown
+gPSMNode = ""       # on-screen annotation node reused to draw preselection measures
+gPSMDelay = 16      # preselection events are coalesced to this delay in ms, about display refresh rate
 
 def resetGlobals():
 
@@ -28,8 +33,124 @@ def resetGlobals():
 	gRef = ""
 	gPSMMeasure = []
 
+def getPSMNode():
+	
+	global gPSMNode
+	
+	try:
+		view = FreeCADGui.ActiveDocument.ActiveView
+	except:
+		return ""
+	
+	if gPSMNode != "" and gPSMNode["view"] == view:
+		return gPSMNode
+	
+	freePSMNode()
+	
+	try:
+		from pivy import coin
+		
+		root = coin.SoSwitch()
+		root.whichChild = coin.SO_SWITCH_NONE
+		
+		annotation = coin.SoAnnotation()
+		
+		color = coin.SoBaseColor()
+		color.rgb = (1.0, 0.0, 0.0)
+		
+		style = coin.SoDrawStyle()
+		style.lineWidth = 2
+		
+		font = coin.SoFont()
+		font.size = 24
+		
+		coords = coin.SoCoordinate3()
+		lines = coin.SoLineSet()
+		labels = coin.SoSeparator()
+		
+		annotation.addChild(color)
+		annotation.addChild(style)
+		annotation.addChild(font)
+		annotation.addChild(coords)
+		annotation.addChild(lines)
+		annotation.addChild(labels)
+		root.addChild(annotation)
+		
+		view.getSceneGraph().addChild(root)
+		
+		gPSMNode = { "view": view, "root": root, "coords": coords, "lines": lines, "labels": labels }
+	
+	except:
+		gPSMNode = ""
+	
+	return gPSMNode
+
+def freePSMNode():
+	
+	global gPSMNode, gPSMShown
+	
+	if gPSMNode != "":
+		try:
+			gPSMNode["view"].getSceneGraph().removeChild(gPSMNode["root"])
+		except:
+			skip = 1
+	
+	gPSMNode = ""
+	gPSMShown = ""
+
+def showPSMMeasure(iMeasures, iRef):
+	
+	node = getPSMNode()
+	
+	# fallback, draw measures as document objects
+	if node == "":
+		removePSMMeasure()
+		for [ p1, p2, size ] in iMeasures:
+			m = MagicPanels.showMeasure(p1, p2, iRef)
+			gPSMMeasure.append(m)
+		return
+	
+	from pivy import coin
+	
+	points = []
+	for [ p1, p2, size ] in iMeasures:
+		points.append((p1.x, p1.y, p1.z))
+		points.append((p2.x, p2.y, p2.z))
+	
+	node["coords"].point.setNum(len(points))
+	node["coords"].point.setValues(0, len(points), points)
+	node["lines"].numVertices.setNum(len(iMeasures))
+	node["lines"].numVertices.setValues(0, len(iMeasures), [ 2 ] * len(iMeasures))
+	
+	node["labels"].removeAllChildren()
+	for [ p1, p2, size ] in iMeasures:
+		
+		m = (p1 + p2) * 0.5
+		
+		label = coin.SoSeparator()
+		position = coin.SoTranslation()
+		position.translation = (m.x, m.y, m.z)
+		text = coin.SoText2()
+		text.string = str(size)
+		
+		label.addChild(position)
+		label.addChild(text)
+		node["labels"].addChild(label)
+	
+	node["root"].whichChild = coin.SO_SWITCH_ALL
+
 def removePSMMeasure():
 	
+	global gPSMShown
+	
+	gPSMShown = ""
+	
+	if gPSMNode != "":
+		try:
+			gPSMNode["root"].whichChild = -1
+		except:
+			skip = 1
+	
 	if len(gPSMMeasure) != 0:
 		for h in gPSMMeasure:
 			try:
@@ -39,6 +160,8 @@ def removePSMMeasure():
 					FreeCAD.ActiveDocument.removeObject(str(h.Name))
 			except:
 				skip = 1
+		
+		del gPSMMeasure[:]
 
 def clearInfoScreens():
 	
@@ -59,23 +182,22 @@ def clearInfoScreens():
 
 class SelectionObserver:
 	
+	def __init__(self):
+		
+		# coalesce preselection events, only the latest one is measured
+		self.timer = QtCore.QTimer()
+		self.timer.setSingleShot(True)
+		self.timer.setInterval(gPSMDelay)
+		self.timer.timeout.connect(self.showPreselection)
+	
 	# ############################################################################
 	# preselect - preselection mode, use locals here
 	# ############################################################################
 
 	# ############################################################################
-	def edgePreselect(self, doc, obj, sub):
-		
-		removePSMMeasure()
-		clearInfoScreens()
+	def edgePreselect(self, o, sub):
 		
-		o = FreeCAD.ActiveDocument.getObject(obj)
-		label = obj
-		
-		try:
-			label = o.Label
-		except:
-			skip = 1
+		measures = []
 		
 		index = int(sub.replace("Edge",""))
 		edge = o.Shape.Edges[index-1]
@@ -89,16 +211,8 @@ class SelectionObserver:
 			p1 = FreeCAD.Vector(v1)
 			p2 = FreeCAD.Vector(v2)
 			
-			# show measure
 			size = round(p1.distanceToPoint(p2), MagicPanels.gRoundPrecision)
-			
-			gGUI.moi.setText(str(label) + ", " + str(sub))
-			gGUI.moi.setText(str(obj) + ", " + str(sub))
-			gGUI.mos.setPlainText("Size:" + " " + str(size))
-			
-			if gPSMMode == True:
-				m = MagicPanels.showMeasure(p1, p2, str(o.Label) + ", " + str(sub))
-				gPSMMeasure.append(m)
+			measures.append([ p1, p2, size ])
 			
 		# hole edge
 		if edge.Curve.isDerivedFrom("Part::GeomCircle"):
@@ -107,16 +221,8 @@ class SelectionObserver:
 			p2 = FreeCAD.Vector(edge.SubShapes[1].X, edge.SubShapes[1].Y, edge.SubShapes[1].Z)
 			[ p1, p2 ] = MagicPanels.getVerticesPosition([ p1, p2 ], o, "vector")
 			
-			# show measure
 			size = round(p1.distanceToPoint(p2), MagicPanels.gRoundPrecision)
-			
-			gGUI.moi.setText(str(label) + ", " + str(sub))
-			gGUI.moi.setText(str(obj) + ", " + str(sub))
-			gGUI.mos.setPlainText("Size:" + " " + str(size))
-			
-			if gPSMMode == True:
-				m = MagicPanels.showMeasure(p1, p2, str(o.Label) + ", " + str(sub))
-				gPSMMeasure.append(m)
+			measures.append([ p1, p2, size ])
 		
 		# ellipse edge
 		if edge.Curve.isDerivedFrom("Part::GeomEllipse"):
@@ -131,10 +237,7 @@ class SelectionObserver:
 			[ p1, p2 ] = MagicPanels.getVerticesPosition([ p1, p2 ], o, "vector")
 			
 			s1 = round(p1.distanceToPoint(p2), MagicPanels.gRoundPrecision)
-			
-			if gPSMMode == True:
-				m = MagicPanels.showMeasure(p1, p2, str(o.Label) + ", " + str(sub))
-				gPSMMeasure.append(m)
+			measures.append([ p1, p2, s1 ])
 	
 			# 2nd measure
 			p1 = FreeCAD.Vector(edge.Curve.Location.x, edge.Curve.Location.y, edge.Curve.Location.z)
@@ -144,32 +247,14 @@ class SelectionObserver:
 			[ p1, p2 ] = MagicPanels.getVerticesPosition([ p1, p2 ], o, "vector")
 			
 			s2 = round(p1.distanceToPoint(p2), MagicPanels.gRoundPrecision)
-			
-			if gPSMMode == True:
-				m = MagicPanels.showMeasure(p1, p2, str(o.Label) + ", " + str(sub))
-				gPSMMeasure.append(m)
-				
-			# screen update
-			
-			size = str(s1) + ", " + str(s2)
-	
-			gGUI.moi.setText(str(label) + ", " + str(sub))
-			gGUI.moi.setText(str(obj) + ", " + str(sub))
-			gGUI.mos.setPlainText("Size:" + " " + str(size))
-
-	# ############################################################################
-	def facePreselect(self, doc, obj, sub):
+			measures.append([ p1, p2, s2 ])
 		
-		removePSMMeasure()
-		clearInfoScreens()
-		
-		o = FreeCAD.ActiveDocument.getObject(obj)
-		label = obj
+		size = ", ".join([ str(m[2]) for m in measures ])
 		
-		try:
-			label = o.Label
-		except:
-			skip = 1
+		return [ size, measures ]
+
+	# ############################################################################
+	def facePreselect(self, o, sub):
 		
 		index = int(sub.replace("Face",""))
 		face = o.Shape.Faces[index-1]
@@ -177,6 +262,7 @@ class SelectionObserver:
 		edges = face.Edges
 		
 		size = ""
+		measures = []
 		preselection = dict()
 		
 		i = 0
@@ -199,15 +285,71 @@ class SelectionObserver:
 			
 			size += s
 			
-			if gPSMMode == True:
-				if not s in preselection.keys():
-					m = MagicPanels.showMeasure(p1, p2, str(o.Label) + ", " + str(sub))
-					gPSMMeasure.append(m)
-					preselection[s] = 1
+			if not s in preselection.keys():
+				measures.append([ p1, p2, val ])
+				preselection[s] = 1
+		
+		return [ size, measures ]
+	
+	# ############################################################################
+	def getPreselection(self, o, sub):
+		
+		# shape key changes after recompute or Placement change, 
+		# containers position is not stored at object so add it here
+		[ name, shapeKey ] = MagicPanels.getShapeKey(o)
+		shapeKey += ":" + str(MagicPanels.getContainersTransform(o)["position"])
+		
+		key = name + ":" + str(sub)
+		
+		if key in gPSMCache.keys() and gPSMCache[key][0] == shapeKey:
+			return [ key, gPSMCache[key][1], gPSMCache[key][2] ]
+		
+		if sub.find("Edge") != -1:
+			[ size, measures ] = self.edgePreselect(o, sub)
+		else:
+			[ size, measures ] = self.facePreselect(o, sub)
+		
+		gPSMCache[key] = [ shapeKey, size, measures ]
+		
+		return [ key, size, measures ]
+	
+	# ############################################################################
+	def showPreselection(self):
+		
+		global gPSMShown
+		
+		if gPSMEvent == "":
+			return
+		
+		[ doc, obj, sub ] = gPSMEvent
+		
+		try:
+			o = FreeCAD.ActiveDocument.getObject(obj)
+			label = o.Label
+			
+			[ key, size, measures ] = self.getPreselection(o, sub)
+		
+		except:
+			return
+		
+		# the same measure is already at screen
+		if key == gPSMShown:
+			return
+		
+		removePSMMeasure()
+		clearInfoScreens()
+		
+		# not supported edge type, faces without straight edges show info only
+		if len(measures) == 0 and sub.find("Edge") != -1:
+			return
 		
 		gGUI.moi.setText(str(label) + ", " + str(sub))
 		gGUI.moi.setText(str(obj) + ", " + str(sub))
 		gGUI.mos.setPlainText("Size:" + " " + str(size))
+		
+		if gPSMMode == True and len(measures) > 0:
+			showPSMMeasure(measures, str(label) + ", " + str(sub))
+			gPSMShown = key
 	
 	# ############################################################################
 	# select - selection mode, use globals here, to store first selection
@@ -392,11 +534,16 @@ class SelectionObserver:
 		#FreeCAD.Console.PrintMessage("\n")
 		#FreeCAD.Console.PrintMessage(sub)
 		
-		if sub.find("Edge") != -1:
-			self.edgePreselect(doc, obj, sub)
+		global gPSMEvent
 		
-		if sub.find("Face") != -1:
-			self.facePreselect(doc, obj, sub)
+		if sub.find("Edge") == -1 and sub.find("Face") == -1:
+			return
+		
+		# measure only the latest event, after the timer
+		gPSMEvent = [ doc, obj, sub ]
+		
+		if not self.timer.isActive():
+			self.timer.start()
 
 
 # ###################################################################################################################
@@ -704,6 +851,7 @@ def showQtGUI():
 			try:
 				if self.gObserver == "":
 					gGUI = self
+					gPSMCache.clear()
 					self.gObserver = SelectionObserver()
 					FreeCADGui.Selection.addObserver(self.gObserver)
 					
@@ -722,6 +870,7 @@ def showQtGUI():
 		def measureFinish(self):
 			
 			try:
+				self.gObserver.timer.stop()
 				FreeCADGui.Selection.removeObserver(self.gObserver)
 				self.gObserver = ""
 
@@ -770,12 +919,15 @@ def showQtGUI():
 	if form.result == userCancelled:
 		
 		try:
+			form.gObserver.timer.stop()
 			FreeCADGui.Selection.removeObserver(form.gObserver)
 			form.gObserver = ""
 		except:
 			skip = 1
 		
 		removePSMMeasure()
+		freePSMNode()
+		gPSMCache.clear()
 		
 		pass
 
@@ -89,6 +89,7 @@ def showQtGUI():
 		gCopyPathObj = ""
 		gCopyPathStep = 1
 		gCopyPathPoints = []
+		gCopyPathCurve = "" # object or edge for MagicPanels.getCurve
 		gCopyPathRotation = dict() # last rotation
 		gCopyPathLast = dict() # last path position
 		gCopyPathInit = dict() # if init from 0 or last selected panel
@@ -1080,9 +1081,10 @@ def showQtGUI():
 				inside = self.gCopyPathObj.Shape.isInside(v, 0, True)
 				
 				if inside:
-					self.gCopyPathLast[key] = self.gCopyPathPoints.index(v)
+					self.gCopyPathLast[key] = MagicPanels.getOnCurve(v, self.gCopyPathCurve)
 					self.gCopyPathInit[key] = False
-				else:
+				
+				if not inside or self.gCopyPathLast[key] == -1:
 					self.gCopyPathLast[key] = 0
 					self.gCopyPathInit[key] = True
 
@@ -1101,7 +1103,8 @@ def showQtGUI():
 				
 				if test1 or test2 or test3:
 					
-					self.gCopyPathPoints = self.gCopyPathObj.Shape.getPoints(1)[0]
+					self.gCopyPathCurve = self.gCopyPathObj
+					self.gCopyPathPoints = MagicPanels.getCurve(self.gCopyPathCurve)["points"]
 					self.pathL3.setText(self.gCopyPathObj.Label)
 					self.setLastPathPosition()
 				
@@ -1113,7 +1116,8 @@ def showQtGUI():
 					if sub.ShapeType != "Edge":
 						raise
 					
-					self.gCopyPathPoints = sub.getPoints(1)[0]
+					self.gCopyPathCurve = sub
+					self.gCopyPathPoints = MagicPanels.getCurve(self.gCopyPathCurve)["points"]
 					index = MagicPanels.getEdgeIndex(self.gCopyPathObj, sub)
 					self.pathL3.setText(self.gCopyPathObj.Label + ", Edge" + str(index))
 					self.setLastPathPosition()
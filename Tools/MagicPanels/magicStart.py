@@ -3250,11 +3250,14 @@ def showQtGUI():
 		# ############################################################################
 		def mergeF(self, iName, iType="F"):
 		
-			# merge
-			FreeCAD.ActiveDocument.mergeProject(self.getPathToMerge(iName, iType))
+			# merge, the file is loaded only once and later the objects are copied, see mergeTemplate
+			objects = MagicPanels.mergeTemplate(self.getPathToMerge(iName, iType))
 		
-			# recompute
-			FreeCAD.ActiveDocument.recompute()
+			# recompute only inserted objects, if merged by mergeProject all
+			if len(objects) > 0:
+				FreeCAD.ActiveDocument.recompute(objects)
+			else:
+				FreeCAD.ActiveDocument.recompute()
 
 		# ############################################################################
 		def getStartVertex(self, iEdge, iEdgePlane):
@@ -365,6 +365,47 @@ def showQtGUI():
 					
 				self.gObj.ViewObject.DiffuseColor = faceArr
 
+		# ############################################################################
+		def getFaceColors(self, iObj):
+
+			# copy of colors for each face, without writing to the object
+			colors = list(iObj.ViewObject.DiffuseColor)
+			
+			if len(colors) == 1:
+				colors = colors * len(iObj.Shape.Faces)
+			
+			return colors
+
+		# ############################################################################
+		def getFacesIndex(self, iObj):
+
+			# first face index for each face BoundBox, the same as getFaceIndex
+			index = dict()
+			
+			i = 1
+			for f in iObj.Shape.Faces:
+				key = str(f.BoundBox)
+				if key not in index:
+					index[key] = i
+
+				i = i + 1
+			
+			return index
+
+		# ############################################################################
+		def getSheetColors(self, iSheet, iRows):
+
+			# read B column only once for all objects
+			colors = dict()
+			
+			for i in range(1, iRows + 1):
+				try:
+					colors[i] = self.convertFromName(str(iSheet.get("B"+str(i))))
+				except:
+					skip = 1 # without color at exact sheet row
+			
+			return colors
+
 		# ############################################################################
 		def convertToRGB(self, iColor):
 			return int(255 * iColor)
@@ -512,30 +553,23 @@ def showQtGUI():
 							color = (c1, c2, c3, 0.0)
 							self.gObj.ViewObject.ShapeColor = color
 
-						# faces selected for object
+						# faces selected for object, set all faces and write colors once
 						else:
 
-							i = 0
-							for f in self.gFaceArr[o]:
+							c1 = self.convertToFreeCADColor( int(self.o1E.text()) )
+							c2 = self.convertToFreeCADColor( int(self.o2E.text()) )
+							c3 = self.convertToFreeCADColor( int(self.o3E.text()) )
 
-								# set current face for other functions
-								self.gFace = self.gFaceArr[o][i]
-								self.gFaceIndex = self.getFaceIndex()
+							color = self.getFaceColors(self.gObj)
+							facesIndex = self.getFacesIndex(self.gObj)
 							
-								if len(self.gObj.ViewObject.DiffuseColor) == 1:
-									self.resetFaces()
-
-								index = self.gFaceIndex
-								color = self.gObj.ViewObject.DiffuseColor
-
-								c1 = self.convertToFreeCADColor( int(self.o1E.text()) )
-								c2 = self.convertToFreeCADColor( int(self.o2E.text()) )
-								c3 = self.convertToFreeCADColor( int(self.o3E.text()) )
-
-								color[index-1] = (c1, c2, c3, 0.0)
-								self.gObj.ViewObject.DiffuseColor = color
+							for f in self.gFaceArr[o]:
+								
+								key = str(f.BoundBox)
+								if key in facesIndex:
+									color[facesIndex[key]-1] = (c1, c2, c3, 0.0)
 
-								i = i + 1
+							self.gObj.ViewObject.DiffuseColor = color
 
 					# get back base color
 					self.gObj = refObj
@@ -726,27 +760,36 @@ def showQtGUI():
 
 				FreeCAD.ActiveDocument.recompute()
 
-			# set colors from shpreadsheet
+			# read spreadsheet only once, for max number of faces
+			rows = 0
+			for obj in FreeCAD.ActiveDocument.Objects:
+				try:
+					rows = max(rows, len(obj.Shape.Faces))
+				except:
+					skipObject = 1 # spreadsheet, group
+			
+			sheetColors = self.getSheetColors(sheet, rows)
+			
+			# set colors from shpreadsheet, single colors write for each object
+			FreeCAD.ActiveDocument.openTransaction("colorManager")
+			
 			for obj in FreeCAD.ActiveDocument.Objects:
 				
 				try:
 					self.gObj = obj
-					self.resetFaces()
+					color = self.getFaceColors(self.gObj)
 
-					i = 1
-					for f in self.gObj.Shape.Faces:
-						
-						try:
-							faceColor = sheet.get("B"+str(i))
-							color = self.gObj.ViewObject.DiffuseColor
-							color[i-1] = self.convertFromName(str(faceColor))
-							self.gObj.ViewObject.DiffuseColor = color
-						except:
-							skipFace = 1 # without color at exact sheet row
-							
-						i = i + 1 # go to next face
+					faces = min(len(color), len(self.gObj.Shape.Faces))
+					for i in range(0, faces):
+						if i+1 in sheetColors:
+							color[i] = sheetColors[i+1]
+
+					self.gObj.ViewObject.DiffuseColor = color
+					
 				except:
 					skipObject = 1 # spreadsheet, group
+			
+			FreeCAD.ActiveDocument.commitTransaction()
 
 			self.s1S.setText(translate('colorManager', 'colors from faceColors'))
 
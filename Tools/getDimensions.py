@@ -176,6 +176,9 @@ gOBs = ""
 # currently parsed object called from main loop
 gCallerObj = ""
 
+# multiplicity of currently parsed object (arrays, patterns, transformations)
+gQty = 1
+
 # spreadsheet result init
 gSheet = gAD
 
@@ -262,6 +265,11 @@ dbARQ = dict() # quantity
 dbARN = dict() # names
 dbARV = dict() # values
 
+# init database for cache (valid only during single run)
+dbCO = dict() # objects shape-derived values
+dbCG = dict() # groups
+dbCU = dict() # units
+
 
 # ###################################################################################################################
 # Support for Qt GUI
@@ -912,11 +920,25 @@ def showError(iCaller, iObj, iPlace, iError):
 # ###################################################################################################################
 def getUnit(iValue, iType, iCaller="getUnit"):
 
+	# units and precision not change during single run, 
+	# so the conversion is needed only once for given value
+	vCU = str(iType) + ":" + str(iValue)
+	
+	if vCU in dbCU:
+		return dbCU[vCU]
+	
+	dbCU[vCU] = getUnitValue(iValue, iType, iCaller)
+	
+	return dbCU[vCU]
+
+
+# ###################################################################################################################
+def getUnitValue(iValue, iType, iCaller="getUnitValue"):
+
 	# for dimensions
 	if iType == "d":
 	
-		gFakeCube.Length = float(iValue)
-		v = gFakeCube.Length.getValueAs(gUnitC).Value
+		v = FreeCAD.Units.Quantity(float(iValue), FreeCAD.Units.Length).getValueAs(gUnitC).Value
 
 		if sUnitsMetric == "mm":
 			if sPDD == 0:
@@ -933,8 +955,7 @@ def getUnit(iValue, iType, iCaller="getUnit"):
 	# for edge
 	if iType == "edge":
 		
-		gFakeCube.Length = float(iValue)
-		v = gFakeCube.Length.getValueAs(gUnitC).Value
+		v = FreeCAD.Units.Quantity(float(iValue), FreeCAD.Units.Length).getValueAs(gUnitC).Value
 
 		if sUnitsEdge == "mm":
 			if sPDE == 0:
@@ -951,8 +972,7 @@ def getUnit(iValue, iType, iCaller="getUnit"):
 	# for area
 	if iType == "area":
 		
-		gFakeCube.Length = float(iValue)
-		v = gFakeCube.Length.getValueAs(gUnitC).Value
+		v = FreeCAD.Units.Quantity(float(iValue), FreeCAD.Units.Length).getValueAs(gUnitC).Value
 		
 		if sUnitsArea == "mm":
 			if sPDA == 0:
@@ -969,8 +989,9 @@ def getUnit(iValue, iType, iCaller="getUnit"):
 	# for to-angle conversion
 	if iType == "to-angle":
 		
-		gFakeCube.Placement.Rotation.Angle = float(iValue)
-		return str( int( gFakeCube.Placement.Rotation.getYawPitchRoll()[0] ) )
+		vRotation = FreeCAD.Rotation()
+		vRotation.Angle = float(iValue)
+		return str( int( vRotation.getYawPitchRoll()[0] ) )
 	
 	return -1
 
@@ -1031,47 +1052,54 @@ def switchApproximation(iA, iB, iCaller="switchApproximation"):
 	
 	
 # ###################################################################################################################
-def getApproximation(iObj, iCaller="getApproximation"):
-
-	init = 0
-	
-	minX = 0
-	minY = 0
-	minZ = 0
+def getExtents(iObj, iCaller="getExtents"):
 
-	maxX = 0
-	maxY = 0
-	maxZ = 0
+	# Cube BoundBox is the same as vertices range
+	if iObj.isDerivedFrom("Part::Box"):
+		b = iObj.Shape.BoundBox
+		return [ b.XMin, b.YMin, b.ZMin, b.XMax, b.YMax, b.ZMax ]
 
 	vs = getattr(iObj.Shape, "Vertex"+"es")
 
-	for v in vs:
-		
-		[ x, y, z ] = [ v.X, v.Y, v.Z ]
-		
-		if init == 0:
-			[ minX, minY, minZ ] = [ x, y, z ]
-			[ maxX, maxY, maxZ ] = [ x, y, z ]
-			init = 1
-		
-		if x > maxX:
-			maxX = x
-		
-		if y > maxY:
-			maxY = y
+	if len(vs) == 0:
+		return [ 0, 0, 0, 0, 0, 0 ]
 
-		if z > maxZ:
-			maxZ = z
+	# get all vertices at once and reduce them in single call
+	points = [ ( v.X, v.Y, v.Z ) for v in vs ]
 
-		if x < minX:
-			minX = x
+	try:
+		import numpy
 
-		if y < minY:
-			minY = y
+		points = numpy.array(points)
+		mins = points.min(axis=0)
+		maxs = points.max(axis=0)
+
+		return [ float(mins[0]), float(mins[1]), float(mins[2]), float(maxs[0]), float(maxs[1]), float(maxs[2]) ]
+
+	except ImportError:
+
+		[ xs, ys, zs ] = zip(*points)
+
+		return [ min(xs), min(ys), min(zs), max(xs), max(ys), max(zs) ]
+
+
+# ###################################################################################################################
+def getApproximation(iObj, iCaller="getApproximation"):
+
+	# Links, Clones and arrays may point to the same object
+	vCK = "a:" + getCacheKey(iObj, iCaller)
+	
+	if vCK not in dbCO:
+		dbCO[vCK] = getApproximationValues(iObj, iCaller)
+	
+	return dbCO[vCK]
+
+
+# ###################################################################################################################
+def getApproximationValues(iObj, iCaller="getApproximationValues"):
+
+	[ minX, minY, minZ, maxX, maxY, maxZ ] = getExtents(iObj, iCaller)
 
-		if z < minZ:
-			minZ = z
-		
 	s1 = switchApproximation(minX, maxX, iCaller)
 	s2 = switchApproximation(minY, maxY, iCaller)
 	s3 = switchApproximation(minZ, maxZ, iCaller)
@@ -1099,6 +1127,18 @@ def getApproximation(iObj, iCaller="getApproximation"):
 # ###################################################################################################################
 def getGroup(iObj, iCaller="getGroup"):
 
+	# the objects tree not change during single run
+	vCK = str(iObj.Name)
+	
+	if vCK not in dbCG:
+		dbCG[vCK] = getGroupLabel(iObj, iCaller)
+	
+	return dbCG[vCK]
+
+
+# ###################################################################################################################
+def getGroupLabel(iObj, iCaller="getGroupLabel"):
+
 	# init variable
 	vGroup = ""
 
@@ -1154,7 +1194,29 @@ def getGroup(iObj, iCaller="getGroup"):
 
 
 # ###################################################################################################################
-def getKey(iObj, iW, iH, iL, iType, iCaller="getKey"):
+def getCacheKey(iObj, iCaller="getCacheKey"):
+
+	# the same object can be reached many times via Links, Clones or arrays, 
+	# so the key should be object name and the object shape state
+	vCK = str(iObj.Name)
+	
+	try:
+		vCK += ":" + str(iObj.Placement)
+		vCK += ":" + str(iObj.Shape.hashCode())
+	except:
+		skip = 1
+	
+	return vCK
+
+
+# ###################################################################################################################
+def getCache(iObj, iW, iH, iL, iCaller="getCache"):
+
+	# set cache key for object and given dimensions
+	vCK = "d:" + getCacheKey(iObj, iCaller) + ":" + str(iW) + ":" + str(iH) + ":" + str(iL)
+
+	if vCK in dbCO:
+		return dbCO[vCK]
 
 	# set array with values
 	vKeyArr = [ iW, iH, iL ]
@@ -1171,11 +1233,11 @@ def getKey(iObj, iW, iH, iL, iType, iCaller="getKey"):
 	vKey += str(vKeyArr[2])
 
 	# key for name report
-	if iType == "d" and (sLTF == "n" or sLTF == "e" or sLTF == "d"):
+	if sLTF == "n" or sLTF == "e" or sLTF == "d":
 		vKey = str(vKey) + ":" + str(iObj.Label)
 
 	# key for group report
-	if iType == "d" and (sLTF == "g" or sLTF == "d"):
+	if sLTF == "g" or sLTF == "d":
 		
 		# get grandparent or parent group name
 		vGroup = getGroup(iObj, iCaller)
@@ -1185,63 +1247,65 @@ def getKey(iObj, iW, iH, iL, iType, iCaller="getKey"):
 		else:
 			vKey = str(vKey) + ":[...]"
 
-	# return thickness (this is value, not string)
-	if iType == "thick":
-		return vKeyArr[0]
+	vCache = dict()
+	vCache["sorted"] = vKeyArr
+	vCache["key"] = str(vKey)
+	vCache["thick"] = vKeyArr[0]
+
+	# area and edge size without thickness
+	vCache["area"] = vKeyArr[1] * vKeyArr[2]
+	vCache["edge"] = (2 * vKeyArr[1]) + (2 * vKeyArr[2])
+
+	dbCO[vCK] = vCache
 
-	return str(vKey)
+	return vCache
 
 
 # ###################################################################################################################
-def getArea(iObj, iW, iH, iL, iCaller="getArea"):
+def getKey(iObj, iW, iH, iL, iType, iCaller="getKey"):
 
-	# make sure to not calculate thickness
-	vT = getKey(iObj, iW, iH, iL, "thick", iCaller)
+	vCache = getCache(iObj, iW, iH, iL, iCaller)
 
-	if iL == vT:
-		vD1 = iW
-		vD2 = iH
-	
-	elif iW == vT:
-		vD1 = iL
-		vD2 = iH
+	# return thickness (this is value, not string)
+	if iType == "thick":
+		return vCache["thick"]
+
+	# key for report
+	if iType == "d":
+		return vCache["key"]
+
+	vKeyArr = vCache["sorted"]
 	
-	else:
-		vD1 = iL
-		vD2 = iW
+	return str(vKeyArr[0]) + ":" + str(vKeyArr[1]) + ":" + str(vKeyArr[2])
 
-	# calculate area without thickness
-	vArea = vD1 * vD2
 
-	return vArea
+# ###################################################################################################################
+def getArea(iObj, iW, iH, iL, iCaller="getArea"):
+
+	# calculate area without thickness
+	return getCache(iObj, iW, iH, iL, iCaller)["area"]
 
 
 # ###################################################################################################################
 def getEdge(iObj, iW, iH, iL, iCaller="getEdge"):
 
-	# skip the thickness dimension
-	vT = getKey(iObj, iW, iH, iL, "thick", iCaller)
-
-	if iL == vT:
-		vD1 = iW
-		vD2 = iH
+	# calculate the edge size without thickness
+	return getCache(iObj, iW, iH, iL, iCaller)["edge"]
 
-	elif iW == vT:
-		vD1 = iL
-		vD2 = iH
 
-	else:
-		vD1 = iL
-		vD2 = iW
+# ###################################################################################################################
+def getEdgeBand(iObj, iW, iH, iL, iCaller="getEdgeBand"):
 
-	# calculate the edge size
-	vEdge = (2 * vD1) + (2 * vD2)
+	vCache = getCache(iObj, iW, iH, iL, iCaller)
 
-	return vEdge
+	if "edgeband" not in vCache:
+		vCache["edgeband"] = getEdgeBandValues(iObj, vCache, iCaller)
+	
+	return vCache["edgeband"]
 
 
 # ###################################################################################################################
-def getEdgeBand(iObj, iW, iH, iL, iCaller="getEdgeBand"):
+def getEdgeBandValues(iObj, iCache, iCaller="getEdgeBandValues"):
 
 	try:
 
@@ -1273,15 +1337,14 @@ def getEdgeBand(iObj, iW, iH, iL, iCaller="getEdgeBand"):
 				vFaceEdge = iObj.Shape.Faces[i].Length
 	
 				# get the thickness dimension
-				vT = getKey(iObj, iW, iH, iL, "thick", iCaller)
+				vT = iCache["thick"]
 	
 				# if you know the thickness you can 
 				# calculate the edge for the face
 				vEdge = ( vFaceEdge - (2 * vT)) / 2
 
-				# sort thickness
-				a = [ iW, iH, iL ]
-				a.sort()
+				# sorted dimensions
+				a = iCache["sorted"]
 
 				# check if this is correct edge
 				if int(vEdge) == int(a[1]) or int(vEdge) == int(a[2]):
@@ -1354,56 +1417,59 @@ def setDB(iObj, iW, iH, iL, iCaller="setDB"):
 		dbFCH[iObj.Label] = iH
 		dbFCL[iObj.Label] = iL
 
+		# get shape-derived values for object
+		vCache = getCache(iObj, iW, iH, iL, iCaller)
+
 		# get area for object
-		vArea = getArea(iObj, iW, iH, iL, iCaller) 
+		vArea = vCache["area"]
 	
 		# get key  for object
-		vKey = getKey(iObj, iW, iH, iL, "d", iCaller)
+		vKey = vCache["key"]
 	
 		# set dimensions db for quantity & area
 		if vKey in dbDQ:
 	
-			dbDQ[vKey] = dbDQ[vKey] + 1
-			dbDA[vKey] = dbDA[vKey] + vArea
+			dbDQ[vKey] = dbDQ[vKey] + gQty
+			dbDA[vKey] = dbDA[vKey] + ( vArea * gQty )
 		else:
 	
-			dbDQ[vKey] = 1
-			dbDA[vKey] = vArea
+			dbDQ[vKey] = gQty
+			dbDA[vKey] = vArea * gQty
 
 		# get key  for object (convert value to dimension string)
-		vKeyT = str(getKey(iObj, iW, iH, iL, "thick", iCaller))
+		vKeyT = str(vCache["thick"])
 	
 		# set thickness db for quantity & area
 		if vKeyT in dbTQ:
 	
-			dbTQ[vKeyT] = dbTQ[vKeyT] + 1
-			dbTA[vKeyT] = dbTA[vKeyT] + vArea
+			dbTQ[vKeyT] = dbTQ[vKeyT] + gQty
+			dbTA[vKeyT] = dbTA[vKeyT] + ( vArea * gQty )
 		else:
 	
-			dbTQ[vKeyT] = 1
-			dbTA[vKeyT] = vArea
+			dbTQ[vKeyT] = gQty
+			dbTA[vKeyT] = vArea * gQty
 
 		# check visibility for edge if visibility feature is "edge"
 		# if visibility feature is "on" the whole object is skipped
 		# so never run this part for such object
 		vSkip = 0
 		if sTVF == "edge":
-			if FreeCADGui.ActiveDocument.getObject(iObj.Name).Visibility == False:
+			if iObj.Visibility == False:
 				vSkip = 1
 
 		# if object is not visible not calculate the edge
 		if vSkip == 0:
 
 			# set edge db for total edge size
-			vEdge = getEdge(iObj, iW, iH, iL, iCaller)
-			dbE["total"] = dbE["total"] + vEdge
+			vEdge = vCache["edge"]
+			dbE["total"] = dbE["total"] + ( vEdge * gQty )
 
-			# if color faces, not whole object color
-			if len(iObj.ViewObject.DiffuseColor) != 1:
+			# if color faces, not whole object color (no colors without GUI)
+			if iObj.ViewObject != None and len(iObj.ViewObject.DiffuseColor) != 1:
 				
 				# set edge db for edgeband edge size & faces
 				vEdge , dbEFN[vKey], dbEFD[vKey], dbEFV[vKey] = getEdgeBand(iObj, iW, iH, iL, iCaller)
-				dbE["edgeband"] = dbE["edgeband"] + vEdge
+				dbE["edgeband"] = dbE["edgeband"] + ( vEdge * gQty )
 
 			# set edge db for empty edge size
 			dbE["empty"] = dbE["total"] - dbE["edgeband"]
@@ -1430,11 +1496,11 @@ def setDBApproximation(iObj, iCaller="setDBApproximation"):
 		# set dimensions db
 		if vKey in dbDQ:
 			
-			dbDQ[vKey] = dbDQ[vKey] + 1
+			dbDQ[vKey] = dbDQ[vKey] + gQty
 			
 		else:
 		
-			dbDQ[vKey] = 1
+			dbDQ[vKey] = gQty
 
 	except:
 
@@ -1459,13 +1525,13 @@ def setDBConstraints(iObj, iL, iN, iV, iHoleObj, iCaller="setDBConstraints"):
 		if vKey in dbCNQ:
 
 			# increase quantity only
-			dbCNQ[vKey] = dbCNQ[vKey] + 1
+			dbCNQ[vKey] = dbCNQ[vKey] + gQty
 
 			# show only one object at report
 			return 0
 			
 		# init quantity
-		dbCNQ[vKey] = 1
+		dbCNQ[vKey] = gQty
 
 		# add object with no empty constraints names
 		dbCNO.append(iObj)
@@ -1520,13 +1586,13 @@ def setDBAllConstraints(iObj, iL, iN, iV, iCaller="setDBAllConstraints"):
 		if vKey in dbCNQ:
 
 			# increase quantity only
-			dbCNQ[vKey] = dbCNQ[vKey] + 1
+			dbCNQ[vKey] = dbCNQ[vKey] + gQty
 
 			# show only one object at report
 			return 0
 			
 		# init quantity
-		dbCNQ[vKey] = 1
+		dbCNQ[vKey] = gQty
 
 		# set names and values
 		dbCNN[vKey] = str(":".join(map(str, iN)))
@@ -1575,7 +1641,7 @@ def setDBAdditional(iObj, iType, iN, iV, iKey="", iCaller="setDBAdditional"):
 		if vKey in dbARQ:
 	
 			# increase quantity only
-			dbARQ[vKey] = dbARQ[vKey] + 1
+			dbARQ[vKey] = dbARQ[vKey] + gQty
 	
 			# show only one object at report if there is no custom key
 			# update existing entry if there is custom key
@@ -1587,7 +1653,7 @@ def setDBAdditional(iObj, iType, iN, iV, iKey="", iCaller="setDBAdditional"):
 				dbARV[vKey] = vV
 				return 0
 		
-		dbARQ[vKey] = 1
+		dbARQ[vKey] = gQty
 		
 		# set names and values
 		dbARN[vKey] = str(":".join(map(str, iN)))
@@ -2386,27 +2452,23 @@ def setDraftArray(iObj, iCaller="setDraftArray"):
 			# if array on array add base too
 			if key.isDerivedFrom("Part::FeaturePython") and key.Name.startswith("Array"):
 				
-				k = 0
-				while k < vArray:
-					setDraftArray(key, "self")
-					k = k + 1
+				# evaluate the base array only once, with multiplied quantity
+				if vArray > 0:
+					vQty = setQty(vArray)
+					try:
+						setDraftArray(key, "self")
+					finally:
+						resetQty(vQty)
 			
 			# array on Compound
 			elif key.isDerivedFrom("Part::Compound"):
 				
-				for c in key.Links:
-					k = 0
-					while k < vArray:
-						scanObjects([ c ], iCaller)
-						k = k + 1
+				scanObjectsQty(key.Links, vArray, iCaller)
 				
 			# single array
 			else:
 			
-				k = 0
-				while k < vArray:
-					scanObjects([ key ], iCaller)
-					k = k + 1
+				scanObjectsQty([ key ], vArray, iCaller)
 
 		except:
 			
@@ -2496,18 +2558,13 @@ def setPartDesignLinearPattern(iObj, iCaller="setPartDesignLinearPattern"):
 			# set number of occurrences
 			oc = iObj.Occurrences
 
-			k = 0
 			if oc > 0:
 				
-				# loop for each occurrence without base element
-				while k < oc - 1:
-
-					# set reference object (only one is supported for now)
-					key = iObj.Originals[0]
+				# set reference object (only one is supported for now)
+				key = iObj.Originals[0]
 
-					# select furniture part
-					scanObjects([ key ], iCaller)
-					k = k + 1
+				# select furniture part for each occurrence without base element
+				scanObjectsQty([ key ], oc - 1, iCaller)
 		except:
 
 			# if there is wrong structure
@@ -2555,15 +2612,8 @@ def setPartDesignMultiTransform(iObj, iCaller="setPartDesignMultiTransform"):
 			# calculate number of base elements
 			lenT = (linear * mirror) - 1
 
-			# for number off transformations
-			k = 0
-			while k < lenT:
-
-				# select furniture part for all objects
-				for key in iObj.Originals:
-					scanObjects([ key ], iCaller)
-
-				k = k + 1
+			# select furniture part for all objects, for number off transformations
+			scanObjectsQty(iObj.Originals, lenT, iCaller)
 
 		except:
 
@@ -2662,6 +2712,43 @@ def getInheritedVisibility(iObj, iCaller="getInheritedVisibility"):
 	return v
 
 
+# ###################################################################################################################
+def setQty(iQty, iCaller="setQty"):
+
+	global gQty
+
+	# multiply quantity for all objects scanned until reset, return previous value
+	vQty = gQty
+	gQty = gQty * iQty
+
+	return vQty
+
+
+# ###################################################################################################################
+def resetQty(iQty, iCaller="resetQty"):
+
+	global gQty
+
+	gQty = iQty
+
+
+# ###################################################################################################################
+def scanObjectsQty(iOBs, iQty, iCaller="scanObjectsQty"):
+
+	# scan objects only once but count them iQty times, 
+	# instead of calling scanner for each copy
+	if iQty <= 0:
+		return 0
+
+	vQty = setQty(iQty, iCaller)
+	try:
+		scanObjects(iOBs, iCaller)
+	finally:
+		resetQty(vQty, iCaller)
+
+	return 0
+
+
 # ###################################################################################################################
 def scanObjects(iOBs, iCaller="main"):
 	
@@ -4240,13 +4327,6 @@ def selectView(iCaller="selectView"):
 	global gSheet
 	global gSheetRow
 
-	# remove spreadsheet if exists
-	if gAD.getObject("toCut"):
-		gAD.removeObject("toCut")
-
-	# create empty spreadsheet
-	gSheet = gAD.addObject("Spreadsheet::Sheet","toCut")
-
 	# main report - quantity
 	if sLTF == "q":
 		setViewQ(iCaller)
@@ -4379,6 +4459,415 @@ def setTechDraw(iCaller="setTechDraw"):
 		gPrintSheet.CellEnd = "G" + str(gSheetRow)
 
 
+# ###################################################################################################################
+# Report writer
+# ###################################################################################################################
+
+
+# ###################################################################################################################
+def getColumnIndex(iColumn, iCaller="getColumnIndex"):
+
+	# column letters to number, A = 1, Z = 26, AA = 27, no limit for columns
+	vIndex = 0
+	for c in iColumn:
+		vIndex = ( vIndex * 26 ) + ( ord(c) - 64 )
+
+	return vIndex
+
+
+# ###################################################################################################################
+def getColumnName(iIndex, iCaller="getColumnName"):
+
+	# column number to letters, 1 = A, 26 = Z, 27 = AA, no limit for columns
+	vName = ""
+	while iIndex > 0:
+		iIndex, r = divmod(iIndex - 1, 26)
+		vName = chr(65 + r) + vName
+
+	return vName
+
+
+# ###################################################################################################################
+def getCellPosition(iCell, iCaller="getCellPosition"):
+
+	# split cell address "AB12" into row and column numbers
+	i = 0
+	while not iCell[i].isdigit():
+		i = i + 1
+
+	return [ int(iCell[i:]), getColumnIndex(iCell[:i]) ]
+
+
+# ###################################################################################################################
+def getRangeCells(iRange, iCaller="getRangeCells"):
+
+	# all cells addresses for range "A1:G5" or single cell "A1"
+	arr = iRange.split(":")
+	[ r1, c1 ] = getCellPosition(arr[0])
+	[ r2, c2 ] = getCellPosition(arr[len(arr)-1])
+
+	vCells = []
+	for r in range(min(r1, r2), max(r1, r2) + 1):
+		for c in range(min(c1, c2), max(c1, c2) + 1):
+			vCells.append(getColumnName(c) + str(r))
+
+	return vCells
+
+
+# ###################################################################################################################
+def getRanges(iCells, iCaller="getRanges"):
+
+	# group cells with the same value into as few rectangle ranges as possible, 
+	# first into runs of columns for each row, next the same runs for next rows
+
+	vRows = dict()
+	for cell, value in iCells.items():
+		[ r, c ] = getCellPosition(cell)
+		if r not in vRows:
+			vRows[r] = []
+		vRows[r].append([ c, value ])
+
+	vOpen = dict()
+	vRanges = []
+
+	for r in sorted(vRows.keys()):
+
+		# runs of the same value for row
+		vRuns = []
+		for [ c, value ] in sorted(vRows[r], key=lambda x: x[0]):
+			if len(vRuns) > 0 and vRuns[-1][1] == c - 1 and vRuns[-1][2] == value:
+				vRuns[-1][1] = c
+			else:
+				vRuns.append([ c, c, value ])
+
+		# continue rectangles from previous row or start new ones
+		vNext = dict()
+		for [ c1, c2, value ] in vRuns:
+			k = ( c1, c2, str(value) )
+			if k in vOpen and vOpen[k][1] == r - 1:
+				vOpen[k][1] = r
+				vNext[k] = vOpen.pop(k)
+			else:
+				vNext[k] = [ r, r, value ]
+
+		for k, rect in vOpen.items():
+			vRanges.append([ k[0], k[1], rect[0], rect[1], rect[2] ])
+
+		vOpen = vNext
+
+	for k, rect in vOpen.items():
+		vRanges.append([ k[0], k[1], rect[0], rect[1], rect[2] ])
+
+	vResult = []
+	for [ c1, c2, r1, r2, value ] in vRanges:
+		vRange = getColumnName(c1) + str(r1) + ":" + getColumnName(c2) + str(r2)
+		vResult.append([ vRange, value ])
+
+	return vResult
+
+
+# ###################################################################################################################
+class SheetRecord():
+
+	# in-memory spreadsheet, supports the Spreadsheet::Sheet functions used by views, 
+	# it keeps only the final content, styles, spans and colors for each cell, 
+	# so the real spreadsheet can be written later with few bulk operations
+
+	def __init__(self):
+		self.cells = dict()
+		self.merged = []
+		self.styles = dict()
+		self.alignment = dict()
+		self.background = dict()
+		self.foreground = dict()
+		self.widths = dict()
+
+	def set(self, iCell, iValue):
+		for c in getRangeCells(iCell):
+			self.cells[c] = iValue
+
+	def mergeCells(self, iRange):
+		if iRange not in self.merged:
+			self.merged.append(iRange)
+
+	def setStyle(self, iRange, iStyle, iMode):
+		for c in getRangeCells(iRange):
+			if iMode == "add" and c in self.styles:
+				vStyles = set(self.styles[c].split("|"))
+				vStyles.update(iStyle.split("|"))
+				self.styles[c] = "|".join(sorted(vStyles))
+			else:
+				self.styles[c] = iStyle
+
+	def setAlignment(self, iRange, iAlignment, iMode):
+		for c in getRangeCells(iRange):
+			self.alignment[c] = iAlignment
+
+	def setBackground(self, iRange, iColor):
+		for c in getRangeCells(iRange):
+			self.background[c] = tuple(iColor)
+
+	def setForeground(self, iRange, iColor):
+		for c in getRangeCells(iRange):
+			self.foreground[c] = tuple(iColor)
+
+	def setColumnWidth(self, iColumn, iWidth):
+		self.widths[iColumn] = iWidth
+
+	def apply(self, iSheet, iDoc):
+
+		# not recompute spreadsheet for each change, if supported by FreeCAD version
+		try:
+			vFrozen = iDoc.RecomputesFrozen
+			iDoc.RecomputesFrozen = True
+		except:
+			vFrozen = ""
+
+		try:
+			for [ r, v ] in getRanges(self.cells):
+				iSheet.set(r, v)
+
+			for r in self.merged:
+				iSheet.mergeCells(r)
+
+			for [ r, v ] in getRanges(self.styles):
+				iSheet.setStyle(r, v, "add")
+
+			for [ r, v ] in getRanges(self.alignment):
+				iSheet.setAlignment(r, v, "keep")
+
+			for [ r, v ] in getRanges(self.background):
+				iSheet.setBackground(r, v)
+
+			for [ r, v ] in getRanges(self.foreground):
+				iSheet.setForeground(r, v)
+
+			for c in self.widths.keys():
+				iSheet.setColumnWidth(c, self.widths[c])
+
+		finally:
+			if vFrozen != "":
+				iDoc.RecomputesFrozen = vFrozen
+
+
+# ###################################################################################################################
+def setSheet(iReport, iCaller="setSheet"):
+
+	global gSheet
+	global gSheetRow
+
+	# remove spreadsheet if exists
+	if gAD.getObject("toCut"):
+		gAD.removeObject("toCut")
+
+	# create empty spreadsheet
+	gSheet = gAD.addObject("Spreadsheet::Sheet","toCut")
+	gSheetRow = iReport["rows"]
+
+	# write recorded report in bulk, as single undo step
+	gAD.openTransaction("getDimensions")
+	try:
+		iReport["sheet"].apply(gSheet, gAD)
+	finally:
+		gAD.commitTransaction()
+
+
+# ###################################################################################################################
+# Headless API
+# ###################################################################################################################
+
+
+# settings names, the values are taken from Default Settings or Qt GUI
+gSettings = ( 
+	"sLang", "sRPQ", "sTVF", "sPartCut", "sLTF", 
+	"sUnitsMetric", "sUnitsArea", "sUnitsEdge", "sPDD", "sPDE", "sPDA", "sEColor", 
+	"sARME", "sARM", "sARP", "sARD", "sARGD", "sATS", "sAEI" 
+)
+
+
+# ###################################################################################################################
+def getSettings(iCaller="getSettings"):
+
+	vSettings = dict()
+	for k in gSettings:
+		vSettings[k] = globals()[k]
+
+	return vSettings
+
+
+# default settings snapshot, each engine starts from it and not from the globals 
+# changed by other engine or Qt GUI
+gSettingsDefault = getSettings()
+
+
+# ###################################################################################################################
+def initDB(iCaller="initDB"):
+
+	db = dict()
+
+	db["dbFCO"] = []
+	db["dbFCW"] = dict()
+	db["dbFCH"] = dict()
+	db["dbFCL"] = dict()
+
+	db["dbDQ"] = dict()
+	db["dbDA"] = dict()
+
+	db["dbTQ"] = dict()
+	db["dbTA"] = dict()
+
+	db["dbE"] = dict()
+	db["dbE"]["total"] = 0
+	db["dbE"]["empty"] = 0
+	db["dbE"]["edgeband"] = 0
+
+	db["dbEFN"] = dict()
+	db["dbEFD"] = dict()
+	db["dbEFV"] = dict()
+
+	db["dbCNO"] = []
+	db["dbCNQ"] = dict()
+	db["dbCNN"] = dict()
+	db["dbCNV"] = dict()
+	db["dbCNL"] = dict()
+	db["dbCNH"] = dict()
+	db["dbCNOH"] = dict()
+
+	db["dbARQ"] = dict()
+	db["dbARN"] = dict()
+	db["dbARV"] = dict()
+
+	db["dbCO"] = dict()
+	db["dbCG"] = dict()
+	db["dbCU"] = dict()
+
+	return db
+
+
+# ###################################################################################################################
+class CutListEngine():
+
+	# Cut-list engine without GUI, Fake Cube and recompute. 
+	# It can be used many times in single FreeCAD or FreeCADCmd session, for example:
+	#
+	#	import getDimensions
+	#
+	#	doc = FreeCAD.openDocument("kitchen.FCStd")
+	#	engine = getDimensions.CutListEngine(doc, { "sLTF": "n", "sUnitsMetric": "m" })
+	#	db = engine.scan()
+	#	report = engine.report()
+	#
+	# scan() returns databases dictionary, for example db["dbDQ"] for quantity.
+	# report() returns recorded spreadsheet with final values for each cell: "cells", "styles", 
+	# "alignment", "background", "foreground", also "merged" ranges, column "widths" and "rows".
+	#
+	# Note: the engine is not reentrant. During scan() and report() the module functions work 
+	# on module globals set to this engine state, the globals are restored after the call, 
+	# so do not run many engines at the same time, for example from threads.
+
+	def __init__(self, iDoc="", iSettings=dict()):
+
+		if iDoc == "":
+			iDoc = FreeCAD.ActiveDocument
+		
+		self.doc = iDoc
+		self.settings = dict(gSettingsDefault)
+		self.settings.update(iSettings)
+		self.db = initDB()
+		self.scanned = False
+
+	def bind(self):
+
+		global gAD, gOBs, gCallerObj, gQty, gSheet, gSheetRow
+
+		# store globals to restore them after the call
+		vKeys = list(self.settings.keys()) + list(self.db.keys())
+		vKeys += [ "gAD", "gOBs", "gCallerObj", "gQty", "gSheet", "gSheetRow" ]
+		
+		vSaved = dict()
+		for k in vKeys:
+			if k in globals():
+				vSaved[k] = globals()[k]
+
+		# module functions work on globals, so set them to this engine state
+		globals().update(self.settings)
+		globals().update(self.db)
+
+		gAD = self.doc
+		gOBs = self.doc.Objects
+		gCallerObj = ""
+		gQty = 1
+		gSheet = ""
+		gSheetRow = 1
+
+		initLang()
+
+		return [ vKeys, vSaved ]
+
+	def unbind(self, iSaved):
+
+		[ vKeys, vSaved ] = iSaved
+
+		# restore globals from before bind
+		for k in vKeys:
+			if k in vSaved:
+				globals()[k] = vSaved[k]
+			else:
+				globals().pop(k, None)
+
+	def scan(self, iObjects=""):
+
+		self.db = initDB()
+		vSaved = self.bind()
+
+		if iObjects == "":
+			iObjects = self.doc.Objects
+
+		# main loop for calculations
+		try:
+			scanObjects(iObjects, "main")
+		finally:
+			self.unbind(vSaved)
+
+		self.scanned = True
+
+		return self.db
+
+	def report(self, iView=""):
+
+		global gSheet, gSheetRow
+
+		if iView != "":
+			self.settings["sLTF"] = iView
+			self.scanned = False
+
+		if self.scanned == False:
+			self.scan()
+
+		vSaved = self.bind()
+		
+		try:
+			# set views to in-memory spreadsheet
+			gSheet = SheetRecord()
+			selectView("main")
+
+			vReport = dict()
+			vReport["view"] = self.settings["sLTF"]
+			vReport["rows"] = gSheetRow
+			vReport["cells"] = gSheet.cells
+			vReport["merged"] = gSheet.merged
+			vReport["styles"] = gSheet.styles
+			vReport["alignment"] = gSheet.alignment
+			vReport["background"] = gSheet.background
+			vReport["foreground"] = gSheet.foreground
+			vReport["widths"] = gSheet.widths
+			vReport["sheet"] = gSheet
+		finally:
+			self.unbind(vSaved)
+
+		return vReport
+
+
 # ###################################################################################################################
 # INIT - check status
 # ###################################################################################################################
@@ -4398,7 +4887,7 @@ def checkStatus():
 	
 		gAD = FreeCAD.ActiveDocument
 		
-		# remove existing Fake Cube object if exists (auto clean after error)
+		# remove Fake Cube object if exists (auto clean after older versions)
 		if gAD.getObject("gFakeCube"):
 			gAD.removeObject("gFakeCube")
 		
@@ -4427,38 +4916,33 @@ def checkStatus():
 # MAIN
 # ###################################################################################################################
 
-# check if there is active document and init
-checkStatus()
+# the Qt GUI front-end runs only with FreeCAD GUI, 
+# for FreeCADCmd import this module and use CutListEngine
+if FreeCAD.GuiUp:
 
-# show Qt GUI
-if sQT == "yes":
-	showQtGUI()
+	# check if there is active document and init
+	checkStatus()
 
-# if Qt GUI ok button
-if gExecute == "yes":
+	# show Qt GUI
+	if sQT == "yes":
+		showQtGUI()
 
-	# create Fake Cube but not call recompute
-	gFakeCube = gAD.addObject("Part::Box", "gFakeCube")
+	# if Qt GUI ok button
+	if gExecute == "yes":
 
-	# set language
-	initLang()
+		# scan objects and create report with settings from Qt GUI
+		gEngine = CutListEngine(gAD, getSettings())
+		gEngine.scan(gOBs)
+		gReport = gEngine.report()
 
-	# main loop for calculations
-	scanObjects(gOBs, "main")
+		# write report to spreadsheet
+		setSheet(gReport, "main")
 
-	# select and set view
-	selectView("main")
+		# set TechDraw page
+		setTechDraw("main")
 
-	# set TechDraw page
-	setTechDraw("main")
-
-	# remove existing fake Cube object before recompute
-	if gAD.getObject("gFakeCube"):
-		gAD.removeObject("gFakeCube")
-
-	# reload to see changes
-	gAD.recompute()
+		# reload to see changes
+		gAD.recompute()
 
 
 # ###################################################################################################################
-
@@ -46,6 +46,9 @@ def showQtMain():
 
 		gFit = ""
 		gBrokenURL = dict()
+		gWorkers = 8                      # parallel textures downloads
+		gTimeout = 30                     # single texture download timeout in seconds
+		gCacheSize = 512 * 1024 * 1024    # textures directory size limit in bytes
 
 		# ############################################################################
 		# init
@@ -396,9 +399,8 @@ def showQtMain():
 			return ""
 			
 		
-		def downloadTexture(self, iObj, iURL):
+		def getTexturesDir(self):
 			
-			import urllib.request
 			import tempfile
 			import os
 			
@@ -406,29 +408,123 @@ def showQtMain():
 			tmpDir = tempfile.gettempdir()
 			tmpDir = os.path.join(tmpDir, "FreeCAD_Textures")
 			if not os.path.exists(tmpDir):
-				os.makedirs(tmpDir)
-
-			# get texture filename
-			textureFilename = os.path.basename(iURL)
-			textureFilePath = os.path.join(tmpDir, textureFilename)
-
-			# check if file already exists and skip slow downloading
-			if not os.path.exists(textureFilePath):
-
+				os.makedirs(tmpDir, exist_ok=True)
+			
+			return tmpDir
+		
+		
+		def getTexturePath(self, iURL):
+			
+			import hashlib
+			import urllib.parse
+			import os
+			
+			# name file by URL hash, the same filenames from different URLs not collide, 
+			# keep extension because Coin detects image format from it
+			path = urllib.parse.urlparse(iURL).path
+			ext = os.path.splitext(path)[1]
+			name = hashlib.sha1(iURL.encode("utf-8")).hexdigest() + ext
+			
+			return os.path.join(self.getTexturesDir(), name)
+		
+		
+		def downloadTexture(self, iURL):
+			
+			import urllib.request
+			import threading
+			import os
+			
+			textureFilePath = self.getTexturePath(iURL)
+			
+			# check if file already exists and skip slow downloading, 
+			# update access time for cache limit
+			if os.path.exists(textureFilePath):
 				try:
-					# get image from URL
-					data = urllib.request.urlopen(iURL)
+					os.utime(textureFilePath)
 				except:
-					# if broken URL or removed image
-					self.gBrokenURL[str(iObj.Label)] = iURL
-					return ""
-
-				# create temp file with image
-				out = open(str(textureFilePath), "wb")
+					skip = 1
+				
+				return textureFilePath
+			
+			tmpFilePath = textureFilePath + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".part"
+			
+			try:
+				# get image from URL
+				data = urllib.request.urlopen(iURL, timeout=self.gTimeout)
+				
+				# create temp file with image and move it, so broken download is never used
+				out = open(str(tmpFilePath), "wb")
 				out.write(data.read())
 				out.close()
-
+				
+				os.replace(tmpFilePath, textureFilePath)
+			
+			except:
+				
+				# if broken URL or removed image
+				try:
+					os.remove(tmpFilePath)
+				except:
+					skip = 1
+				
+				return ""
+			
 			return textureFilePath
+		
+		
+		def downloadTextures(self, iURLs):
+			
+			import concurrent.futures
+			
+			files = dict()
+			
+			if len(iURLs) == 0:
+				return files
+			
+			# each URL is downloaded only once, in parallel
+			workers = min(self.gWorkers, len(iURLs))
+			with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+				for url, path in zip(iURLs, pool.map(self.downloadTexture, iURLs)):
+					files[url] = path
+			
+			self.limitTexturesDir(files.values())
+			
+			return files
+		
+		
+		def limitTexturesDir(self, iKeep):
+			
+			import os
+			
+			tmpDir = self.getTexturesDir()
+			keep = set(iKeep)
+			
+			files = []
+			size = 0
+			
+			for f in os.listdir(tmpDir):
+				path = os.path.join(tmpDir, f)
+				try:
+					stat = os.stat(path)
+					files.append([ stat.st_mtime, stat.st_size, path ])
+					size = size + stat.st_size
+				except:
+					skip = 1
+			
+			# remove least recently used textures, but not just loaded
+			for [ mtime, fsize, path ] in sorted(files):
+				
+				if size <= self.gCacheSize:
+					break
+				
+				if path in keep:
+					continue
+				
+				try:
+					os.remove(path)
+					size = size - fsize
+				except:
+					skip = 1
 
 		
 		def setTexture(self, iObj, iFile):
@@ -544,8 +640,10 @@ def showQtMain():
 
 			self.gBrokenURL = dict()
 			empty = ""
+			textures = []
+			urls = []
 			
-			# search all objects and set URL
+			# search all objects and get URL
 			for obj in iSearch:
 				
 				# try set color
@@ -563,15 +661,32 @@ def showQtMain():
 					continue
 				else:
 					empty = "no"
-
+				
+				textures.append([ obj, textureURL ])
+				
+				# many objects share the same texture, download it once
+				if textureURL.startswith("http") and textureURL not in urls:
+					urls.append(textureURL)
+			
+			files = self.downloadTextures(urls)
+			
+			# set textures
+			for [ obj, textureURL ] in textures:
+				
 				# chose URL or local HDD
 				if textureURL.startswith("http"):
-					filename = self.downloadTexture(obj, textureURL)
+					filename = files[textureURL]
 				else:
 					filename = str(textureURL)
 				
 				# should be no empty
 				if str(filename) == "":
+					
+					# if broken URL or removed image
+					if textureURL not in self.gBrokenURL.keys():
+						self.gBrokenURL[textureURL] = []
+					
+					self.gBrokenURL[textureURL].append(str(obj.Label))
 					continue
 
 				# set texture
@@ -593,12 +708,12 @@ def showQtMain():
 				else:
 					
 					FreeCAD.Console.PrintMessage("\n ====================== \n")
-					for n, b in self.gBrokenURL.items():
-						FreeCAD.Console.PrintMessage("\n")
-						FreeCAD.Console.PrintMessage(translate('setTextures', 'Object Label') + ': '+n)
+					for b, n in self.gBrokenURL.items():
 						FreeCAD.Console.PrintMessage("\n")
 						FreeCAD.Console.PrintMessage(translate('setTextures', 'Broken URL') + ': '+b)
 						FreeCAD.Console.PrintMessage("\n")
+						FreeCAD.Console.PrintMessage(translate('setTextures', 'Object Label') + ': '+', '.join(n))
+						FreeCAD.Console.PrintMessage("\n")
 					FreeCAD.Console.PrintMessage("\n ====================== \n")
 
 					info = ""
@@ -40,6 +40,7 @@ translate = FreeCAD.Qt.translate
 # "html" - HyperText Markup Language (.html file)
 # "json" - JavaScript Object Notation (.json file), see e.g. json2table.com
 # "md" - MarkDown (.md file), see e.g. dillinger.io
+# "all" - all above file types from single pass
 sFileType = "html"
 
 # Export type:
@@ -65,6 +66,14 @@ if sFileType == "html":
 else:
 	sEmptyCell = ""
 
+# Empty cell content for each file type, if all file types are exported:
+sEmptyCells = {
+	"csv": "",
+	"html": "&nbsp;",
+	"json": "",
+	"md": ""
+}
+
 # Separator for CSV:
 sSepCSV = ","
 
@@ -82,24 +91,28 @@ sQT = "yes"
 # ###################################################################################################################
 
 
-# set reference point to Active Document
-gAD = FreeCAD.activeDocument()
+# Qt boxes can be shown only with FreeCAD GUI
+if not FreeCAD.GuiUp:
+	sQT = "no"
+
+# reference point to Active Document, set at main, not needed for exportSheets
+gAD = ""
 
-# get all objects from 3D model
-gOBs = gAD.Objects
+# all objects from 3D model, set at main
+gOBs = []
 
 # init output file name
 gFile = "result" # will be overwritten later
 
 # init spreadsheet object
-gSheet = gAD # will be overwritten later
-
-# init output result
-gOUT = ""
+gSheet = "" # will be overwritten later
 
 # exported files names
 gExpFilesN = ""
 
+# file types requested by exportSheets, empty for settings or Qt GUI
+gFileTypes = ""
+
 # console print separator
 gSepC = "\n ================================================================ \n"
 
@@ -128,6 +141,9 @@ dbMaxC = 0 # column
 dbSKV = dict() # value for letters
 dbSKL = dict() # letters for value
 
+# cells with content or properties
+dbCells = dict() # sorted columns for row
+
 
 # ###################################################################################################################
 # Support for Qt GUI
@@ -224,7 +240,7 @@ def showQtMain():
 			self.fileTypeL.move(10, 73)
 			
 			# options
-			self.fileTypeOlist = ("csv","html","json","md")
+			self.fileTypeOlist = ("csv","html","json","md","all")
 			self.fileTypeO = QtGui.QComboBox(self)
 			self.fileTypeO.addItems(self.fileTypeOlist)
 			self.fileTypeO.setCurrentIndex(self.fileTypeOlist.index("html"))
@@ -367,6 +383,16 @@ def showQtMain():
 				self.customCSSti.hide()
 				self.emptyCellTi.setText("")
 
+			if selectedText == "all":
+				self.fileTypeOIS.setText(translate('sheet2export', 'all file types ( .csv .html .json .md files )'))
+				self.csvSL.hide()
+				self.csvSTi.hide()
+				self.customCSSbl.show()
+				self.customCSSbo.show()
+				self.customCSStil.show()
+				self.customCSSti.show()
+				self.emptyCellTi.setText("")
+
 		def setEType(self, selectedText):
 			global sExportType
 
@@ -482,47 +508,37 @@ def showError(iObj, iPlace, iError):
 
 
 # ###################################################################################################################
-def CSVbegin():
-	global gOUT
+class CSV():
 
-	gOUT += ''
+	# each function returns the text to write, so the file can be written row by row
 
+	# colspan is not supported by the file type
+	spans = False
 
-# ###################################################################################################################
-def CSVend():
-	global gOUT
+	def __init__(self, iEmptyCell):
+		self.emptyCell = str(iEmptyCell)
 
-	gOUT += ''
+	def begin(self):
+		return ''
 
+	def end(self):
+		return ''
 
-# ###################################################################################################################
-def CSVrowOpen():
-	global gOUT
+	def rowOpen(self, iR):
+		return ''
 
-	gOUT += ''
+	def rowClose(self, iR):
+		return '\n'
 
+	def empty(self, iKey, iC, iR):
+		return self.emptyCell + sSepCSV
 
-# ###################################################################################################################
-def CSVrowClose():
-	global gOUT
+	def emptyRun(self, iC1, iC2, iR):
+		# empty cells without properties from column iC1 to iC2
+		return ( self.emptyCell + sSepCSV ) * ( iC2 - iC1 + 1 )
 
-	gOUT += '\n'
-
-
-# ###################################################################################################################
-def CSVempty(iKey, iC, iR):
-	global gOUT
-
-	gOUT += str(sEmptyCell)
-	gOUT += sSepCSV
-
-
-# ###################################################################################################################
-def CSVcell(iKey, iCell, iC, iR):
-	global gOUT
-
-	gOUT += str(iCell)
-	gOUT += sSepCSV
+	def cell(self, iKey, iCell, iC, iR):
+		return str(iCell) + sSepCSV
 
 
 # ###################################################################################################################
@@ -531,118 +547,67 @@ def CSVcell(iKey, iCell, iC, iR):
 
 
 # ###################################################################################################################
-def HTMLbegin():
-	global gOUT
+class HTML():
 
-	# there is no need to add html document header here because if the file is html table 
-	# only the file is correctly parsed by browser, moreover this is easier to copy the 
-	# file content and place it to the post or other web page
-	gOUT += '<TABLE>\n'
+	# cells covered by open colspan are not written
+	spans = True
 
+	def __init__(self, iEmptyCell):
+		self.emptyCell = str(iEmptyCell)
 
-# ###################################################################################################################
-def HTMLend():
-	global gOUT
+	def begin(self):
 
-	gOUT += "</TABLE>"
+		# there is no need to add html document header here because if the file is html table 
+		# only the file is correctly parsed by browser, moreover this is easier to copy the 
+		# file content and place it to the post or other web page
+		return '<TABLE>\n'
 
+	def end(self):
+		return '</TABLE>'
 
-# ###################################################################################################################
-def HTMLrowOpen():
-	global gOUT
+	def rowOpen(self, iR):
+		return ' <TR>\n'
 
-	gOUT += " <TR>\n"
+	def rowClose(self, iR):
+		return ' </TR>\n'
 
+	def tdOpen(self, iKey):
 
-# ###################################################################################################################
-def HTMLrowClose():
-	global gOUT
+		out = '  <TD '
 
-	gOUT += " </TR>\n"
+		if iKey in dbCPCS:
+			out += 'colspan="' + str(dbCPCS[iKey]) + '" '
 
+		if iKey in dbCPRS:
+			out += 'rowspan="' + str(dbCPRS[iKey]) + '" '
 
-# ###################################################################################################################
-def HTMLempty(iKey, iC, iR):
-	global gOUT
-
-	gOUT += '  <TD '
-
-	try:
-		gOUT += 'colspan="'+str(dbCPCS[iKey]) + '" '
-	except:
-		gOUT += ''
-
-	try:
-		gOUT += 'rowspan="'+str(dbCPRS[iKey]) + '" '
-	except:
-		gOUT += ''
-
-	gOUT += 'style=' 
-	gOUT += '"'
-	gOUT += str(sCustomCSS)
-	
-	try:
-		gOUT += 'text-align:'+str(dbCPA[iKey]).split("|")[0] + ';'
-	except:
-		gOUT += ''
-	
-	try:
-		gOUT += 'background-color:'+str(dbCPB[iKey]) + ';'
-	except:
-		gOUT += ''
-	
-	try:
-		gOUT += 'font-weight:'+str(dbCPS[iKey]) + ';'
-	except:
-		gOUT += ''
-	
+		out += 'style='
+		out += '"'
+		out += str(sCustomCSS)
 
-	gOUT += '"'
-	gOUT += '>'
-	gOUT += str(sEmptyCell)
-	gOUT += "</TD>\n"
+		if iKey in dbCPA:
+			out += 'text-align:' + str(dbCPA[iKey]).split("|")[0] + ';'
 
+		if iKey in dbCPB:
+			out += 'background-color:' + str(dbCPB[iKey]) + ';'
 
-# ###################################################################################################################
-def HTMLcell(iKey, iCell, iC, iR):
-	global gOUT
+		if iKey in dbCPS:
+			out += 'font-weight:' + str(dbCPS[iKey]) + ';'
 
-	gOUT += '  <TD '
+		out += '"'
+		out += '>'
 
-	try:
-		gOUT += 'colspan="'+str(dbCPCS[iKey]) + '" '
-	except:
-		gOUT += ''
+		return out
 
-	try:
-		gOUT += 'rowspan="'+str(dbCPRS[iKey]) + '" '
-	except:
-		gOUT += ''
+	def empty(self, iKey, iC, iR):
+		return self.tdOpen(iKey) + self.emptyCell + '</TD>\n'
 
-	gOUT += 'style=' 
-	gOUT += '"'
-	gOUT += str(sCustomCSS)
-	
-	try:
-		gOUT += 'text-align:'+str(dbCPA[iKey]).split("|")[0] + ';'
-	except:
-		gOUT += ''
-	
-	try:
-		gOUT += 'background-color:'+str(dbCPB[iKey]) + ';'
-	except:
-		gOUT += ''
-	
-	try:
-		gOUT += 'font-weight:'+str(dbCPS[iKey]) + ';'
-	except:
-		gOUT += ''
-	
+	def emptyRun(self, iC1, iC2, iR):
+		# empty cells without properties from column iC1 to iC2
+		return self.empty("", iC1, iR) * ( iC2 - iC1 + 1 )
 
-	gOUT += '"'
-	gOUT += '>'
-	gOUT += str(iCell)
-	gOUT += "</TD>\n"
+	def cell(self, iKey, iCell, iC, iR):
+		return self.tdOpen(iKey) + str(iCell) + '</TD>\n'
 
 
 # ###################################################################################################################
@@ -651,53 +616,54 @@ def HTMLcell(iKey, iCell, iC, iR):
 
 
 # ###################################################################################################################
-def JSONbegin():
-	global gOUT
+class JSON():
 
-	gOUT += '['
+	spans = False
 
+	def __init__(self, iEmptyCell):
+		self.emptyCell = str(iEmptyCell)
+		self.firstRow = True
+		self.firstCell = True
 
-# ###################################################################################################################
-def JSONend():
-	global gOUT
+	def begin(self):
+		return '['
 
-	gOUT = gOUT[:-1]
-	gOUT += ']'
+	def end(self):
+		return ']'
 
+	def rowOpen(self, iR):
 
-# ###################################################################################################################
-def JSONrowOpen():
-	global gOUT
-
-	gOUT += '{'
-
+		self.firstCell = True
+		
+		if self.firstRow == True:
+			self.firstRow = False
+			return '{'
+		
+		return ',{'
 
-# ###################################################################################################################
-def JSONrowClose():
-	global gOUT
+	def rowClose(self, iR):
+		return '}'
 
-	gOUT = gOUT[:-1]
-	gOUT += '},'
+	def item(self, iC, iValue):
 
+		out = '"' + getColumnName(iC) + '":'
+		out += '"' + str(iValue) + '"'
 
-# ###################################################################################################################
-def JSONempty(iKey, iC, iR):
-	global gOUT
+		if self.firstCell == True:
+			self.firstCell = False
+			return out
 
-	key = str(dbSKL[str(iC)])
-	gOUT += '"' + str(key) + '":'
-	gOUT += '"' + str(sEmptyCell) + '"'
-	gOUT += ','
+		return ',' + out
 
+	def empty(self, iKey, iC, iR):
+		return self.item(iC, self.emptyCell)
 
-# ###################################################################################################################
-def JSONcell(iKey, iCell, iC, iR):
-	global gOUT
+	def emptyRun(self, iC1, iC2, iR):
+		# JSON needs column name for each empty cell
+		return ''.join([ self.item(c, self.emptyCell) for c in range(iC1, iC2 + 1) ])
 
-	key = str(dbSKL[str(iC)])
-	gOUT += '"' + str(key) + '":'
-	gOUT += '"' + str(iCell) + '"'
-	gOUT += ','
+	def cell(self, iKey, iCell, iC, iR):
+		return self.item(iC, iCell)
 
 
 # ###################################################################################################################
@@ -706,135 +672,160 @@ def JSONcell(iKey, iCell, iC, iR):
 
 
 # ###################################################################################################################
-def MDbegin():
-	global gOUT
+class MD():
 
-	c = 1
-	while c < dbMaxC + 1:
-		gOUT += '|   '
-		c = c + 1
+	spans = False
 
-	gOUT += '|\n'
+	def __init__(self, iEmptyCell):
+		self.emptyCell = str(iEmptyCell)
 
-	c = 1
-	while c < dbMaxC + 1:
+	def begin(self):
 
-		# set alignment
-		try:	
+		out = '|   ' * dbMaxC
+		out += '|\n'
 
+		c = 1
+		while c < dbMaxC + 1:
+
+			# set alignment
 			# check 2nd row with data
 			# first row can be header with colspans
-			key = str(dbSKL[str(c)]) + str(2)
-			a = str(dbCPA[key]).split("|")[0]
-
-			if a == "left":
-				gOUT += '|:--'
-			if a == "right":
-				gOUT += '|--:'
-			if a == "center":
-				gOUT += '|:-:'
-		except:
-			gOUT += '|---'
+			key = getColumnName(c) + str(2)
+			
+			if key in dbCPA:
+			
+				a = str(dbCPA[key]).split("|")[0]
+
+				if a == "left":
+					out += '|:--'
+				if a == "right":
+					out += '|--:'
+				if a == "center":
+					out += '|:-:'
+			else:
+				out += '|---'
 
-		c = c + 1
+			c = c + 1
 
-	gOUT += '|\n'
+		out += '|\n'
 
+		return out
 
-# ###################################################################################################################
-def MDend():
-	global gOUT
+	def end(self):
+		return ''
 
-	gOUT += ''
+	def rowOpen(self, iR):
+		return ''
 
+	def rowClose(self, iR):
+		return '|\n'
 
-# ###################################################################################################################
-def MDrowOpen():
-	global gOUT
+	def empty(self, iKey, iC, iR):
+		return '|   ' + self.emptyCell
 
-	gOUT += ''
+	def emptyRun(self, iC1, iC2, iR):
+		# empty cells without properties from column iC1 to iC2
+		return ( '|   ' + self.emptyCell ) * ( iC2 - iC1 + 1 )
 
+	def cell(self, iKey, iCell, iC, iR):
+		return '|   ' + str(iCell) + '   '
 
+
+# ###################################################################################################################
+# File format selector ( ADD HERE NEW FILE FORMAT )
 # ###################################################################################################################
-def MDrowClose():
-	global gOUT
 
-	gOUT += '|'
-	gOUT += '\n'
 
+gFormats = {
+	"csv": CSV,
+	"html": HTML,
+	"json": JSON,
+	"md": MD
+}
 
-# ###################################################################################################################
-def MDempty(iKey, iC, iR):
-	global gOUT
 
-	gOUT += '|   '
-	gOUT += str(sEmptyCell)
+# ###################################################################################################################
+# Database write controller
+# ###################################################################################################################
 
 
 # ###################################################################################################################
-def MDcell(iKey, iCell, iC, iR):
-	global gOUT
+def getColumnName(iC):
 
-	gOUT += '|   '
-	gOUT += str(iCell)
-	gOUT += '   '
+	# letters for column number, 1 = A, 26 = Z, 27 = AA, 703 = AAA, no limit
+	if iC in dbSKL:
+		return dbSKL[iC]
 
+	v = iC
+	key = ""
+	while v > 0:
+		v, mod = divmod(v - 1, 26)
+		key = chr(65 + mod) + key
 
-# ###################################################################################################################
-# Database write controller
-# ###################################################################################################################
+	dbSKL[iC] = key
+	
+	return key
 
 
 # ###################################################################################################################
-def getKey(iC, iR):
+def getColumnIndex(iLetters):
 
-	letters = "ZABCDEFGHIJKLMNOPQRSTUVWXYZ" # max 26
+	# column number for letters, A = 1, Z = 26, AA = 27, AAA = 703, no limit
+	if iLetters in dbSKV:
+		return dbSKV[iLetters]
 
-	mod = int((iC % 26))
-	div = int((iC - 1) / 26) 
+	v = 0
+	for l in iLetters:
+		v = ( v * 26 ) + ( ord(l) - 64 )
 
-	keyC = ""
+	dbSKV[iLetters] = v
 
-	if iC < 27:
-		keyC = letters[iC]
-	else:
-		keyC = letters[div] + letters[mod]
+	return v
 
-	keyR = str(iR)
 
-	key = keyC + keyR
+# ###################################################################################################################
+def getKey(iC, iR):
 
 	# for given column and row it returns
 	# spreadsheet key for cell like e.g. A5, AG125 etc
-	return str(key)
+	return getColumnName(iC) + str(iR)
 
 
 # ###################################################################################################################
-def setSK():
+def getCellPosition(iKey):
 
-	# set spreadsheet keys databases
-	c = 1
-	while c < 703:
-
-		# get key for first row and remove number
-		key = getKey(c, 1)[:-1]
+	# split spreadsheet key to column and row number
+	i = 0
+	while not iKey[i].isdigit():
+		i = i + 1
 		
-		# set spreadsheet key value
-		dbSKV[key] = c
+	return [ getColumnIndex(iKey[:i]), int(iKey[i:]) ]
+
 
-		# set spreadsheet key letter
-		dbSKL[str(c)] = key
+# ###################################################################################################################
+def getContent(iKey, iContent):
 
-		# go to next column
-		c = c + 1
+	# the XML parse may not be consistent with the FreeCAD spreadsheet objects,
+	# the XML may contains extra characters like "=" or '' so you have to write 
+	# the FreeCAD content not the XML content with the extra characters, 
+	# only formulas and numbers need to be calculated by FreeCAD
+	
+	if iContent.startswith("="):
+		return gSheet.get(iKey)
+
+	if iContent.startswith("'"):
+		return iContent[1:]
+
+	try:
+		float(iContent)
+		return gSheet.get(iKey)
+	except:
+		return iContent
 
 
 # ###################################################################################################################
 def setDB():
 
-	# import regular expressions
-	import re
-
 	# refer to globals
 	global dbMaxR
 	global dbMaxC
@@ -842,50 +833,46 @@ def setDB():
 	# XML parse part from python doc
 	import xml.etree.ElementTree as ET
 	result = str(gSheet.cells.Content)
+
 	root = ET.fromstring(result)
 
-	# set only available data
+	# set only available data in single pass
 	for child in root:
-		root2 = dict(child.attrib)
+		root2 = child.attrib
 		
 		# skip data not related to cells
-		try:
-			key = root2["address"]
-		except:
+		if "address" not in root2:
 			continue
 
+		key = root2["address"]
+		[ c, r ] = getCellPosition(key)
+		vMax = False
+
 		try:
-			# the XML parse may not be consistent with the FreeCAD spreadsheet objects,
-			# the XML may contains extra characters like "=" or '' so you have to write 
-			# the FreeCAD content not the XML content with the extra characters
-			dbCPC[key] = gSheet.get(key)
+			if "content" in root2:
+				dbCPC[key] = getContent(key, root2["content"])
+			else:
+				dbCPC[key] = gSheet.get(key)
+			vMax = True
 		except:
 			skip = 1
 
-		try:
+		if "alignment" in root2:
 			dbCPA[key] = root2["alignment"]
-		except:
-			skip = 1
 
-		try:
+		if "style" in root2:
 			dbCPS[key] = root2["style"]
-		except:
-			skip = 1
 
-		try:
+		# this can be page separator line using background color
+		if "backgroundColor" in root2:
 			dbCPB[key] = root2["backgroundColor"]
-		except:
-			skip = 1
+			vMax = True
 
-		try:
+		if "rowSpan" in root2:
 			dbCPRS[key] = root2["rowSpan"]
-		except:
-			skip = 1
 
-		try:
+		if "colSpan" in root2:
 			dbCPCS[key] = root2["colSpan"]
-		except:
-			skip = 1
 
 		# width is not set because web pages and other formats has its own 
 		# page size, for advance science data the spreadsheet can be even 
@@ -894,38 +881,23 @@ def setDB():
 		# but keep the text readable and possible to print, 
 		# columns can be adjusted manually if needed
 
-	# set max row and max column
-	# search keys in content db
-	for k in dbCPC.keys():
-		
-		# split spreadsheet key to word and number
-		res = [re.findall(r'(\w+?)(\d+)', str(k))[0] ]
+		# set cells table
+		if r not in dbCells:
+			dbCells[r] = []
+		dbCells[r].append(c)
 
-		w = str(res[0][0]) # word column
-		n = int(res[0][1]) # number rows
-		
-		if int(dbSKV[w]) > int(dbMaxC):
-			dbMaxC = int(dbSKV[w])
-		
-		if int(n) > int(dbMaxR):
-			dbMaxR = int(n)
+		# set max row and max column only for content and background
+		if vMax == True:
 
-	# search keys also in background db
-	# this can be page separator line using background color
-	for k in dbCPB.keys():
-		
-		# split spreadsheet key to word and number
-		res = [re.findall(r'(\w+?)(\d+)', str(k))[0] ]
+			if c > dbMaxC:
+				dbMaxC = c
+			
+			if r > dbMaxR:
+				dbMaxR = r
+
+	for r in dbCells.keys():
+		dbCells[r] = sorted(set(dbCells[r]))
 
-		w = str(res[0][0]) # word column
-		n = int(res[0][1]) # number rows
-		
-		if int(dbSKV[w]) > int(dbMaxC):
-			dbMaxC = int(dbSKV[w])
-		
-		if int(n) > int(dbMaxR):
-			dbMaxR = int(n)
-	
 
 # ###################################################################################################################
 def resetDB():
@@ -944,11 +916,7 @@ def resetDB():
 	dbCPB.clear() # background
 	dbCPRS.clear() # row span
 	dbCPCS.clear() # column span
-
-	# reset output
-	global gOUT
-
-	gOUT = ""
+	dbCells.clear() # cells table
 
 	# max
 	global dbMaxR
@@ -958,117 +926,16 @@ def resetDB():
 	dbMaxC = 0 # column
 
 
-# ###################################################################################################################
-# File format selector
-# ###################################################################################################################
-
-
-# ###################################################################################################################
-def selectBegin():
-
-	if sFileType == "csv":
-		CSVbegin()
-
-	if sFileType == "html":
-		HTMLbegin()
-
-	if sFileType == "json":
-		JSONbegin()
-
-	if sFileType == "md":
-		MDbegin()
-
-
-# ###################################################################################################################
-def selectEnd():
-
-	if sFileType == "csv":
-		CSVend()
-
-	if sFileType == "html":
-		HTMLend()
-
-	if sFileType == "json":
-		JSONend()
-
-	if sFileType == "md":
-		MDend()
-
-
-# ###################################################################################################################
-def selectRowOpen():
-
-	if sFileType == "csv":
-		CSVrowOpen()
-
-	if sFileType == "html":
-		HTMLrowOpen()
-
-	if sFileType == "json":
-		JSONrowOpen()
-
-	if sFileType == "md":
-		MDrowOpen()
-
-
-# ###################################################################################################################
-def selectRowClose():
-
-	if sFileType == "csv":
-		CSVrowClose()
-
-	if sFileType == "html":
-		HTMLrowClose()
-
-	if sFileType == "json":
-		JSONrowClose()
-
-	if sFileType == "md":
-		MDrowClose()
-
-
-# ###################################################################################################################
-def selectEmpty(iKey, iC, iR):
-
-	if sFileType == "csv":
-		CSVempty(iKey, iC, iR)
-
-	if sFileType == "html":
-		HTMLempty(iKey, iC, iR)
-
-	if sFileType == "json":
-		JSONempty(iKey, iC, iR)
-
-	if sFileType == "md":
-		MDempty(iKey, iC, iR)
-
-
-# ###################################################################################################################
-def selectCell(iKey, iCell, iC, iR):
-
-	if sFileType == "csv":
-		CSVcell(iKey, iCell, iC, iR)
-
-	if sFileType == "html":
-		HTMLcell(iKey, iCell, iC, iR)
-
-	if sFileType == "json":
-		JSONcell(iKey, iCell, iC, iR)
-
-	if sFileType == "md":
-		MDcell(iKey, iCell, iC, iR)
-
-
 # ###################################################################################################################
 # Set output
 # ###################################################################################################################
 
 
 # ###################################################################################################################
-def setOUTPUT():
+def askOUTPUT():
 
 	if sQT == "yes":
-		if int(dbMaxR * dbMaxC) > 10000:
+		if int(dbMaxR * dbMaxC) > 1000000:
 
 			info = ""
 			info += translate('sheet2export', 'The spreadsheet') + ' ' + str(gSheet.Label)
@@ -1090,80 +957,145 @@ def setOUTPUT():
 				skip = 1
 				return -1
 	
+	return 0
+
+
+# ###################################################################################################################
+class FileSink():
+
+	# file written by its own thread, so many files can be written at the same time, 
+	# the text is collected and written in bigger chunks in the same order
+
+	def __init__(self, iPath, iPool):
+		self.path = iPath
+		self.file = open(iPath, 'w')
+		self.pool = iPool
+		self.buffer = []
+		self.size = 0
+		self.last = ""
+
+	def write(self, iText):
+		self.buffer.append(iText)
+		self.size = self.size + len(iText)
+		if self.size > 65536:
+			self.flush()
+
+	def flush(self):
+		if len(self.buffer) > 0:
+			vText = ''.join(self.buffer)
+			self.buffer = []
+			self.size = 0
+			self.last = self.pool.submit(self.writeChunk, self.last, vText)
+
+	def writeChunk(self, iPrevious, iText):
+		# keep order of chunks for the file
+		if iPrevious != "":
+			iPrevious.result()
+		self.file.write(iText)
+
+	def close(self):
+		self.flush()
+		if self.last != "":
+			self.last.result()
+		self.file.close()
+
+
+# ###################################################################################################################
+def setOUTPUT(iFiles, iWriters):
+
 	# set begin of the spreadsheet table
-	selectBegin()
+	for i, w in enumerate(iWriters):
+		iFiles[i].write(w.begin())
 	
 	# set variables for loop
 	colSpan = 0
 	rowSpan = 0
-	vCell = ""
-	c = 1
-	r = 1
 	
-	# just simple walk thru the matrix and setting each cell
+	# walk thru the rows only once for all file types and write each row directly to files
+	r = 1
 	while r <= dbMaxR:
 
-		FreeCAD.Console.PrintMessage(".")
-		FreeCAD.Console.PrintMessage("")
-
 		# set row extra properties
-		selectRowOpen()
+		out = [ [ w.rowOpen(r) ] for w in iWriters ]
 		
-		# go thru columns for given row
-		while c <= dbMaxC:
+		# last written column
+		c = 0
+		
+		# only cells with content or properties, the last item is the end of row
+		cols = [ col for col in dbCells.get(r, []) if col <= dbMaxC ] + [ dbMaxC + 1 ]
+		
+		for col in cols:
+
+			# empty cells without properties before the column
+			n = col - c - 1
+			
+			if n > 0:
+
+				# if there is open colspan this should be skipped
+				skipped = 0
+				if colSpan > 0 and rowSpan > 0:
+					skipped = min(colSpan, n)
+
+				for i, w in enumerate(iWriters):
+					if w.spans == True:
+						if n - skipped > 0:
+							out[i].append(w.emptyRun(c + 1 + skipped, col - 1, r))
+					else:
+						out[i].append(w.emptyRun(c + 1, col - 1, r))
+
+				colSpan = max(0, colSpan - n)
+
+			if col > dbMaxC:
+				break
 
 			# get access point
-			vKey = str(dbSKL[str(c)]) + str(r)
+			vKey = getColumnName(col) + str(r)
 
-			try:
+			if vKey in dbCPC:
 
 				# get content
 				vCell = str(dbCPC[vKey])
 
 				# set colspan before you set the cell
-				try:
+				if vKey in dbCPCS:
 					colSpan = int(dbCPCS[vKey])
-					rowSpan = int(dbCPRS[vKey])
-				except:
-					skip = 1
+					if vKey in dbCPRS:
+						rowSpan = int(dbCPRS[vKey])
 
 				# set the cell content
-				if vCell != "":
-					selectCell(vKey, vCell, c, r)					
-				else:
-					selectEmpty(vKey, c, r)
+				for i, w in enumerate(iWriters):
+					if vCell != "":
+						out[i].append(w.cell(vKey, vCell, col, r))
+					else:
+						out[i].append(w.empty(vKey, col, r))
 
-			except:
+			else:
 
-				# if there was no such cell access point it will be empty cell
+				# if there was no content it will be empty cell
 				# if there is open colspan this should be skipped
-				if sFileType == "html":
-					if colSpan == 0 or  rowSpan == 0:
-						selectEmpty(vKey, c, r)
-
-				# colspan is not supported by the file type
-				else:
-					selectEmpty(vKey, c, r)
+				for i, w in enumerate(iWriters):
+					if w.spans == False or colSpan == 0 or rowSpan == 0:
+						out[i].append(w.empty(vKey, col, r))
 
 			# if the cell was written and there is colspan open
 			if colSpan > 0:
 				colSpan = colSpan - 1 
-		
-			# just go to next column
-			c = c + 1
+
+			c = col
 
 		# add extra close row properties
-		selectRowClose()
+		for i, w in enumerate(iWriters):
+			out[i].append(w.rowClose(r))
+			iFiles[i].write(''.join(out[i]))
 		
 		if rowSpan > 0:
-			rowSpan = rowSpan - 1 		
+			rowSpan = rowSpan - 1 
 
-		# set variables for next row
-		c = 1
 		r = r + 1
 
 	# set end of the spreadsheet table
-	selectEnd()
+	for i, w in enumerate(iWriters):
+		iFiles[i].write(w.end())
 
 	# set info
 	FreeCAD.Console.PrintMessage("done.")
@@ -1175,21 +1107,55 @@ def setOUTPUT():
 
 
 # ###################################################################################################################
-def saveToDisk():
-
-	global gExpFilesN
+def getFilePath(iFileType):
 
-	import os, sys
+	import os
 	from os.path import expanduser
 	
 	vRoot = expanduser(sFilePath)
-	vFileName = str(gFile) + "." + str(sFileType)
-	vFile = os.path.join(vRoot, vFileName)
+	vFileName = str(gFile) + "." + str(iFileType)
 	
-	with open(vFile, 'w') as vFH:
-		vFH.write("%s" % gOUT)
+	return os.path.join(vRoot, vFileName)
 
-	gExpFilesN += vFile + "\t\n"
+
+# ###################################################################################################################
+def getFileTypes():
+
+	# explicitly requested file types use empty cell content for each type
+	if gFileTypes != "":
+		return [ [ t, sEmptyCells[t] ] for t in gFileTypes ]
+
+	if sFileType == "all":
+		return [ [ t, sEmptyCells[t] ] for t in gFormats.keys() ]
+
+	# single file type from settings or Qt GUI uses empty cell content from settings
+	return [ [ sFileType, sEmptyCell ] ]
+
+
+# ###################################################################################################################
+def saveToDisk(iPool):
+
+	global gExpFilesN
+
+	if askOUTPUT() == -1:
+		return -1
+
+	vSinks = []
+	vWriters = []
+	
+	for [ t, vEmptyCell ] in getFileTypes():
+		vWriters.append(gFormats[t](vEmptyCell))
+		vSinks.append(FileSink(getFilePath(t), iPool))
+
+	# write output directly to files
+	try:
+		setOUTPUT(vSinks, vWriters)
+	finally:
+		for f in vSinks:
+			f.close()
+
+	for f in vSinks:
+		gExpFilesN += f.path + "\t\n"
 
 
 # ###################################################################################################################
@@ -1197,107 +1163,131 @@ def saveToDisk():
 # ###################################################################################################################
 
 # ###################################################################################################################
-def runTasks():
+def runTasks(iPool):
 
 	try:
 		setDB()
 	except:
 		showError(gSheet, "setDB" , "Databese is not set correctly.")
 		
-	try:
-		if setOUTPUT() == -1:
-			return 0
-	except:
-		showError(gSheet, "setOUTPUT" , "Output is not set correctly.")
-		
 	try:	
-		saveToDisk()
+		saveToDisk(iPool)
 	except:
 		showError(gSheet, "saveToDisk" , "File is not exported correctly.")
 
 
 # ###################################################################################################################
-# MAIN
-# ###################################################################################################################
+def exportSheets(iSheets, iFileTypes=""):
 
+	# export spreadsheets to many file types, each spreadsheet is parsed and walked only once, 
+	# files are written by threads, for example to export all file types:
+	#
+	#	sheet2export.exportSheets(spreadsheets, [ "csv", "html", "json", "md" ])
 
-# show Qt box
-if sQT == "yes":
-	showQtMain()
+	global gSheet
+	global gFile
+	global gFileTypes
+	global gExpFilesN
 
-# skip if cancel button
-if gExecute == "yes":
+	from concurrent.futures import ThreadPoolExecutor
 
-	# set spreadsheet key databases
-	try:
-		setSK()
-	except:
-		showError(gAD, "setSK" , "Spreadsheet key databases is not set correctly.")
-	
-	# for selected
-	if sExportType == "s":
-		try:
-			# try set selected spreadsheet
-			gSheet = FreeCADGui.Selection.getSelection()[0]
+	# exported files names for this call only
+	gExpFilesN = ""
 
-			# check if this is correct spreadsheet object
-			if gSheet.isDerivedFrom("Spreadsheet::Sheet"):
+	# only the requested file types are exported
+	if iFileTypes != "":
+		if "all" in iFileTypes:
+			gFileTypes = list(gFormats.keys())
+		else:
+			gFileTypes = list(dict.fromkeys(iFileTypes))
+
+	try:
+		with ThreadPoolExecutor(max_workers=4) as vPool:
+		
+			for obj in iSheets:
+		
+				# try set spreadsheet
+				gSheet = obj
+		
+				# check if this is correct spreadsheet object
+				if not gSheet.isDerivedFrom("Spreadsheet::Sheet"):
+					continue
 		
 				# set output filename
-				gFile = gAD.Label + " - " + gSheet.Label
+				gFile = gSheet.Document.Label + " - " + gSheet.Label
 		
 				# set info
 				FreeCAD.Console.PrintMessage("\n")
 				FreeCAD.Console.PrintMessage("Exporting: ")
 				FreeCAD.Console.PrintMessage(gSheet.Label + " ")
+				
+				# create output files
+				resetDB()
+				runTasks(vPool)
+	finally:
+		gFileTypes = ""
+
+	return gExpFilesN
+
+
+# ###################################################################################################################
+# MAIN
+# ###################################################################################################################
+
+
+# the Qt GUI front-end runs only with FreeCAD GUI, 
+# for FreeCADCmd import this module and use exportSheets
+if FreeCAD.GuiUp:
+
+	# set reference point to Active Document
+	gAD = FreeCAD.activeDocument()
+
+	# get all objects from 3D model
+	gOBs = gAD.Objects
+
+	# show Qt box
+	if sQT == "yes":
+		showQtMain()
+
+	# skip if cancel button
+	if gExecute == "yes":
+
+		# for selected
+		if sExportType == "s":
+			try:
+				# try set selected spreadsheet
+				gSheet = FreeCADGui.Selection.getSelection()[0]
+
+				# check if this is correct spreadsheet object
+				if gSheet.isDerivedFrom("Spreadsheet::Sheet"):
 		
-				# create output file
-				runTasks()
+					# create output files
+					exportSheets([ gSheet ])
 	
-				# info
-				info = ""
-				info += translate('sheet2export', 'Exported files')
-				info += ": \n\n" + str(gExpFilesN) + "\n\n"
-				showInfo(info)
-			else:
+					# info
+					info = ""
+					info += translate('sheet2export', 'Exported files')
+					info += ": \n\n" + str(gExpFilesN) + "\n\n"
+					showInfo(info)
+				else:
+					showInfo(translate('sheet2export', 'Please select spreadsheet to export.'))
+			except:
 				showInfo(translate('sheet2export', 'Please select spreadsheet to export.'))
-		except:
-			showInfo(translate('sheet2export', 'Please select spreadsheet to export.'))
 	
 		
-	# for all spreadsheets
-	elif sExportType == "a":
-	
-		# search all objects and export spreadsheets
-		for obj in gOBs:
+		# for all spreadsheets
+		elif sExportType == "a":
 	
-			# try set spreadsheet
-			gSheet = obj
-	
-			# check if this is correct spreadsheet object
-			if gSheet.isDerivedFrom("Spreadsheet::Sheet"):
-	
-					# set output filename
-				gFile = gAD.Label + " - " + gSheet.Label
-			else:
-				continue
-	
-			# set info
-			FreeCAD.Console.PrintMessage("\n")
-			FreeCAD.Console.PrintMessage("Exporting: ")
-			FreeCAD.Console.PrintMessage(gSheet.Label + " ")
-			
-			# create output file
-			resetDB()
-			runTasks()
-
-		# info
-		info = ""
-		info += translate('sheet2export', 'Exported files')
-		info += ": \n\n" + str(gExpFilesN) + "\n\n"
-		showInfo(info)
-	else:
-		showError(gAD, "main", "Please set sExportType correctly.")
+			# search all objects and export spreadsheets
+			exportSheets(gOBs)
+
+			# info
+			info = ""
+			info += translate('sheet2export', 'Exported files')
+			info += ": \n\n" + str(gExpFilesN) + "\n\n"
+			showInfo(info)
+		else:
+			showError(gAD, "main", "Please set sExportType correctly.")
 
 
 # ###################################################################################################################
@@ -43,20 +43,47 @@ def switchApproximation(iA, iB):
 
 
 # ###################################################################################################################
-info = ""
+def getModelExtents(iObjects):
 
-try:
+	# with Woodworking workbench the values for each object are cached by MagicPanels library
+	try:
+		import os, sys
+		import fakemodule
+		
+		path = os.path.join(os.path.dirname(fakemodule.__file__), "Tools", "MagicPanels")
+		if path not in sys.path:
+			sys.path.append(path)
+
+		import MagicPanels
+		return MagicPanels.getModelExtents(iObjects)
+		
+	except ImportError:
+		skip = 1
+
+	# standalone macro
+	points = []
 	
-	init = 0
+	for o in iObjects:
+		try:
+			points += [ ( v.X, v.Y, v.Z ) for v in getattr(o.Shape, "Vertex"+"es") ]
+		except:
+			skip = 1
+
+	if len(points) == 0:
+		return [ 0, 0, 0, 0, 0, 0 ]
+
+	[ xs, ys, zs ] = zip(*points)
 	
-	minX = 0
-	minY = 0
-	minZ = 0
+	return [ min(xs), min(ys), min(zs), max(xs), max(ys), max(zs) ]
 
-	maxX = 0
-	maxY = 0
-	maxZ = 0
 
+# ###################################################################################################################
+info = ""
+
+try:
+	
+	objects = []
+	
 	for o in FreeCAD.ActiveDocument.Objects:
 		
 		# allow to move and rotate many elements packed in container 
@@ -70,39 +97,9 @@ try:
 			):
 			continue
 		
-		try:
-			
-			vs = getattr(o.Shape, "Vertex"+"es")
-			
-			for v in vs:
-				
-				[ x, y, z ] = [ v.X, v.Y, v.Z ]
-				
-				if init == 0:
-					[ minX, minY, minZ ] = [ x, y, z ]
-					[ maxX, maxY, maxZ ] = [ x, y, z ]
-					init = 1
-				
-				if x > maxX:
-					maxX = x
-				
-				if y > maxY:
-					maxY = y
-
-				if z > maxZ:
-					maxZ = z
-
-				if x < minX:
-					minX = x
-
-				if y < minY:
-					minY = y
-
-				if z < minZ:
-					minZ = z
+		objects.append(o)
 
-		except:
-			skip = 1
+	[ minX, minY, minZ, maxX, maxY, maxZ ] = getModelExtents(objects)
 
 	s1 = switchApproximation(minX, maxX)
 	s2 = switchApproximation(minY, maxY)
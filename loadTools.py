@@ -10,4210 +10,72 @@ import os, sys
 import fakemodule
 path = os.path.dirname(fakemodule.__file__)
 iconPath = os.path.join(path, "Icons")
+toolsPath = os.path.join(path, "Tools")
 
+# tools directories are registered only once, so the tools can import MagicPanels library and other modules
+for p in [ toolsPath, os.path.join(toolsPath, "MagicPanels") ]:
+	if p not in sys.path:
+		sys.path.append(p)
 
-# ######################################################################################################################
-class magicStart():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicStart.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicStart", "tool to create furniture"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicStart", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicStart"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicStart", magicStart())
-
-	
-# ######################################################################################################################
-class panelDefaultXY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelDefaultXY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelDefaultXY", "panel, XY, 600x300, 18 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelDefaultXY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelDefaultXY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelDefaultXY", panelDefaultXY())
-
-	
-# ######################################################################################################################
-class panelDefaultYX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelDefaultYX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelDefaultYX", "panel, YX, 300x600, 18 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelDefaultYX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelDefaultYX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelDefaultYX", panelDefaultYX())
-
-	
-# ######################################################################################################################
-class panelDefaultXZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelDefaultXZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelDefaultXZ", "panel, XZ, 600x300, 18 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelDefaultXZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelDefaultXZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelDefaultXZ", panelDefaultXZ())
-
-	
-# ######################################################################################################################
-class panelDefaultZX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelDefaultZX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelDefaultZX", "panel, ZX, 300x600, 18 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelDefaultZX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelDefaultZX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelDefaultZX", panelDefaultZX())
-
-	
-# ######################################################################################################################
-class panelDefaultYZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelDefaultYZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelDefaultYZ", "panel, YZ, 600x300, 18 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelDefaultYZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelDefaultYZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelDefaultYZ", panelDefaultYZ())
-
-	
-# ######################################################################################################################
-class panelDefaultZY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelDefaultZY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelDefaultZY", "panel, ZY, 300x600, 18 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelDefaultZY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelDefaultZY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelDefaultZY", panelDefaultZY())
-
-	
-# ######################################################################################################################
-class panelCopyXY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelCopyXY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelCopyXY", "copy panel, XY"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelCopyXY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelCopyXY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelCopyXY", panelCopyXY())
-
-	
-# ######################################################################################################################
-class panelCopyYX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelCopyYX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelCopyYX", "copy panel, YX"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelCopyYX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelCopyYX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelCopyYX", panelCopyYX())
-
-	
-# ######################################################################################################################
-class panelCopyXZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelCopyXZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelCopyXZ", "copy panel, XZ"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelCopyXZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelCopyXZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelCopyXZ", panelCopyXZ())
-
-	
-# ######################################################################################################################
-class panelCopyZX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelCopyZX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelCopyZX", "copy panel, ZX"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelCopyZX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelCopyZX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelCopyZX", panelCopyZX())
-
-	
-# ######################################################################################################################
-class panelCopyYZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelCopyYZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelCopyYZ", "copy panel, YZ"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelCopyYZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelCopyYZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelCopyYZ", panelCopyYZ())
-
-	
-# ######################################################################################################################
-class panelCopyZY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelCopyZY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelCopyZY", "copy panel, ZY"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelCopyZY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelCopyZY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelCopyZY", panelCopyZY())
-
-	
-# ######################################################################################################################
-class magicMove():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicMove.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicMove", "magicMove"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicMove", "Tool to move, copy and mirror parts of the furniture."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicMove"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicMove", magicMove())
-
-	
-# ######################################################################################################################
-class magicAngle():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicAngle.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicAngle", "magicAngle"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicAngle", "Tool to rotate, for example open furniture fronts."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicAngle"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicAngle", magicAngle())
-
-	
-# ######################################################################################################################
-class mapPosition():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "mapPosition.png"),
-				"MenuText": QT_TRANSLATE_NOOP("mapPosition", "move to 1st selected"),
-				"ToolTip" : QT_TRANSLATE_NOOP("mapPosition", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "mapPosition"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("mapPosition", mapPosition())
-
-	
-# ######################################################################################################################
-class panelMove2Face():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMove2Face.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMove2Face", "panel, move, to face"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMove2Face", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMove2Face"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMove2Face", panelMove2Face())
-
-	
-# ######################################################################################################################
-class panelMove2Anchor():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMove2Anchor.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMove2Anchor", "panel, move, to anchor"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMove2Anchor", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMove2Anchor"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMove2Anchor", panelMove2Anchor())
-
-	
-# ######################################################################################################################
-class panelMove2Center():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMove2Center.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMove2Center", "panel, move, to center"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMove2Center", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMove2Center"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMove2Center", panelMove2Center())
-
-	
-# ######################################################################################################################
-class shelvesEqual():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "shelvesEqual.png"),
-				"MenuText": QT_TRANSLATE_NOOP("shelvesEqual", "make equal space between shelves"),
-				"ToolTip" : QT_TRANSLATE_NOOP("shelvesEqual", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "shelvesEqual"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("shelvesEqual", shelvesEqual())
-
-	
-# ######################################################################################################################
-class align2Curve():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "align2Curve.png"),
-				"MenuText": QT_TRANSLATE_NOOP("align2Curve", "align panel to curve"),
-				"ToolTip" : QT_TRANSLATE_NOOP("align2Curve", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "align2Curve"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("align2Curve", align2Curve())
-
-	
-# ######################################################################################################################
-class panelMoveXp():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMoveXp.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMoveXp", "panel, move, back"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMoveXp", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMoveXp"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMoveXp", panelMoveXp())
-
-	
-# ######################################################################################################################
-class panelMoveXm():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMoveXm.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMoveXm", "panel, move, forward"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMoveXm", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMoveXm"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMoveXm", panelMoveXm())
-
-	
-# ######################################################################################################################
-class panelMoveYp():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMoveYp.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMoveYp", "panel, move, right"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMoveYp", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMoveYp"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMoveYp", panelMoveYp())
-
-	
-# ######################################################################################################################
-class panelMoveYm():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMoveYm.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMoveYm", "panel, move, left"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMoveYm", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMoveYm"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMoveYm", panelMoveYm())
-
-	
-# ######################################################################################################################
-class panelMoveZp():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMoveZp.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMoveZp", "panel, move, up"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMoveZp", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMoveZp"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMoveZp", panelMoveZp())
-
-	
-# ######################################################################################################################
-class panelMoveZm():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelMoveZm.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelMoveZm", "panel, move, down"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelMoveZm", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelMoveZm"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelMoveZm", panelMoveZm())
-
-	
-# ######################################################################################################################
-class magicResizer():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicResizer.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicResizer", "magicResizer, smart resizer tool"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicResizer", "This tool allows to resize object via selected edge or to the nearest face of other object."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicResizer"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicResizer", magicResizer())
-
-	
-# ######################################################################################################################
-class showConstraints():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "showConstraints.png"),
-				"MenuText": QT_TRANSLATE_NOOP("showConstraints", "select edges equal to constraints"),
-				"ToolTip" : QT_TRANSLATE_NOOP("showConstraints", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "showConstraints"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("showConstraints", showConstraints())
-
-	
-# ######################################################################################################################
-class panelResize1():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelResize1.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelResize1", "panel, bigger, long+"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelResize1", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelResize1"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelResize1", panelResize1())
-
-	
-# ######################################################################################################################
-class panelResize2():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelResize2.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelResize2", "panel, smaller, long-"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelResize2", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelResize2"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelResize2", panelResize2())
-
-	
-# ######################################################################################################################
-class panelResize3():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelResize3.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelResize3", "panel, bigger, short+"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelResize3", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelResize3"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelResize3", panelResize3())
-
-	
-# ######################################################################################################################
-class panelResize4():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelResize4.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelResize4", "panel, smaller, short-"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelResize4", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelResize4"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelResize4", panelResize4())
-
-	
-# ######################################################################################################################
-class panelResize5():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelResize5.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelResize5", "panel, bigger, thickness+"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelResize5", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelResize5"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelResize5", panelResize5())
-
-	
-# ######################################################################################################################
-class panelResize6():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelResize6.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelResize6", "panel, smaller, thickness-"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelResize6", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelResize6"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelResize6", panelResize6())
-
-	
-# ######################################################################################################################
-class panelFaceXY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelFaceXY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelFaceXY", "copy panel, face, XY"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelFaceXY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelFaceXY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelFaceXY", panelFaceXY())
-
-	
-# ######################################################################################################################
-class panelFaceYX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelFaceYX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelFaceYX", "copy panel, face, YX"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelFaceYX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelFaceYX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelFaceYX", panelFaceYX())
-
-	
-# ######################################################################################################################
-class panelFaceXZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelFaceXZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelFaceXZ", "copy panel, face, XZ"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelFaceXZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelFaceXZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelFaceXZ", panelFaceXZ())
-
-	
-# ######################################################################################################################
-class panelFaceZX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelFaceZX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelFaceZX", "copy panel, face, ZX"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelFaceZX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelFaceZX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelFaceZX", panelFaceZX())
-
-	
-# ######################################################################################################################
-class panelFaceYZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelFaceYZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelFaceYZ", "copy panel, face, YZ"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelFaceYZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelFaceYZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelFaceYZ", panelFaceYZ())
-
-	
-# ######################################################################################################################
-class panelFaceZY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelFaceZY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelFaceZY", "copy panel, face, ZY"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelFaceZY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelFaceZY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelFaceZY", panelFaceZY())
-
-	
-# ######################################################################################################################
-class panelBetweenXY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelBetweenXY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelBetweenXY", "panel, between, XY"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelBetweenXY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelBetweenXY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelBetweenXY", panelBetweenXY())
-
-	
-# ######################################################################################################################
-class panelBetweenYX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelBetweenYX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelBetweenYX", "panel, between, YX"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelBetweenYX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelBetweenYX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelBetweenYX", panelBetweenYX())
-
-	
-# ######################################################################################################################
-class panelBetweenXZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelBetweenXZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelBetweenXZ", "panel, between, XZ"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelBetweenXZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelBetweenXZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelBetweenXZ", panelBetweenXZ())
-
-	
-# ######################################################################################################################
-class panelBetweenZX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelBetweenZX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelBetweenZX", "panel, between, ZX"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelBetweenZX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelBetweenZX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelBetweenZX", panelBetweenZX())
-
-	
-# ######################################################################################################################
-class panelBetweenYZ():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelBetweenYZ.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelBetweenYZ", "panel, between, YZ"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelBetweenYZ", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelBetweenYZ"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelBetweenYZ", panelBetweenYZ())
-
-	
-# ######################################################################################################################
-class panelBetweenZY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelBetweenZY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelBetweenZY", "panel, between, ZY"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelBetweenZY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelBetweenZY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelBetweenZY", panelBetweenZY())
-
-	
-# ######################################################################################################################
-class magicManager():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicManager.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicManager", "magicManager"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicManager", "If you have problem with unexpected result of face or between Magic Panels, you can use this tool to preview panel before creation. It may take more time to create panel, but you can select exact panel to apply, also the edge and vertex position. This tool allows to create panel at selected face or between two faces."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicManager"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicManager", magicManager())
-
-	
-# ######################################################################################################################
-class panelSideLeft():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelSideLeft.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelSideLeft", "panel, side, left"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelSideLeft", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelSideLeft"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelSideLeft", panelSideLeft())
-
-	
-# ######################################################################################################################
-class panelSideLeftUP():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelSideLeftUP.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelSideLeftUP", "panel, side, left, up"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelSideLeftUP", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelSideLeftUP"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelSideLeftUP", panelSideLeftUP())
-
-	
-# ######################################################################################################################
-class panelSideRight():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelSideRight.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelSideRight", "panel, side, right"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelSideRight", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelSideRight"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelSideRight", panelSideRight())
-
-	
-# ######################################################################################################################
-class panelSideRightUP():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelSideRightUP.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelSideRightUP", "panel, side, right, up"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelSideRightUP", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelSideRightUP"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelSideRightUP", panelSideRightUP())
-
-	
-# ######################################################################################################################
-class panelBackOut():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelBackOut.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelBackOut", "panel, back, out"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelBackOut", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelBackOut"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelBackOut", panelBackOut())
-
-	
-# ######################################################################################################################
-class panelCoverXY():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panelCoverXY.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panelCoverXY", "panel, top, cover"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panelCoverXY", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panelCoverXY"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panelCoverXY", panelCoverXY())
-
-	
-# ######################################################################################################################
-class panel2profile():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panel2profile.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panel2profile", "construction profile"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panel2profile", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panel2profile"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panel2profile", panel2profile())
-
-	
-# ######################################################################################################################
-class panel2angle():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panel2angle.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panel2angle", "construction angle"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panel2angle", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panel2angle"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panel2angle", panel2angle())
-
-	
-# ######################################################################################################################
-class panel2angle45cut():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panel2angle45cut.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panel2angle45cut", "construction angle 45 cut"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panel2angle45cut", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panel2angle45cut"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panel2angle45cut", panel2angle45cut())
-
-	
-# ######################################################################################################################
-class cornerBlock():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "cornerBlock.png"),
-				"MenuText": QT_TRANSLATE_NOOP("cornerBlock", "table corner block"),
-				"ToolTip" : QT_TRANSLATE_NOOP("cornerBlock", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "cornerBlock"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("cornerBlock", cornerBlock())
-
-	
-# ######################################################################################################################
-class cornerBrace():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "cornerBrace.png"),
-				"MenuText": QT_TRANSLATE_NOOP("cornerBrace", "table corner brace"),
-				"ToolTip" : QT_TRANSLATE_NOOP("cornerBrace", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "cornerBrace"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("cornerBrace", cornerBrace())
-
-	
-# ######################################################################################################################
-class magicDowels():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicDowels.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicDowels", "magicDowels"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicDowels", "This tool allows to add mounting points to the furniture. For example you can easily add dowels or reference points for screws, shelves supporter pins or custom mounting points."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicDowels"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicDowels", magicDowels())
-
-	
-# ######################################################################################################################
-class panel2link():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panel2link.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panel2link", "replace with links"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panel2link", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panel2link"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panel2link", panel2link())
-
-	
-# ######################################################################################################################
-class panel2clone():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panel2clone.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panel2clone", "replace with clones"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panel2clone", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panel2clone"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panel2clone", panel2clone())
-
-	
-# ######################################################################################################################
-class sketch2dowel():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "sketch2dowel.png"),
-				"MenuText": QT_TRANSLATE_NOOP("sketch2dowel", "dowel from sketch hole and face"),
-				"ToolTip" : QT_TRANSLATE_NOOP("sketch2dowel", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "sketch2dowel"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("sketch2dowel", sketch2dowel())
-
-	
-# ######################################################################################################################
-class edge2dowel():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "edge2dowel.png"),
-				"MenuText": QT_TRANSLATE_NOOP("edge2dowel", "dowel from edge hole"),
-				"ToolTip" : QT_TRANSLATE_NOOP("edge2dowel", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "edge2dowel"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("edge2dowel", edge2dowel())
-
-	
-# ######################################################################################################################
-class magicFixture():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicFixture.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicFixture", "magicFixture"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicFixture", "Allows to add any type of detailed fixture to the furniture. You can create Link or Clone to the realistic looking part."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicFixture"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicFixture", magicFixture())
-
-	
-# ######################################################################################################################
-class edge2drillbit():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "edge2drillbit.png"),
-				"MenuText": QT_TRANSLATE_NOOP("edge2drillbit", "drill bit from edge hole"),
-				"ToolTip" : QT_TRANSLATE_NOOP("edge2drillbit", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "edge2drillbit"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("edge2drillbit", edge2drillbit())
-
-	
-# ######################################################################################################################
-class magicJoints():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicJoints.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicJoints", "magicJoints"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicJoints", "Allows to move, copy joint Sketch pattern and create Mortise and Tenon."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicJoints"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicJoints", magicJoints())
-
-	
-# ######################################################################################################################
-class magicCut():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicCut.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicCut", "single panel cut by many knives with copies"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicCut", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicCut"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicCut", magicCut())
-
-	
-# ######################################################################################################################
-class magicCutLinks():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicCutLinks.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicCutLinks", "single panel cut by many knives with links"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicCutLinks", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicCutLinks"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicCutLinks", magicCutLinks())
-
-	
-# ######################################################################################################################
-class magicKnife():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicKnife.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicKnife", "single knife cut many panels with copies"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicKnife", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicKnife"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicKnife", magicKnife())
-
-	
-# ######################################################################################################################
-class magicKnifeLinks():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicKnifeLinks.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicKnifeLinks", "single knife cut many panels with links"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicKnifeLinks", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicKnifeLinks"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicKnifeLinks", magicKnifeLinks())
-
-	
-# ######################################################################################################################
-class jointTenon():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "jointTenon.png"),
-				"MenuText": QT_TRANSLATE_NOOP("jointTenon", "joint, Tenon"),
-				"ToolTip" : QT_TRANSLATE_NOOP("jointTenon", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "jointTenon"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("jointTenon", jointTenon())
-
-	
-# ######################################################################################################################
-class cutTenons():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "cutTenons.png"),
-				"MenuText": QT_TRANSLATE_NOOP("cutTenons", "cut all tenons from panel"),
-				"ToolTip" : QT_TRANSLATE_NOOP("cutTenons", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "cutTenons"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("cutTenons", cutTenons())
-
-	
-# ######################################################################################################################
-class jointCustom():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "jointCustom.png"),
-				"MenuText": QT_TRANSLATE_NOOP("jointCustom", "joint, Custom"),
-				"ToolTip" : QT_TRANSLATE_NOOP("jointCustom", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "jointCustom"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("jointCustom", jointCustom())
-
-	
-# ######################################################################################################################
-class panel2frame():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panel2frame.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panel2frame", "cubes to frames"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panel2frame", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "panel2frame"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("panel2frame", panel2frame())
-
-	
-# ######################################################################################################################
-class grainH():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "grainH.png"),
-				"MenuText": QT_TRANSLATE_NOOP("grainH", "grain direction marker, horizontal"),
-				"ToolTip" : QT_TRANSLATE_NOOP("grainH", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "grainH"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("grainH", grainH())
-
-	
-# ######################################################################################################################
-class grainV():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "grainV.png"),
-				"MenuText": QT_TRANSLATE_NOOP("grainV", "grain direction marker, vertical"),
-				"ToolTip" : QT_TRANSLATE_NOOP("grainV", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "grainV"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("grainV", grainV())
-
-	
-# ######################################################################################################################
-class grainX():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "grainX.png"),
-				"MenuText": QT_TRANSLATE_NOOP("grainX", "grain direction marker, no grain"),
-				"ToolTip" : QT_TRANSLATE_NOOP("grainX", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "grainX"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("grainX", grainX())
-
-	
-# ######################################################################################################################
-class magicCorner():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicCorner.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicCorner", "create corner connection"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicCorner", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicCorner"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicCorner", magicCorner())
-
-	
-# ######################################################################################################################
-class magicDriller():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicDriller.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicDriller", "magicDriller"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicDriller", "Allows to drill holes, countersinks or counterbores in a series with predefined or custom sequences."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicDriller"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicDriller", magicDriller())
-
-	
-# ######################################################################################################################
-class drillHoles():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "drillHoles.png"),
-				"MenuText": QT_TRANSLATE_NOOP("drillHoles", "drill bit, drill simple holes"),
-				"ToolTip" : QT_TRANSLATE_NOOP("drillHoles", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "drillHoles"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("drillHoles", drillHoles())
-
-	
-# ######################################################################################################################
-class drillCountersinks():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "drillCountersinks.png"),
-				"MenuText": QT_TRANSLATE_NOOP("drillCountersinks", "drill bit, drill countersinks"),
-				"ToolTip" : QT_TRANSLATE_NOOP("drillCountersinks", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "drillCountersinks"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("drillCountersinks", drillCountersinks())
-
-	
-# ######################################################################################################################
-class drillCounterbores():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "drillCounterbores.png"),
-				"MenuText": QT_TRANSLATE_NOOP("drillCounterbores", "drill bit, drill counterbores"),
-				"ToolTip" : QT_TRANSLATE_NOOP("drillCounterbores", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "drillCounterbores"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("drillCounterbores", drillCounterbores())
-
-	
-# ######################################################################################################################
-class drillCounterbores2x():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "drillCounterbores2x.png"),
-				"MenuText": QT_TRANSLATE_NOOP("drillCounterbores2x", "drill bit, drill counterbores from both sides"),
-				"ToolTip" : QT_TRANSLATE_NOOP("drillCounterbores2x", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "drillCounterbores2x"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("drillCounterbores2x", drillCounterbores2x())
-
-	
-# ######################################################################################################################
-class magicCNC():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicCNC.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicCNC", "magicCNC, drill bit move machine"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicCNC", "This tool allows to move drill bit at the selected face and drill holes."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicCNC"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("magicCNC", magicCNC())
-
-	
-# ######################################################################################################################
-class cutDowels():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "cutDowels.png"),
-				"MenuText": QT_TRANSLATE_NOOP("cutDowels", "cut dowels from panel"),
-				"ToolTip" : QT_TRANSLATE_NOOP("cutDowels", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "cutDowels"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("cutDowels", cutDowels())
-
-	
-# ######################################################################################################################
-class routerCove():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerCove.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerCove", "edge to cove, thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerCove", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerCove"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerCove", routerCove())
-
-	
-# ######################################################################################################################
-class routerCove2():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerCove2.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerCove2", "edge to cove, 1/2 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerCove2", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerCove2"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerCove2", routerCove2())
-
-	
-# ######################################################################################################################
-class routerCove4():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerCove4.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerCove4", "edge to cove, 1/4 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerCove4", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerCove4"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerCove4", routerCove4())
-
-	
-# ######################################################################################################################
-class routerRoundOver():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerRoundOver.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerRoundOver", "edge to round over, thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerRoundOver", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerRoundOver"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerRoundOver", routerRoundOver())
-
-	
-# ######################################################################################################################
-class routerRoundOver2():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerRoundOver2.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerRoundOver2", "edge to round over, 1/2 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerRoundOver2", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerRoundOver2"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerRoundOver2", routerRoundOver2())
-
-	
-# ######################################################################################################################
-class routerRoundOver4():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerRoundOver4.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerRoundOver4", "edge to round over, 1/4 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerRoundOver4", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerRoundOver4"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerRoundOver4", routerRoundOver4())
-
-	
-# ######################################################################################################################
-class routerStraight2():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerStraight2.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerStraight2", "edge to straight, 1/2 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerStraight2", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerStraight2"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerStraight2", routerStraight2())
-
-	
-# ######################################################################################################################
-class routerStraight3():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerStraight3.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerStraight3", "edge to straight, 1/3 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerStraight3", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerStraight3"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerStraight3", routerStraight3())
-
-	
-# ######################################################################################################################
-class routerStraight4():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerStraight4.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerStraight4", "edge to straight, 1/4 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerStraight4", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerStraight4"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerStraight4", routerStraight4())
-
-	
-# ######################################################################################################################
-class routerChamfer():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerChamfer.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerChamfer", "edge to chamfer, thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerChamfer", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerChamfer"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerChamfer", routerChamfer())
-
-	
-# ######################################################################################################################
-class routerChamfer2():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerChamfer2.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerChamfer2", "edge to chamfer, 1/2 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerChamfer2", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerChamfer2"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerChamfer2", routerChamfer2())
-
-	
-# ######################################################################################################################
-class routerChamfer4():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "routerChamfer4.png"),
-				"MenuText": QT_TRANSLATE_NOOP("routerChamfer4", "edge to chamfer, 1/4 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("routerChamfer4", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "routerChamfer4"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("routerChamfer4", routerChamfer4())
-
-	
-# ######################################################################################################################
-class multiPocket():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "multiPocket.png"),
-				"MenuText": QT_TRANSLATE_NOOP("multiPocket", "multi Sketch to Pocket, thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("multiPocket", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "multiPocket"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("multiPocket", multiPocket())
-
-	
-# ######################################################################################################################
-class multiPocket2():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "multiPocket2.png"),
-				"MenuText": QT_TRANSLATE_NOOP("multiPocket2", "multi Sketch to Pocket, 1/2 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("multiPocket2", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "multiPocket2"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("multiPocket2", multiPocket2())
-
-	
-# ######################################################################################################################
-class multiPocket4():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "multiPocket4.png"),
-				"MenuText": QT_TRANSLATE_NOOP("multiPocket4", "multi Sketch to Pocket, 1/4 thickness"),
-				"ToolTip" : QT_TRANSLATE_NOOP("multiPocket4", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "multiPocket4"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("multiPocket4", multiPocket4())
-
-	
-# ######################################################################################################################
-class colorManager():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "colorManager.png"),
-				"MenuText": QT_TRANSLATE_NOOP("colorManager", "colorManager"),
-				"ToolTip" : QT_TRANSLATE_NOOP("colorManager", "This tool allows you to browse colors for manually selected faces or objects and see the effect at 3D model in real-time. Also you can set face colors for all objects from spreadsheet. "),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "colorManager"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("colorManager", colorManager())
-
-	
-# ######################################################################################################################
-class setTextures():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "setTextures.png"),
-				"MenuText": QT_TRANSLATE_NOOP("setTextures", "setTextures"),
-				"ToolTip" : QT_TRANSLATE_NOOP("setTextures", "This tool allows to store textures information and load textures. Also solves problem with huge project file size because this tool allows to store only link to texture not texture."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
+# tools already found and compiled, so the macro file is not searched and read again at each click
+gTools = dict()
 
-		modulePath = sys.path
-		
-		module = "setTextures"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
 
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("setTextures", setTextures())
-
-	
 # ######################################################################################################################
-class getDimensions():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "getDimensions.png"),
-				"MenuText": QT_TRANSLATE_NOOP("getDimensions", "getDimensions, BOM, cutlist"),
-				"ToolTip" : QT_TRANSLATE_NOOP("getDimensions", "Creates spreadsheet with dimensions to cut."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "getDimensions"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("getDimensions", getDimensions())
+def isReloadMode():
 
+	# for developers, set Mod/Woodworking/ToolsReload to true at Parameter Editor 
+	# to read the tools from disk again at each click
+	param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Woodworking")
 	
-# ######################################################################################################################
-class sheet2export():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "sheet2export.png"),
-				"MenuText": QT_TRANSLATE_NOOP("sheet2export", "sheet2export"),
-				"ToolTip" : QT_TRANSLATE_NOOP("sheet2export", "Exports spreadsheet to chosen file format."),
-				"Accel"   : "" }
-
-	def Activated(self):
+	return param.GetBool("ToolsReload", False)
 
-		import os, sys
-		import fakemodule
 
-		modulePath = sys.path
-		
-		module = "sheet2export"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("sheet2export", sheet2export())
-
-	
 # ######################################################################################################################
-class showSpaceModel():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "showSpaceModel.png"),
-				"MenuText": QT_TRANSLATE_NOOP("showSpaceModel", "show, model, space"),
-				"ToolTip" : QT_TRANSLATE_NOOP("showSpaceModel", "This tool allows you to calculate the overall occupied space in 3D by the model."),
-				"Accel"   : "" }
+def runTool(iModule, iDir=""):
 
-	def Activated(self):
+	import importlib.util
 
-		import os, sys
-		import fakemodule
+	if iModule in gTools and isReloadMode():
+		del gTools[iModule]
 
-		modulePath = sys.path
-		
-		module = "showSpaceModel"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
+	if iModule not in gTools:
 
-		if module in sys.modules:
-			del sys.modules[module]
+		path = toolsPath
+		if iDir != "":
+			path = os.path.join(path, iDir)
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+		spec = importlib.util.spec_from_file_location(iModule, os.path.join(path, iModule + ".py"))
+		gTools[iModule] = { "spec": spec, "code": spec.loader.get_code(iModule) }
 
-		return
+	tool = gTools[iModule]
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	# tools are macros doing their work at import, so the code is executed as new module 
+	# at each click, the module is not registered at sys.modules, so later import of the tool, 
+	# for example import getDimensions for headless API, does not get the GUI run
+	module = importlib.util.module_from_spec(tool["spec"])
+	exec(tool["code"], module.__dict__)
 
-FreeCADGui.addCommand("showSpaceModel", showSpaceModel())
 
-	
 # ######################################################################################################################
-class showSpaceSelected():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "showSpaceSelected.png"),
-				"MenuText": QT_TRANSLATE_NOOP("showSpaceSelected", "show, selected, space"),
-				"ToolTip" : QT_TRANSLATE_NOOP("showSpaceSelected", "This tool allows you to calculate the overall occupied space in 3D by the selected parts."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "showSpaceSelected"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("showSpaceSelected", showSpaceSelected())
+class ToolCommand():
 
-	
-# ######################################################################################################################
-class magicMeasure():
+	def __init__(self, iDir, iModule, iIcon, iMenuText, iToolTip):
+		self.dir = iDir
+		self.module = iModule
+		self.icon = iIcon
+		self.menuText = iMenuText
+		self.toolTip = iToolTip
 
 	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicMeasure.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicMeasure", "magicMeasure"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicMeasure", "Quick measurement preview on hover or by selection."),
+		return {"Pixmap"  : os.path.join(iconPath, self.module + "." + self.icon),
+				"MenuText": self.menuText,
+				"ToolTip" : self.toolTip,
 				"Accel"   : "" }
 
 	def Activated(self):
 
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "magicMeasure"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+		runTool(self.module, self.dir)
 
 		return
 
@@ -4221,591 +83,514 @@ class magicMeasure():
 		# not needed now, maybe in the future
 		return True
 
-FreeCADGui.addCommand("magicMeasure", magicMeasure())
 
-	
 # ######################################################################################################################
-class selected2Group():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "selected2Group.png"),
-				"MenuText": QT_TRANSLATE_NOOP("selected2Group", "selected to Group"),
-				"ToolTip" : QT_TRANSLATE_NOOP("selected2Group", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
-
-		modulePath = sys.path
-		
-		module = "selected2Group"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
-
-FreeCADGui.addCommand("selected2Group", selected2Group())
-
-	
+# Commands manifest: sub-directory, command and macro name, icon extension, MenuText, ToolTip
 # ######################################################################################################################
-class selected2LinkGroup():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "selected2LinkGroup.png"),
-				"MenuText": QT_TRANSLATE_NOOP("selected2LinkGroup", "selected to LinkGroup"),
-				"ToolTip" : QT_TRANSLATE_NOOP("selected2LinkGroup", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
-
-		import os, sys
-		import fakemodule
 
-		modulePath = sys.path
-		
-		module = "selected2LinkGroup"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+gCommands = [
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "magicStart", "png", 
+		QT_TRANSLATE_NOOP("magicStart", "tool to create furniture"), 
+		QT_TRANSLATE_NOOP("magicStart", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "panelDefaultXY", "png", 
+		QT_TRANSLATE_NOOP("panelDefaultXY", "panel, XY, 600x300, 18 thickness"), 
+		QT_TRANSLATE_NOOP("panelDefaultXY", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "panelDefaultYX", "png", 
+		QT_TRANSLATE_NOOP("panelDefaultYX", "panel, YX, 300x600, 18 thickness"), 
+		QT_TRANSLATE_NOOP("panelDefaultYX", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "panelDefaultXZ", "png", 
+		QT_TRANSLATE_NOOP("panelDefaultXZ", "panel, XZ, 600x300, 18 thickness"), 
+		QT_TRANSLATE_NOOP("panelDefaultXZ", "Click to see info.") ],
 
-FreeCADGui.addCommand("selected2LinkGroup", selected2LinkGroup())
+	[ "MagicPanels", "panelDefaultZX", "png", 
+		QT_TRANSLATE_NOOP("panelDefaultZX", "panel, ZX, 300x600, 18 thickness"), 
+		QT_TRANSLATE_NOOP("panelDefaultZX", "Click to see info.") ],
 
-	
-# ######################################################################################################################
-class selected2Link():
+	[ "MagicPanels", "panelDefaultYZ", "png", 
+		QT_TRANSLATE_NOOP("panelDefaultYZ", "panel, YZ, 600x300, 18 thickness"), 
+		QT_TRANSLATE_NOOP("panelDefaultYZ", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "selected2Link.png"),
-				"MenuText": QT_TRANSLATE_NOOP("selected2Link", "selected to Link"),
-				"ToolTip" : QT_TRANSLATE_NOOP("selected2Link", "Click to see info."),
-				"Accel"   : "" }
+	[ "MagicPanels", "panelDefaultZY", "png", 
+		QT_TRANSLATE_NOOP("panelDefaultZY", "panel, ZY, 300x600, 18 thickness"), 
+		QT_TRANSLATE_NOOP("panelDefaultZY", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "panelCopyXY", "png", 
+		QT_TRANSLATE_NOOP("panelCopyXY", "copy panel, XY"), 
+		QT_TRANSLATE_NOOP("panelCopyXY", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "panelCopyYX", "png", 
+		QT_TRANSLATE_NOOP("panelCopyYX", "copy panel, YX"), 
+		QT_TRANSLATE_NOOP("panelCopyYX", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "selected2Link"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "panelCopyXZ", "png", 
+		QT_TRANSLATE_NOOP("panelCopyXZ", "copy panel, XZ"), 
+		QT_TRANSLATE_NOOP("panelCopyXZ", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "panelCopyZX", "png", 
+		QT_TRANSLATE_NOOP("panelCopyZX", "copy panel, ZX"), 
+		QT_TRANSLATE_NOOP("panelCopyZX", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "panelCopyYZ", "png", 
+		QT_TRANSLATE_NOOP("panelCopyYZ", "copy panel, YZ"), 
+		QT_TRANSLATE_NOOP("panelCopyYZ", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "panelCopyZY", "png", 
+		QT_TRANSLATE_NOOP("panelCopyZY", "copy panel, ZY"), 
+		QT_TRANSLATE_NOOP("panelCopyZY", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "magicMove", "png", 
+		QT_TRANSLATE_NOOP("magicMove", "magicMove"), 
+		QT_TRANSLATE_NOOP("magicMove", "Tool to move, copy and mirror parts of the furniture.") ],
 
-FreeCADGui.addCommand("selected2Link", selected2Link())
+	[ "MagicPanels", "magicAngle", "png", 
+		QT_TRANSLATE_NOOP("magicAngle", "magicAngle"), 
+		QT_TRANSLATE_NOOP("magicAngle", "Tool to rotate, for example open furniture fronts.") ],
 
-	
-# ######################################################################################################################
-class selected2Outside():
+	[ "MagicPanels", "mapPosition", "png", 
+		QT_TRANSLATE_NOOP("mapPosition", "move to 1st selected"), 
+		QT_TRANSLATE_NOOP("mapPosition", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "selected2Outside.png"),
-				"MenuText": QT_TRANSLATE_NOOP("selected2Outside", "move outside the container"),
-				"ToolTip" : QT_TRANSLATE_NOOP("selected2Outside", "Click to see info."),
-				"Accel"   : "" }
+	[ "MagicPanels", "panelMove2Face", "png", 
+		QT_TRANSLATE_NOOP("panelMove2Face", "panel, move, to face"), 
+		QT_TRANSLATE_NOOP("panelMove2Face", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "panelMove2Anchor", "png", 
+		QT_TRANSLATE_NOOP("panelMove2Anchor", "panel, move, to anchor"), 
+		QT_TRANSLATE_NOOP("panelMove2Anchor", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "panelMove2Center", "png", 
+		QT_TRANSLATE_NOOP("panelMove2Center", "panel, move, to center"), 
+		QT_TRANSLATE_NOOP("panelMove2Center", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "selected2Outside"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "shelvesEqual", "png", 
+		QT_TRANSLATE_NOOP("shelvesEqual", "make equal space between shelves"), 
+		QT_TRANSLATE_NOOP("shelvesEqual", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "align2Curve", "png", 
+		QT_TRANSLATE_NOOP("align2Curve", "align panel to curve"), 
+		QT_TRANSLATE_NOOP("align2Curve", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "panelMoveXp", "png", 
+		QT_TRANSLATE_NOOP("panelMoveXp", "panel, move, back"), 
+		QT_TRANSLATE_NOOP("panelMoveXp", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "panelMoveXm", "png", 
+		QT_TRANSLATE_NOOP("panelMoveXm", "panel, move, forward"), 
+		QT_TRANSLATE_NOOP("panelMoveXm", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "panelMoveYp", "png", 
+		QT_TRANSLATE_NOOP("panelMoveYp", "panel, move, right"), 
+		QT_TRANSLATE_NOOP("panelMoveYp", "Click to see info.") ],
 
-FreeCADGui.addCommand("selected2Outside", selected2Outside())
+	[ "MagicPanels", "panelMoveYm", "png", 
+		QT_TRANSLATE_NOOP("panelMoveYm", "panel, move, left"), 
+		QT_TRANSLATE_NOOP("panelMoveYm", "Click to see info.") ],
 
-	
-# ######################################################################################################################
-class scanObjects():
+	[ "MagicPanels", "panelMoveZp", "png", 
+		QT_TRANSLATE_NOOP("panelMoveZp", "panel, move, up"), 
+		QT_TRANSLATE_NOOP("panelMoveZp", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "scanObjects.png"),
-				"MenuText": QT_TRANSLATE_NOOP("scanObjects", "scanObjects"),
-				"ToolTip" : QT_TRANSLATE_NOOP("scanObjects", "Inspection tool for FreeCAD macro development & project debug (live API)."),
-				"Accel"   : "" }
+	[ "MagicPanels", "panelMoveZm", "png", 
+		QT_TRANSLATE_NOOP("panelMoveZm", "panel, move, down"), 
+		QT_TRANSLATE_NOOP("panelMoveZm", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "magicResizer", "png", 
+		QT_TRANSLATE_NOOP("magicResizer", "magicResizer, smart resizer tool"), 
+		QT_TRANSLATE_NOOP("magicResizer", "This tool allows to resize object via selected edge or to the nearest face of other object.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "showConstraints", "png", 
+		QT_TRANSLATE_NOOP("showConstraints", "select edges equal to constraints"), 
+		QT_TRANSLATE_NOOP("showConstraints", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "scanObjects"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
+	[ "MagicPanels", "panelResize1", "png", 
+		QT_TRANSLATE_NOOP("panelResize1", "panel, bigger, long+"), 
+		QT_TRANSLATE_NOOP("panelResize1", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "panelResize2", "png", 
+		QT_TRANSLATE_NOOP("panelResize2", "panel, smaller, long-"), 
+		QT_TRANSLATE_NOOP("panelResize2", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "panelResize3", "png", 
+		QT_TRANSLATE_NOOP("panelResize3", "panel, bigger, short+"), 
+		QT_TRANSLATE_NOOP("panelResize3", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "panelResize4", "png", 
+		QT_TRANSLATE_NOOP("panelResize4", "panel, smaller, short-"), 
+		QT_TRANSLATE_NOOP("panelResize4", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "panelResize5", "png", 
+		QT_TRANSLATE_NOOP("panelResize5", "panel, bigger, thickness+"), 
+		QT_TRANSLATE_NOOP("panelResize5", "Click to see info.") ],
 
-FreeCADGui.addCommand("scanObjects", scanObjects())
+	[ "MagicPanels", "panelResize6", "png", 
+		QT_TRANSLATE_NOOP("panelResize6", "panel, smaller, thickness-"), 
+		QT_TRANSLATE_NOOP("panelResize6", "Click to see info.") ],
 
-	
-# ######################################################################################################################
-class debugInfo():
+	[ "MagicPanels", "panelFaceXY", "png", 
+		QT_TRANSLATE_NOOP("panelFaceXY", "copy panel, face, XY"), 
+		QT_TRANSLATE_NOOP("panelFaceXY", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "debugInfo.png"),
-				"MenuText": QT_TRANSLATE_NOOP("debugInfo", "debugInfo"),
-				"ToolTip" : QT_TRANSLATE_NOOP("debugInfo", "This too shows installation information and allows to update if there is new version available."),
-				"Accel"   : "" }
+	[ "MagicPanels", "panelFaceYX", "png", 
+		QT_TRANSLATE_NOOP("panelFaceYX", "copy panel, face, YX"), 
+		QT_TRANSLATE_NOOP("panelFaceYX", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "panelFaceXZ", "png", 
+		QT_TRANSLATE_NOOP("panelFaceXZ", "copy panel, face, XZ"), 
+		QT_TRANSLATE_NOOP("panelFaceXZ", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "panelFaceZX", "png", 
+		QT_TRANSLATE_NOOP("panelFaceZX", "copy panel, face, ZX"), 
+		QT_TRANSLATE_NOOP("panelFaceZX", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "debugInfo"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
+	[ "MagicPanels", "panelFaceYZ", "png", 
+		QT_TRANSLATE_NOOP("panelFaceYZ", "copy panel, face, YZ"), 
+		QT_TRANSLATE_NOOP("panelFaceYZ", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "panelFaceZY", "png", 
+		QT_TRANSLATE_NOOP("panelFaceZY", "copy panel, face, ZY"), 
+		QT_TRANSLATE_NOOP("panelFaceZY", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "panelBetweenXY", "png", 
+		QT_TRANSLATE_NOOP("panelBetweenXY", "panel, between, XY"), 
+		QT_TRANSLATE_NOOP("panelBetweenXY", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "panelBetweenYX", "png", 
+		QT_TRANSLATE_NOOP("panelBetweenYX", "panel, between, YX"), 
+		QT_TRANSLATE_NOOP("panelBetweenYX", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "panelBetweenXZ", "png", 
+		QT_TRANSLATE_NOOP("panelBetweenXZ", "panel, between, XZ"), 
+		QT_TRANSLATE_NOOP("panelBetweenXZ", "Click to see info.") ],
 
-FreeCADGui.addCommand("debugInfo", debugInfo())
+	[ "MagicPanels", "panelBetweenZX", "png", 
+		QT_TRANSLATE_NOOP("panelBetweenZX", "panel, between, ZX"), 
+		QT_TRANSLATE_NOOP("panelBetweenZX", "Click to see info.") ],
 
-	
-# ######################################################################################################################
-class magicGlue():
+	[ "MagicPanels", "panelBetweenYZ", "png", 
+		QT_TRANSLATE_NOOP("panelBetweenYZ", "panel, between, YZ"), 
+		QT_TRANSLATE_NOOP("panelBetweenYZ", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "magicGlue.png"),
-				"MenuText": QT_TRANSLATE_NOOP("magicGlue", "magicGlue"),
-				"ToolTip" : QT_TRANSLATE_NOOP("magicGlue", "This tool allows to add or remove expressions."),
-				"Accel"   : "" }
+	[ "MagicPanels", "panelBetweenZY", "png", 
+		QT_TRANSLATE_NOOP("panelBetweenZY", "panel, between, ZY"), 
+		QT_TRANSLATE_NOOP("panelBetweenZY", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "magicManager", "png", 
+		QT_TRANSLATE_NOOP("magicManager", "magicManager"), 
+		QT_TRANSLATE_NOOP("magicManager", "If you have problem with unexpected result of face or between Magic Panels, you can use this tool to preview panel before creation. It may take more time to create panel, but you can select exact panel to apply, also the edge and vertex position. This tool allows to create panel at selected face or between two faces.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "panelSideLeft", "png", 
+		QT_TRANSLATE_NOOP("panelSideLeft", "panel, side, left"), 
+		QT_TRANSLATE_NOOP("panelSideLeft", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "magicGlue"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "panelSideLeftUP", "png", 
+		QT_TRANSLATE_NOOP("panelSideLeftUP", "panel, side, left, up"), 
+		QT_TRANSLATE_NOOP("panelSideLeftUP", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "panelSideRight", "png", 
+		QT_TRANSLATE_NOOP("panelSideRight", "panel, side, right"), 
+		QT_TRANSLATE_NOOP("panelSideRight", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "panelSideRightUP", "png", 
+		QT_TRANSLATE_NOOP("panelSideRightUP", "panel, side, right, up"), 
+		QT_TRANSLATE_NOOP("panelSideRightUP", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "panelBackOut", "png", 
+		QT_TRANSLATE_NOOP("panelBackOut", "panel, back, out"), 
+		QT_TRANSLATE_NOOP("panelBackOut", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "panelCoverXY", "png", 
+		QT_TRANSLATE_NOOP("panelCoverXY", "panel, top, cover"), 
+		QT_TRANSLATE_NOOP("panelCoverXY", "Click to see info.") ],
 
-FreeCADGui.addCommand("magicGlue", magicGlue())
+	[ "MagicPanels", "panel2profile", "png", 
+		QT_TRANSLATE_NOOP("panel2profile", "construction profile"), 
+		QT_TRANSLATE_NOOP("panel2profile", "Click to see info.") ],
 
-	
-# ######################################################################################################################
-class sketch2clone():
+	[ "MagicPanels", "panel2angle", "png", 
+		QT_TRANSLATE_NOOP("panel2angle", "construction angle"), 
+		QT_TRANSLATE_NOOP("panel2angle", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "sketch2clone.png"),
-				"MenuText": QT_TRANSLATE_NOOP("sketch2clone", "Convert sketches to clones."),
-				"ToolTip" : QT_TRANSLATE_NOOP("sketch2clone", "Click to see info."),
-				"Accel"   : "" }
+	[ "MagicPanels", "panel2angle45cut", "png", 
+		QT_TRANSLATE_NOOP("panel2angle45cut", "construction angle 45 cut"), 
+		QT_TRANSLATE_NOOP("panel2angle45cut", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "cornerBlock", "png", 
+		QT_TRANSLATE_NOOP("cornerBlock", "table corner block"), 
+		QT_TRANSLATE_NOOP("cornerBlock", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "cornerBrace", "png", 
+		QT_TRANSLATE_NOOP("cornerBrace", "table corner brace"), 
+		QT_TRANSLATE_NOOP("cornerBrace", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "sketch2clone"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "magicDowels", "png", 
+		QT_TRANSLATE_NOOP("magicDowels", "magicDowels"), 
+		QT_TRANSLATE_NOOP("magicDowels", "This tool allows to add mounting points to the furniture. For example you can easily add dowels or reference points for screws, shelves supporter pins or custom mounting points.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "panel2link", "png", 
+		QT_TRANSLATE_NOOP("panel2link", "replace with links"), 
+		QT_TRANSLATE_NOOP("panel2link", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "panel2clone", "png", 
+		QT_TRANSLATE_NOOP("panel2clone", "replace with clones"), 
+		QT_TRANSLATE_NOOP("panel2clone", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "sketch2dowel", "png", 
+		QT_TRANSLATE_NOOP("sketch2dowel", "dowel from sketch hole and face"), 
+		QT_TRANSLATE_NOOP("sketch2dowel", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "edge2dowel", "png", 
+		QT_TRANSLATE_NOOP("edge2dowel", "dowel from edge hole"), 
+		QT_TRANSLATE_NOOP("edge2dowel", "Click to see info.") ],
 
-FreeCADGui.addCommand("sketch2clone", sketch2clone())
+	[ "MagicPanels", "magicFixture", "png", 
+		QT_TRANSLATE_NOOP("magicFixture", "magicFixture"), 
+		QT_TRANSLATE_NOOP("magicFixture", "Allows to add any type of detailed fixture to the furniture. You can create Link or Clone to the realistic looking part.") ],
 
-	
-# ######################################################################################################################
-class showAlias():
+	[ "MagicPanels", "edge2drillbit", "png", 
+		QT_TRANSLATE_NOOP("edge2drillbit", "drill bit from edge hole"), 
+		QT_TRANSLATE_NOOP("edge2drillbit", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "showAlias.png"),
-				"MenuText": QT_TRANSLATE_NOOP("showAlias", "Select objects with alias."),
-				"ToolTip" : QT_TRANSLATE_NOOP("showAlias", "Click to see info."),
-				"Accel"   : "" }
+	[ "MagicPanels", "magicJoints", "png", 
+		QT_TRANSLATE_NOOP("magicJoints", "magicJoints"), 
+		QT_TRANSLATE_NOOP("magicJoints", "Allows to move, copy joint Sketch pattern and create Mortise and Tenon.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "magicCut", "png", 
+		QT_TRANSLATE_NOOP("magicCut", "single panel cut by many knives with copies"), 
+		QT_TRANSLATE_NOOP("magicCut", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "magicCutLinks", "png", 
+		QT_TRANSLATE_NOOP("magicCutLinks", "single panel cut by many knives with links"), 
+		QT_TRANSLATE_NOOP("magicCutLinks", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "showAlias"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "magicKnife", "png", 
+		QT_TRANSLATE_NOOP("magicKnife", "single knife cut many panels with copies"), 
+		QT_TRANSLATE_NOOP("magicKnife", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "magicKnifeLinks", "png", 
+		QT_TRANSLATE_NOOP("magicKnifeLinks", "single knife cut many panels with links"), 
+		QT_TRANSLATE_NOOP("magicKnifeLinks", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "jointTenon", "png", 
+		QT_TRANSLATE_NOOP("jointTenon", "joint, Tenon"), 
+		QT_TRANSLATE_NOOP("jointTenon", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "cutTenons", "png", 
+		QT_TRANSLATE_NOOP("cutTenons", "cut all tenons from panel"), 
+		QT_TRANSLATE_NOOP("cutTenons", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "jointCustom", "png", 
+		QT_TRANSLATE_NOOP("jointCustom", "joint, Custom"), 
+		QT_TRANSLATE_NOOP("jointCustom", "Click to see info.") ],
 
-FreeCADGui.addCommand("showAlias", showAlias())
+	[ "MagicPanels", "panel2frame", "png", 
+		QT_TRANSLATE_NOOP("panel2frame", "cubes to frames"), 
+		QT_TRANSLATE_NOOP("panel2frame", "Click to see info.") ],
 
-	
-# ######################################################################################################################
-class panel2pad():
+	[ "MagicPanels", "grainH", "png", 
+		QT_TRANSLATE_NOOP("grainH", "grain direction marker, horizontal"), 
+		QT_TRANSLATE_NOOP("grainH", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "panel2pad.png"),
-				"MenuText": QT_TRANSLATE_NOOP("panel2pad", "cube to pad"),
-				"ToolTip" : QT_TRANSLATE_NOOP("panel2pad", "Click to see info."),
-				"Accel"   : "" }
+	[ "MagicPanels", "grainV", "png", 
+		QT_TRANSLATE_NOOP("grainV", "grain direction marker, vertical"), 
+		QT_TRANSLATE_NOOP("grainV", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "grainX", "png", 
+		QT_TRANSLATE_NOOP("grainX", "grain direction marker, no grain"), 
+		QT_TRANSLATE_NOOP("grainX", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "magicCorner", "png", 
+		QT_TRANSLATE_NOOP("magicCorner", "create corner connection"), 
+		QT_TRANSLATE_NOOP("magicCorner", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "panel2pad"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "magicDriller", "png", 
+		QT_TRANSLATE_NOOP("magicDriller", "magicDriller"), 
+		QT_TRANSLATE_NOOP("magicDriller", "Allows to drill holes, countersinks or counterbores in a series with predefined or custom sequences.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "drillHoles", "png", 
+		QT_TRANSLATE_NOOP("drillHoles", "drill bit, drill simple holes"), 
+		QT_TRANSLATE_NOOP("drillHoles", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "drillCountersinks", "png", 
+		QT_TRANSLATE_NOOP("drillCountersinks", "drill bit, drill countersinks"), 
+		QT_TRANSLATE_NOOP("drillCountersinks", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "drillCounterbores", "png", 
+		QT_TRANSLATE_NOOP("drillCounterbores", "drill bit, drill counterbores"), 
+		QT_TRANSLATE_NOOP("drillCounterbores", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "drillCounterbores2x", "png", 
+		QT_TRANSLATE_NOOP("drillCounterbores2x", "drill bit, drill counterbores from both sides"), 
+		QT_TRANSLATE_NOOP("drillCounterbores2x", "Click to see info.") ],
 
-FreeCADGui.addCommand("panel2pad", panel2pad())
+	[ "MagicPanels", "magicCNC", "png", 
+		QT_TRANSLATE_NOOP("magicCNC", "magicCNC, drill bit move machine"), 
+		QT_TRANSLATE_NOOP("magicCNC", "This tool allows to move drill bit at the selected face and drill holes.") ],
 
-	
-# ######################################################################################################################
-class fitModel():
+	[ "MagicPanels", "cutDowels", "png", 
+		QT_TRANSLATE_NOOP("cutDowels", "cut dowels from panel"), 
+		QT_TRANSLATE_NOOP("cutDowels", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "fitModel.png"),
-				"MenuText": QT_TRANSLATE_NOOP("fitModel", "fitModel"),
-				"ToolTip" : QT_TRANSLATE_NOOP("fitModel", "Click to see info."),
-				"Accel"   : "" }
+	[ "MagicPanels", "routerCove", "png", 
+		QT_TRANSLATE_NOOP("routerCove", "edge to cove, thickness"), 
+		QT_TRANSLATE_NOOP("routerCove", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "routerCove2", "png", 
+		QT_TRANSLATE_NOOP("routerCove2", "edge to cove, 1/2 thickness"), 
+		QT_TRANSLATE_NOOP("routerCove2", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "routerCove4", "png", 
+		QT_TRANSLATE_NOOP("routerCove4", "edge to cove, 1/4 thickness"), 
+		QT_TRANSLATE_NOOP("routerCove4", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "fitModel"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "routerRoundOver", "png", 
+		QT_TRANSLATE_NOOP("routerRoundOver", "edge to round over, thickness"), 
+		QT_TRANSLATE_NOOP("routerRoundOver", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "routerRoundOver2", "png", 
+		QT_TRANSLATE_NOOP("routerRoundOver2", "edge to round over, 1/2 thickness"), 
+		QT_TRANSLATE_NOOP("routerRoundOver2", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "routerRoundOver4", "png", 
+		QT_TRANSLATE_NOOP("routerRoundOver4", "edge to round over, 1/4 thickness"), 
+		QT_TRANSLATE_NOOP("routerRoundOver4", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "routerStraight2", "png", 
+		QT_TRANSLATE_NOOP("routerStraight2", "edge to straight, 1/2 thickness"), 
+		QT_TRANSLATE_NOOP("routerStraight2", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "MagicPanels", "routerStraight3", "png", 
+		QT_TRANSLATE_NOOP("routerStraight3", "edge to straight, 1/3 thickness"), 
+		QT_TRANSLATE_NOOP("routerStraight3", "Click to see info.") ],
 
-FreeCADGui.addCommand("fitModel", fitModel())
+	[ "MagicPanels", "routerStraight4", "png", 
+		QT_TRANSLATE_NOOP("routerStraight4", "edge to straight, 1/4 thickness"), 
+		QT_TRANSLATE_NOOP("routerStraight4", "Click to see info.") ],
 
-	
-# ######################################################################################################################
-class makeTransparent():
+	[ "MagicPanels", "routerChamfer", "png", 
+		QT_TRANSLATE_NOOP("routerChamfer", "edge to chamfer, thickness"), 
+		QT_TRANSLATE_NOOP("routerChamfer", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "makeTransparent.png"),
-				"MenuText": QT_TRANSLATE_NOOP("makeTransparent", "transparent or normal mode"),
-				"ToolTip" : QT_TRANSLATE_NOOP("makeTransparent", "Make all parts transparent, so you can see all the joints, pilot holes, screws, countersinks. If you click next one all parts will back to normal. The transparent default is 83, so do not set any part to this number if you want e.g. to keep glass part of the furniture transparent after this preview."),
-				"Accel"   : "" }
+	[ "MagicPanels", "routerChamfer2", "png", 
+		QT_TRANSLATE_NOOP("routerChamfer2", "edge to chamfer, 1/2 thickness"), 
+		QT_TRANSLATE_NOOP("routerChamfer2", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "routerChamfer4", "png", 
+		QT_TRANSLATE_NOOP("routerChamfer4", "edge to chamfer, 1/4 thickness"), 
+		QT_TRANSLATE_NOOP("routerChamfer4", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "multiPocket", "png", 
+		QT_TRANSLATE_NOOP("multiPocket", "multi Sketch to Pocket, thickness"), 
+		QT_TRANSLATE_NOOP("multiPocket", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "makeTransparent"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		
-		sys.path.append(path)
+	[ "MagicPanels", "multiPocket2", "png", 
+		QT_TRANSLATE_NOOP("multiPocket2", "multi Sketch to Pocket, 1/2 thickness"), 
+		QT_TRANSLATE_NOOP("multiPocket2", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "multiPocket4", "png", 
+		QT_TRANSLATE_NOOP("multiPocket4", "multi Sketch to Pocket, 1/4 thickness"), 
+		QT_TRANSLATE_NOOP("multiPocket4", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "", "colorManager", "png", 
+		QT_TRANSLATE_NOOP("colorManager", "colorManager"), 
+		QT_TRANSLATE_NOOP("colorManager", "This tool allows you to browse colors for manually selected faces or objects and see the effect at 3D model in real-time. Also you can set face colors for all objects from spreadsheet. ") ],
 
-		return
+	[ "", "setTextures", "png", 
+		QT_TRANSLATE_NOOP("setTextures", "setTextures"), 
+		QT_TRANSLATE_NOOP("setTextures", "This tool allows to store textures information and load textures. Also solves problem with huge project file size because this tool allows to store only link to texture not texture.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "", "getDimensions", "png", 
+		QT_TRANSLATE_NOOP("getDimensions", "getDimensions, BOM, cutlist"), 
+		QT_TRANSLATE_NOOP("getDimensions", "Creates spreadsheet with dimensions to cut.") ],
 
-FreeCADGui.addCommand("makeTransparent", makeTransparent())
+	[ "", "sheet2export", "png", 
+		QT_TRANSLATE_NOOP("sheet2export", "sheet2export"), 
+		QT_TRANSLATE_NOOP("sheet2export", "Exports spreadsheet to chosen file format.") ],
 
-	
-# ######################################################################################################################
-class showVertex():
+	[ "", "showSpaceModel", "png", 
+		QT_TRANSLATE_NOOP("showSpaceModel", "show, model, space"), 
+		QT_TRANSLATE_NOOP("showSpaceModel", "This tool allows you to calculate the overall occupied space in 3D by the model.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "showVertex.png"),
-				"MenuText": QT_TRANSLATE_NOOP("showVertex", "showVertex"),
-				"ToolTip" : QT_TRANSLATE_NOOP("showVertex", "Click to see info."),
-				"Accel"   : "" }
+	[ "", "showSpaceSelected", "png", 
+		QT_TRANSLATE_NOOP("showSpaceSelected", "show, selected, space"), 
+		QT_TRANSLATE_NOOP("showSpaceSelected", "This tool allows you to calculate the overall occupied space in 3D by the selected parts.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "magicMeasure", "png", 
+		QT_TRANSLATE_NOOP("magicMeasure", "magicMeasure"), 
+		QT_TRANSLATE_NOOP("magicMeasure", "Quick measurement preview on hover or by selection.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "selected2Group", "png", 
+		QT_TRANSLATE_NOOP("selected2Group", "selected to Group"), 
+		QT_TRANSLATE_NOOP("selected2Group", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "showVertex"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "MagicPanels", "selected2LinkGroup", "png", 
+		QT_TRANSLATE_NOOP("selected2LinkGroup", "selected to LinkGroup"), 
+		QT_TRANSLATE_NOOP("selected2LinkGroup", "Click to see info.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "selected2Link", "png", 
+		QT_TRANSLATE_NOOP("selected2Link", "selected to Link"), 
+		QT_TRANSLATE_NOOP("selected2Link", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "selected2Outside", "png", 
+		QT_TRANSLATE_NOOP("selected2Outside", "move outside the container"), 
+		QT_TRANSLATE_NOOP("selected2Outside", "Click to see info.") ],
 
-		return
+	[ "", "scanObjects", "png", 
+		QT_TRANSLATE_NOOP("scanObjects", "scanObjects"), 
+		QT_TRANSLATE_NOOP("scanObjects", "Inspection tool for FreeCAD macro development & project debug (live API).") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+	[ "", "debugInfo", "png", 
+		QT_TRANSLATE_NOOP("debugInfo", "debugInfo"), 
+		QT_TRANSLATE_NOOP("debugInfo", "This too shows installation information and allows to update if there is new version available.") ],
 
-FreeCADGui.addCommand("showVertex", showVertex())
+	[ "MagicPanels", "magicGlue", "png", 
+		QT_TRANSLATE_NOOP("magicGlue", "magicGlue"), 
+		QT_TRANSLATE_NOOP("magicGlue", "This tool allows to add or remove expressions.") ],
 
-	
-# ######################################################################################################################
-class selectVertex():
+	[ "MagicPanels", "sketch2clone", "png", 
+		QT_TRANSLATE_NOOP("sketch2clone", "Convert sketches to clones."), 
+		QT_TRANSLATE_NOOP("sketch2clone", "Click to see info.") ],
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "selectVertex.png"),
-				"MenuText": QT_TRANSLATE_NOOP("selectVertex", "selectVertex"),
-				"ToolTip" : QT_TRANSLATE_NOOP("selectVertex", "Click to see info."),
-				"Accel"   : "" }
+	[ "MagicPanels", "showAlias", "png", 
+		QT_TRANSLATE_NOOP("showAlias", "Select objects with alias."), 
+		QT_TRANSLATE_NOOP("showAlias", "Click to see info.") ],
 
-	def Activated(self):
+	[ "MagicPanels", "panel2pad", "png", 
+		QT_TRANSLATE_NOOP("panel2pad", "cube to pad"), 
+		QT_TRANSLATE_NOOP("panel2pad", "Click to see info.") ],
 
-		import os, sys
-		import fakemodule
+	[ "MagicPanels", "fitModel", "png", 
+		QT_TRANSLATE_NOOP("fitModel", "fitModel"), 
+		QT_TRANSLATE_NOOP("fitModel", "Click to see info.") ],
 
-		modulePath = sys.path
-		
-		module = "selectVertex"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
+	[ "", "makeTransparent", "png", 
+		QT_TRANSLATE_NOOP("makeTransparent", "transparent or normal mode"), 
+		QT_TRANSLATE_NOOP("makeTransparent", "Make all parts transparent, so you can see all the joints, pilot holes, screws, countersinks. If you click next one all parts will back to normal. The transparent default is 83, so do not set any part to this number if you want e.g. to keep glass part of the furniture transparent after this preview.") ],
 
-		if module in sys.modules:
-			del sys.modules[module]
+	[ "MagicPanels", "showVertex", "png", 
+		QT_TRANSLATE_NOOP("showVertex", "showVertex"), 
+		QT_TRANSLATE_NOOP("showVertex", "Click to see info.") ],
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+	[ "MagicPanels", "selectVertex", "png", 
+		QT_TRANSLATE_NOOP("selectVertex", "selectVertex"), 
+		QT_TRANSLATE_NOOP("selectVertex", "Click to see info.") ],
 
-		return
+	[ "MagicPanels", "roundCurve", "png", 
+		QT_TRANSLATE_NOOP("roundCurve", "render curve precisely"), 
+		QT_TRANSLATE_NOOP("roundCurve", "Click to see info.") ],
 
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
+]
 
-FreeCADGui.addCommand("selectVertex", selectVertex())
 
-	
 # ######################################################################################################################
-class roundCurve():
-
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "roundCurve.png"),
-				"MenuText": QT_TRANSLATE_NOOP("roundCurve", "render curve precisely"),
-				"ToolTip" : QT_TRANSLATE_NOOP("roundCurve", "Click to see info."),
-				"Accel"   : "" }
-
-	def Activated(self):
+def registerCommands():
 
-		import os, sys
-		import fakemodule
+	for c in gCommands:
+		FreeCADGui.addCommand(c[1], ToolCommand(c[0], c[1], c[2], c[3], c[4]))
 
-		modulePath = sys.path
-		
-		module = "roundCurve"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		path = os.path.join(path, "MagicPanels")
-		sys.path.append(path)
-
-		if module in sys.modules:
-			del sys.modules[module]
-
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
-
-		return
-
-	def IsActive(self):
-		# not needed now, maybe in the future
-		return True
 
-FreeCADGui.addCommand("roundCurve", roundCurve())
+registerCommands()
 
-	
\ No newline at end of file
@@ -18,51 +18,78 @@ import os, sys
 import fakemodule
 path = os.path.dirname(fakemodule.__file__)
 iconPath = os.path.join(path, "Icons")
+toolsPath = os.path.join(path, "Tools")
+
+# tools directories are registered only once, so the tools can import MagicPanels library and other modules
+for p in [ toolsPath, os.path.join(toolsPath, "MagicPanels") ]:
+	if p not in sys.path:
+		sys.path.append(p)
+
+# tools already found and compiled, so the macro file is not searched and read again at each click
+gTools = dict()
 
-'''
 
 # ######################################################################################################################
-# Create Classes
-# ######################################################################################################################
+def isReloadMode():
+
+	# for developers, set Mod/Woodworking/ToolsReload to true at Parameter Editor 
+	# to read the tools from disk again at each click
+	param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Woodworking")
+	
+	return param.GetBool("ToolsReload", False)
 
-i = 0
-while i < len(arr):
 
-	output += '''
 # ######################################################################################################################
-class '''+arr[i+1]+'''():
+def runTool(iModule, iDir=""):
 
-	def GetResources(self):
-		return {"Pixmap"  : os.path.join(iconPath, "'''+arr[i+1]+'''.'''+arr[i+2]+'''"),
-				"MenuText": QT_TRANSLATE_NOOP("'''+arr[i+1]+'''", "'''+arr[i+3]+'''"),
-				"ToolTip" : QT_TRANSLATE_NOOP("'''+arr[i+1]+'''", "'''+arr[i+4]+'''"),
-				"Accel"   : "" }
+	import importlib.util
 
-	def Activated(self):
+	if iModule in gTools and isReloadMode():
+		del gTools[iModule]
 
-		import os, sys
-		import fakemodule
+	if iModule not in gTools:
 
-		modulePath = sys.path
-		
-		module = "'''+arr[i+1]+'''"
-		
-		path = os.path.dirname(fakemodule.__file__)
-		path = os.path.join(path, "Tools")
-		'''
+		path = toolsPath
+		if iDir != "":
+			path = os.path.join(path, iDir)
 
-	if arr[i] != "":
-		output += '''path = os.path.join(path, "'''+arr[i]+'''")'''
+		spec = importlib.util.spec_from_file_location(iModule, os.path.join(path, iModule + ".py"))
+		gTools[iModule] = { "spec": spec, "code": spec.loader.get_code(iModule) }
 
-	output += '''
-		sys.path.append(path)
+	tool = gTools[iModule]
+
+	# tools are macros doing their work at import, so the code is executed as new module 
+	# at each click, the module is not registered at sys.modules, so later import of the tool, 
+	# for example import getDimensions for headless API, does not get the GUI run
+	module = importlib.util.module_from_spec(tool["spec"])
+	exec(tool["code"], module.__dict__)
+
+'''
 
-		if module in sys.modules:
-			del sys.modules[module]
+# ######################################################################################################################
+# Create commands manifest
+# ######################################################################################################################
 
-		__import__(module, globals(), locals(), [], 0)
-		
-		sys.path = modulePath
+output += '''
+# ######################################################################################################################
+class ToolCommand():
+
+	def __init__(self, iDir, iModule, iIcon, iMenuText, iToolTip):
+		self.dir = iDir
+		self.module = iModule
+		self.icon = iIcon
+		self.menuText = iMenuText
+		self.toolTip = iToolTip
+
+	def GetResources(self):
+		return {"Pixmap"  : os.path.join(iconPath, self.module + "." + self.icon),
+				"MenuText": self.menuText,
+				"ToolTip" : self.toolTip,
+				"Accel"   : "" }
+
+	def Activated(self):
+
+		runTool(self.module, self.dir)
 
 		return
 
@@ -70,12 +97,40 @@ class '''+arr[i+1]+'''():
 		# not needed now, maybe in the future
 		return True
 
-FreeCADGui.addCommand("'''+arr[i+1]+'''", '''+arr[i+1]+'''())
 
-	'''
+# ######################################################################################################################
+# Commands manifest: sub-directory, command and macro name, icon extension, MenuText, ToolTip
+# ######################################################################################################################
+
+gCommands = [
+'''
+
+i = 0
+while i < len(arr):
+
+	output += '''
+	[ "'''+arr[i]+'''", "'''+arr[i+1]+'''", "'''+arr[i+2]+'''", 
+		QT_TRANSLATE_NOOP("'''+arr[i+1]+'''", "'''+arr[i+3]+'''"), 
+		QT_TRANSLATE_NOOP("'''+arr[i+1]+'''", "'''+arr[i+4]+'''") ],
+'''
 	
 	i += 5
 
+output += '''
+]
+
+
+# ######################################################################################################################
+def registerCommands():
+
+	for c in gCommands:
+		FreeCADGui.addCommand(c[1], ToolCommand(c[0], c[1], c[2], c[3], c[4]))
+
+
+registerCommands()
+
+'''
+
 
 # ######################################################################################################################
 # Overwrite the file loadTools.py